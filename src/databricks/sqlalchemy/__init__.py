@@ -1,10 +1,39 @@
 from databricks.sqlalchemy.base import DatabricksDialect
+from databricks.sqlalchemy._bulk import (
+    BulkWriteResult,
+    ChunkResult,
+    LocalStaging,
+    StagingBackend,
+    VolumeStaging,
+    bulk_load,
+    insert_arrow,
+    write_parallel,
+)
+from databricks.sqlalchemy._dml import CopyInto, Insert, Merge, copy_into, insert, merge
+from databricks.sqlalchemy._pandas import (
+    PandasInsertMethod,
+    pandas_dtypes,
+    pandas_insert_method,
+)
+from databricks.sqlalchemy._instrumentation import ReflectionCall, ReflectionStats
+from databricks.sqlalchemy._reflection import (
+    get_view_definitions,
+    load_deferred_reflection,
+    reflect_parallel,
+    refresh_reflected_metadata,
+)
+from databricks.sqlalchemy._snapshot import (
+    check_reflection_snapshot,
+    dump_reflection_snapshot,
+    load_reflection_snapshot,
+)
 from databricks.sqlalchemy._types import (
     TINYINT,
     TIMESTAMP,
     TIMESTAMP_NTZ,
     DatabricksArray,
     DatabricksMap,
+    DatabricksStruct,
     DatabricksVariant,
 )
 
@@ -12,7 +41,34 @@ __all__ = [
     "TINYINT",
     "TIMESTAMP",
     "TIMESTAMP_NTZ",
+    "BulkWriteResult",
+    "ChunkResult",
+    "CopyInto",
     "DatabricksArray",
     "DatabricksMap",
+    "DatabricksStruct",
     "DatabricksVariant",
+    "Insert",
+    "LocalStaging",
+    "Merge",
+    "PandasInsertMethod",
+    "ReflectionCall",
+    "ReflectionStats",
+    "StagingBackend",
+    "VolumeStaging",
+    "bulk_load",
+    "check_reflection_snapshot",
+    "copy_into",
+    "dump_reflection_snapshot",
+    "get_view_definitions",
+    "insert",
+    "insert_arrow",
+    "load_deferred_reflection",
+    "load_reflection_snapshot",
+    "merge",
+    "pandas_dtypes",
+    "pandas_insert_method",
+    "reflect_parallel",
+    "refresh_reflected_metadata",
+    "write_parallel",
 ]
@@ -0,0 +1,121 @@
+"""
+This module maps the column types of a SQLAlchemy Table to Arrow types, so data held in Arrow can be
+written to the table without converting it to Python objects first.
+"""
+
+import json
+from typing import Optional
+
+import pyarrow
+import pyarrow.compute
+import sqlalchemy
+from sqlalchemy import Table, exc
+
+from databricks.sqlalchemy._types import (
+    TIMESTAMP,
+    TINYINT,
+    DatabricksArray,
+    DatabricksMap,
+    DatabricksStruct,
+    DatabricksVariant,
+)
+
+# Checked in order, so subclasses come before the types they extend
+_ARROW_TYPES = [
+    (sqlalchemy.types.Boolean, pyarrow.bool_()),
+    (sqlalchemy.types.BigInteger, pyarrow.int64()),
+    (sqlalchemy.types.SmallInteger, pyarrow.int16()),
+    (sqlalchemy.types.Integer, pyarrow.int32()),
+    (sqlalchemy.types.Double, pyarrow.float64()),
+    (sqlalchemy.types.Float, pyarrow.float32()),
+    (sqlalchemy.types.Date, pyarrow.date32()),
+    (sqlalchemy.types.String, pyarrow.string()),
+    (sqlalchemy.types.LargeBinary, pyarrow.binary()),
+]
+
+
+def arrow_type(type_: sqlalchemy.types.TypeEngine) -> Optional[pyarrow.DataType]:
+    """Return the Arrow type that holds values of a Databricks column of this SQLAlchemy type, or
+    None if there is no exact equivalent. A VARIANT is held as its JSON text.
+    """
+
+    if isinstance(type_, DatabricksVariant):
+        return pyarrow.string()
+    if isinstance(type_, DatabricksArray):
+        item = arrow_type(type_.item_type)
+        return pyarrow.list_(item) if item is not None else None
+    if isinstance(type_, DatabricksMap):
+        key, value = arrow_type(type_.key_type), arrow_type(type_.value_type)
+        if key is None or value is None:
+            return None
+        return pyarrow.map_(key, value)
+    if isinstance(type_, DatabricksStruct):
+        fields = [(name, arrow_type(field_type)) for name, field_type in type_.fields]
+        if any(field_type is None for _, field_type in fields):
+            return None
+        return pyarrow.struct(fields)
+    if isinstance(type_, TIMESTAMP):
+        return pyarrow.timestamp("us", tz="UTC")
+    if isinstance(type_, TINYINT):
+        return pyarrow.int8()
+    if isinstance(type_, sqlalchemy.types.TypeDecorator):
+        return arrow_type(type_.impl_instance)
+    if isinstance(type_, sqlalchemy.types.DateTime):
+        # DateTime() is stored as TIMESTAMP_NTZ
+        return pyarrow.timestamp("us")
+    if isinstance(type_, sqlalchemy.types.Numeric) and not isinstance(
+        type_, sqlalchemy.types.Float
+    ):
+        if type_.precision is None:
+            return None
+        return pyarrow.decimal128(type_.precision, type_.scale or 0)
+
+    for sqla_type, pa_type in _ARROW_TYPES:
+        if isinstance(type_, sqla_type):
+            return pa_type
+    return None
+
+
+def _is_text(type_: pyarrow.DataType) -> bool:
+    return pyarrow.types.is_string(type_) or pyarrow.types.is_large_string(type_)
+
+
+def _to_json(array: pyarrow.ChunkedArray) -> pyarrow.Array:
+    return pyarrow.array(
+        [
+            None if value is None else json.dumps(value, separators=(",", ":"))
+            for value in array.to_pylist()
+        ],
+        pyarrow.string(),
+    )
+
+
+def cast_to_table(arrow_table: pyarrow.Table, table: Table) -> pyarrow.Table:
+    """Cast each column of `arrow_table` to the Arrow type of the `table` column of the same name.
+
+    Columns without an exact Arrow equivalent are left as they are. VARIANT columns that aren't
+    already JSON text are serialised to it, which is the one conversion that goes through Python
+    objects. Raises ArgumentError for a column `table` doesn't have.
+    """
+
+    columns = []
+    for name, array in zip(arrow_table.column_names, arrow_table.columns):
+        if name not in table.c:
+            raise exc.ArgumentError(f"{table.name} has no column {name!r}")
+        type_ = table.c[name].type
+        target = arrow_type(type_)
+        if target is None or array.type == target:
+            columns.append(array)
+        elif isinstance(type_, DatabricksVariant) and not _is_text(array.type):
+            columns.append(_to_json(array))
+        else:
+            # Nanosecond pandas timestamps are truncated to Databricks' microseconds
+            columns.append(
+                pyarrow.compute.cast(
+                    array,
+                    options=pyarrow.compute.CastOptions(
+                        target, allow_time_truncate=True
+                    ),
+                )
+            )
+    return pyarrow.Table.from_arrays(columns, names=arrow_table.column_names)
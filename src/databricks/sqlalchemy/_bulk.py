@@ -0,0 +1,359 @@
+"""
+This module contains bulk loading through file ingestion. Rows are written to Parquet files, the files
+are uploaded to a staging location and one COPY INTO statement loads them on the server. For large
+loads this is much faster than sending every value as a named parameter.
+
+Where files are staged is pluggable: subclass StagingBackend, or use VolumeStaging for a Unity
+Catalog volume and LocalStaging for a local directory.
+
+write_parallel() instead spreads chunks of an INSERT or MERGE over several pooled connections.
+"""
+
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+import pyarrow
+import pyarrow.parquet
+from databricks.sql.utils import ParamEscaper
+from sqlalchemy import Table, column, func
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.base import Executable
+
+from databricks.sqlalchemy._arrow import cast_to_table
+from databricks.sqlalchemy._dml import copy_into, insert
+from databricks.sqlalchemy._types import DatabricksVariant
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+BulkData = Union["pandas.DataFrame", pyarrow.Table, Iterable[Mapping[str, Any]]]
+
+
+class StagingBackend:
+    """A location that bulk_load() uploads Parquet files to and COPY INTO reads them from"""
+
+    #: The path COPY INTO reads staged files from
+    location: str
+
+    def put(self, connection: Connection, local_path: str, name: str) -> None:
+        """Upload the file at `local_path` to the staging location as `name`"""
+        raise NotImplementedError()
+
+    def remove(self, connection: Connection, name: str) -> None:
+        """Remove the staged file `name`"""
+        raise NotImplementedError()
+
+
+class VolumeStaging(StagingBackend):
+    """Stage files in a Unity Catalog volume path such as /Volumes/main/default/staging, using the
+    connector's PUT and REMOVE commands.
+
+    The connector only uploads files from the local directories it's allowed to read, so create the
+    engine with connect_args={"staging_allowed_local_path": tempfile.gettempdir()}, or the local_dir
+    you pass to bulk_load().
+    """
+
+    def __init__(self, path: str):
+        self.location = path.rstrip("/")
+
+    def put(self, connection: Connection, local_path: str, name: str) -> None:
+        connection.exec_driver_sql(
+            "PUT %s INTO %s OVERWRITE" % (_quote(local_path), self._staged(name))
+        )
+
+    def remove(self, connection: Connection, name: str) -> None:
+        connection.exec_driver_sql("REMOVE %s" % self._staged(name))
+
+    def _staged(self, name: str) -> str:
+        return _quote(f"{self.location}/{name}")
+
+
+class LocalStaging(StagingBackend):
+    """Stage files in a local directory. Useful in tests, and with warehouses that can read the
+    directory.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.location = directory
+
+    def put(self, connection: Connection, local_path: str, name: str) -> None:
+        shutil.copyfile(local_path, os.path.join(self.location, name))
+
+    def remove(self, connection: Connection, name: str) -> None:
+        os.remove(os.path.join(self.location, name))
+
+
+def _quote(value: str) -> str:
+    return ParamEscaper().escape_string(value)
+
+
+def _to_arrow(data: BulkData) -> pyarrow.Table:
+    if isinstance(data, pyarrow.Table):
+        return data
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        return pyarrow.Table.from_pandas(data, preserve_index=False)
+    return pyarrow.Table.from_pylist(list(data))
+
+
+def _is_variant(table: Table, key: str) -> bool:
+    return isinstance(table.c[key].type, DatabricksVariant)
+
+
+def _copy_select(arrow_table: pyarrow.Table, table: Table):
+    # Parquet has no VARIANT, so VARIANT columns are staged as JSON text and parsed while loading
+    if not any(_is_variant(table, key) for key in arrow_table.column_names):
+        return None
+    return [
+        func.parse_json(column(table.c[key].name)).label(table.c[key].name)
+        if _is_variant(table, key)
+        else column(table.c[key].name)
+        for key in arrow_table.column_names
+    ]
+
+
+def bulk_load(
+    connection: Connection,
+    table: Table,
+    data: BulkData,
+    staging: StagingBackend,
+    rows_per_file: int = 1_000_000,
+    format_options: Optional[Mapping[str, Any]] = None,
+    copy_options: Optional[Mapping[str, Any]] = None,
+    local_dir: Optional[str] = None,
+    cleanup: bool = True,
+) -> int:
+    """Load `data` into `table` with COPY INTO and return the number of rows loaded.
+
+    `data` is a pandas DataFrame, a pyarrow Table or an iterable of dictionaries keyed by column
+    key. It's cast to the table's column types as insert_arrow() describes, written to Parquet
+    files of up to rows_per_file rows in a temporary directory under local_dir, uploaded to
+    `staging` and loaded with one COPY INTO statement. The staged files are removed afterwards
+    unless `cleanup` is False.
+    """
+
+    arrow_table = cast_to_table(_to_arrow(data), table)
+    if arrow_table.num_rows == 0:
+        return 0
+    select = _copy_select(arrow_table, table)
+    # COPY INTO matches the files' columns to the table's by name
+    named = arrow_table.rename_columns(
+        [table.c[key].name for key in arrow_table.column_names]
+    )
+
+    # A unique prefix keeps concurrent loads apart, and stops COPY INTO skipping the files as
+    # already loaded
+    prefix = uuid.uuid4().hex
+    staged: List[str] = []
+    try:
+        with tempfile.TemporaryDirectory(dir=local_dir) as tmp:
+            for number, offset in enumerate(
+                range(0, arrow_table.num_rows, rows_per_file)
+            ):
+                name = f"{prefix}-{number:05d}.parquet"
+                local_path = os.path.join(tmp, name)
+                pyarrow.parquet.write_table(
+                    named.slice(offset, rows_per_file), local_path
+                )
+                staging.put(connection, local_path, name)
+                staged.append(name)
+
+        connection.execute(
+            copy_into(
+                table,
+                staging.location,
+                "PARQUET",
+                format_options=format_options,
+                copy_options=copy_options,
+                files=staged,
+                select=select,
+            )
+        )
+    finally:
+        if cleanup:
+            for name in staged:
+                staging.remove(connection, name)
+
+    return arrow_table.num_rows
+
+
+def insert_arrow(
+    connection: Connection,
+    table: Table,
+    arrow_table: pyarrow.Table,
+    chunk_rows: int = 100_000,
+    staging: Optional[StagingBackend] = None,
+) -> int:
+    """Insert the rows of a pyarrow Table into `table` and return the number of rows inserted.
+
+    Each Arrow column is cast to the type of the `table` column with the same key: integers,
+    decimals and timestamps to the width, precision and time zone of the column, lists, maps and
+    structs to DatabricksArray, DatabricksMap and DatabricksStruct, and DatabricksVariant values to
+    their JSON text. A column that's already JSON text is used as it is.
+
+    With a `staging` backend the rows are written to Parquet files of up to chunk_rows rows and
+    loaded with COPY INTO, like bulk_load(). Without one they're converted to Python chunk_rows at a
+    time and executed as an executemany(), which the dialect batches into multi-row
+    INSERT ... VALUES statements that fit its parameter and statement size limits.
+    """
+
+    arrow_table = cast_to_table(arrow_table, table)
+    if staging is not None:
+        return bulk_load(
+            connection, table, arrow_table, staging, rows_per_file=chunk_rows
+        )
+    if arrow_table.num_rows == 0:
+        return 0
+
+    # DatabricksVariant serialises the values it binds and DatabricksMap binds dictionaries, so
+    # turn JSON text and Arrow's lists of key-value pairs back into Python objects
+    converters: Dict[str, Callable[[Any], Any]] = {
+        key: json.loads for key in arrow_table.column_names if _is_variant(table, key)
+    }
+    converters.update(
+        (field.name, dict)
+        for field in arrow_table.schema
+        if pyarrow.types.is_map(field.type)
+    )
+    for offset in range(0, arrow_table.num_rows, chunk_rows):
+        rows = arrow_table.slice(offset, chunk_rows).to_pylist()
+        for row in rows:
+            for key, convert in converters.items():
+                if row[key] is not None:
+                    row[key] = convert(row[key])
+        connection.execute(insert(table), rows)
+    return arrow_table.num_rows
+
+
+class ChunkResult:
+    """The outcome of writing one chunk with write_parallel(). If error is set, any of the chunk's
+    rows may or may not have been written.
+    """
+
+    def __init__(
+        self, index: int, rows: int, rowcount: int, error: Optional[BaseException]
+    ):
+        self.index = index
+        self.rows = rows
+        self.rowcount = rowcount
+        self.error = error
+
+    def __repr__(self):
+        return (
+            f"ChunkResult({self.index}, rows={self.rows}, rowcount={self.rowcount}, "
+            f"error={self.error!r})"
+        )
+
+
+class BulkWriteResult:
+    """The outcome of write_parallel(): one ChunkResult per chunk, in the order of the chunks"""
+
+    def __init__(self, chunks: List[ChunkResult]):
+        self.chunks = chunks
+
+    @property
+    def errors(self) -> List[ChunkResult]:
+        """The chunks that failed. Databricks SQL has no transactions to roll them back, so a failed
+        chunk may be partly written: the statements it ran before the error keep their rows.
+        """
+        return [chunk for chunk in self.chunks if chunk.error is not None]
+
+    @property
+    def rows(self) -> int:
+        """The number of rows in the chunks that were written in full"""
+        return sum(chunk.rows for chunk in self.chunks if chunk.error is None)
+
+    @property
+    def failed_rows(self) -> int:
+        """The number of rows in the failed chunks, any of which may or may not have been written"""
+        return sum(chunk.rows for chunk in self.chunks if chunk.error is not None)
+
+    @property
+    def rowcount(self) -> int:
+        """The total of the row counts the warehouse reported for the chunks that succeeded"""
+        return sum(
+            chunk.rowcount
+            for chunk in self.chunks
+            if chunk.error is None and chunk.rowcount > 0
+        )
+
+    def __repr__(self):
+        return (
+            f"BulkWriteResult(chunks={len(self.chunks)}, errors={len(self.errors)}, "
+            f"rows={self.rows}, failed_rows={self.failed_rows}, rowcount={self.rowcount})"
+        )
+
+
+def _chunks(rows: Iterable[Any], chunk_rows: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_parallel(
+    engine: Engine,
+    statement: Union[Executable, Callable[[List[Any]], Executable]],
+    rows: Iterable[Any],
+    chunk_rows: int = 10_000,
+    max_workers: int = 4,
+) -> BulkWriteResult:
+    """Split `rows` into chunks of chunk_rows and write them concurrently on up to max_workers
+    connections checked out of the engine's pool.
+
+    `statement` is either a statement executed with each chunk as its parameters, such as
+    insert(table) with a chunk of dictionaries, which the dialect sends as batched multi-row
+    INSERT ... VALUES statements, or a function that builds the statement for a chunk, such as a
+    MERGE INTO using values(...).data(chunk).
+
+    Chunks are written independently and in no particular order. A chunk that fails has its error
+    recorded in the result rather than raised, and the other chunks are still written. Databricks
+    SQL has no transactions, so nothing is rolled back: a failed chunk may be partly written, for
+    example when some of its batched INSERT statements ran before the error. `rows` is read lazily
+    and at most two chunks per worker are held in memory at once.
+    """
+
+    def run(index: int, chunk: List[Any]) -> ChunkResult:
+        try:
+            with engine.connect() as connection:
+                if isinstance(statement, Executable):
+                    result = connection.execute(statement, chunk)
+                else:
+                    result = connection.execute(statement(chunk))
+                rowcount = result.rowcount
+        except Exception as e:
+            return ChunkResult(index, len(chunk), 0, e)
+        return ChunkResult(index, len(chunk), rowcount, None)
+
+    results: List[ChunkResult] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        in_flight: Set[Future] = set()
+        for index, chunk in enumerate(_chunks(rows, chunk_rows)):
+            if len(in_flight) >= 2 * max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                results.extend(future.result() for future in done)
+            in_flight.add(pool.submit(run, index, chunk))
+        results.extend(future.result() for future in wait(in_flight).done)
+
+    return BulkWriteResult(sorted(results, key=lambda chunk: chunk.index))
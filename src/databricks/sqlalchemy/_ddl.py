@@ -1,7 +1,11 @@
+import inspect
 import re
+from typing import Mapping
 from sqlalchemy.sql import compiler, sqltypes
 import logging
 
+from databricks.sqlalchemy._parse import split_catalog_schema
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +22,15 @@ class DatabricksIdentifierPreparer(compiler.IdentifierPreparer):
         # wrong character, producing invalid DDL like ``a`b``.
         super().__init__(dialect, initial_quote="`", escape_quote="`")
 
+    def quote_schema(self, schema, force=None):
+        """A schema may be qualified with its catalog, as in Table(..., schema="main.default") or
+        schema_translate_map={None: "main.default"}. Each part is quoted separately.
+        """
+        catalog, schema = split_catalog_schema(schema)
+        if catalog is None:
+            return self.quote(schema)
+        return f"{self.quote(catalog)}.{self.quote(schema)}"
+
 
 class DatabricksDDLCompiler(compiler.DDLCompiler):
     def post_create_table(self, table):
@@ -52,6 +65,16 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
         )
         return text
 
+    def visit_computed_column(self, generated, **kw):
+        """Delta always stores generated columns, so unlike the default compiler this doesn't
+        render STORED or VIRTUAL. Computed(persisted=False) is ignored with a warning.
+        """
+        if generated.persisted is False:
+            logger.warning("Databricks does not support virtual generated columns")
+        return "GENERATED ALWAYS AS (%s)" % self.sql_compiler.process(
+            generated.sqltext, include_table=False, literal_binds=True
+        )
+
     def visit_set_column_comment(self, create, **kw):
         return "ALTER TABLE %s ALTER COLUMN %s COMMENT %s" % (
             self.preparer.format_table(create.element.table),
@@ -88,6 +111,26 @@ class DatabricksDDLCompiler(compiler.DDLCompiler):
         return colspec
 
 
+def _value_bytes(value) -> int:
+    """Roughly how many bytes a bound parameter value takes on the wire"""
+    if value is None:
+        return 4
+    if isinstance(value, bytes):
+        return len(value)
+    return len(str(value).encode())
+
+
+class _BindTemplate(str):
+    """A bind template that doubles any backtick in the parameter name it's formatted with, per the
+    ``BACKQUOTED_IDENTIFIER`` lexer rule. SQLAlchemy formats ``bindtemplate`` itself when it
+    rewrites markers for insertmanyvalues batches, so the doubling has to live in the template for
+    those rewritten markers to match the rendered ones.
+    """
+
+    def __mod__(self, values):
+        return str.__mod__(self, {**values, "name": values["name"].replace("`", "``")})
+
+
 class DatabricksStatementCompiler(compiler.SQLCompiler):
     """Compiler that wraps every bind parameter marker in backticks.
 
@@ -108,8 +151,9 @@ class DatabricksStatementCompiler(compiler.SQLCompiler):
     on the class. Every bind-render path in SQLAlchemy reads one of
     these two attributes (``bindparam_string``,
     ``_literal_execute_expanding_parameter``, and the insertmanyvalues
-    path which this dialect doesn't enable), so fixing them at the
-    attribute level covers all paths with no method overrides. We use
+    path, which rewrites each marker into ``:`name__0```, ``:`name__1``` and
+    so on for every row of a batch), so fixing them at the
+    attribute level covers all paths. We use
     property descriptors with no-op setters because ``SQLCompiler.__init__``
     assigns the default templates from ``BIND_TEMPLATES[paramstyle]``
     during its own init — a plain class attribute would be shadowed by
@@ -117,7 +161,7 @@ class DatabricksStatementCompiler(compiler.SQLCompiler):
     assignment so our class-level value is always what gets read.
     """
 
-    _BIND_TEMPLATE = ":`%(name)s`"
+    _BIND_TEMPLATE = _BindTemplate(":`%(name)s`")
 
     # The no-op setter makes ``SQLCompiler.__init__``'s assignment of the
     # default template a silent no-op so our class-level value is what
@@ -162,9 +206,69 @@ class DatabricksStatementCompiler(compiler.SQLCompiler):
             visited = kw.get("visited_bindparam")
             if visited is not None:
                 visited.append(name)
-            return self._BIND_TEMPLATE % {"name": name.replace("`", "``")}
+            return self._BIND_TEMPLATE % {"name": name}
         return super().bindparam_string(name, **kw)
 
+    # SQLAlchemy 2.0.37 added parameters ahead of batch_size, so find it by name
+    _DELIVER_BATCHES_SIGNATURE = inspect.signature(
+        compiler.SQLCompiler._deliver_insertmanyvalues_batches
+    )
+
+    def _deliver_insertmanyvalues_batches(self, *args, **kw):
+        """SQLAlchemy limits a batch to insertmanyvalues_page_size rows. Also limit it to the
+        dialect's insertmanyvalues_max_batch_parameters, and to insertmanyvalues_max_statement_bytes
+        of statement text and parameter values: each row adds its VALUES tuple, with a
+        ``__<row number>`` suffix on every marker, and its values. Rows differ in size, so the
+        largest row sets the batch size. A batch always holds at least one row.
+        """
+        arguments = self._DELIVER_BATCHES_SIGNATURE.bind(self, *args, **kw).arguments
+        del arguments["self"]
+        statement, parameters = arguments["statement"], arguments["parameters"]
+        imv = self._insertmanyvalues
+        assert imv is not None
+
+        row_keys = {
+            key for _, _, _, bind_keys in imv.insert_crud_params for key in bind_keys
+        }
+        row_values_bytes = max(
+            (
+                sum(
+                    _value_bytes(value) for key, value in row.items() if key in row_keys
+                )
+                for row in parameters
+                if isinstance(row, Mapping)
+            ),
+            default=0,
+        )
+        row_bytes = (
+            len(imv.single_values_expr.encode())
+            + 4
+            + len(row_keys) * (2 + len(str(len(parameters))))
+            + row_values_bytes
+        )
+        outside_bytes = len(statement.encode()) - len(imv.single_values_expr.encode())
+        if parameters and isinstance(parameters[0], Mapping):
+            outside_bytes += sum(
+                _value_bytes(value)
+                for key, value in parameters[0].items()
+                if key not in row_keys
+            )
+        batch_size = min(
+            arguments["batch_size"],
+            (self.dialect.insertmanyvalues_max_statement_bytes - outside_bytes)  # type: ignore
+            // row_bytes,
+        )
+
+        max_parameters = self.dialect.insertmanyvalues_max_batch_parameters  # type: ignore
+        if max_parameters and row_keys:
+            outside_parameters = len(self.bind_names) - len(row_keys)
+            batch_size = min(
+                batch_size, (max_parameters - outside_parameters) // len(row_keys)
+            )
+
+        arguments["batch_size"] = max(1, batch_size)
+        return super()._deliver_insertmanyvalues_batches(**arguments)
+
     def limit_clause(self, select, **kw):
         """Identical to the default implementation of SQLCompiler.limit_clause except it writes LIMIT ALL instead of LIMIT -1,
         since Databricks SQL doesn't support the latter.
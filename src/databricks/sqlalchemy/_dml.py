@@ -0,0 +1,392 @@
+"""
+This module contains DML constructs for statements Databricks supports beyond SQLAlchemy's insert(),
+update() and delete(). They compile only with the Databricks dialect.
+
+https://docs.databricks.com/en/sql/language-manual/delta-merge-into.html
+https://docs.databricks.com/en/sql/language-manual/sql-ref-syntax-dml-insert-into.html
+https://docs.databricks.com/en/sql/language-manual/delta-copy-into.html
+"""
+
+from typing import Any, Mapping, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import exc
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import coercions, roles, sqltypes
+from sqlalchemy.sql.base import Executable, Generative, _generative
+from sqlalchemy.sql.dml import Insert as StandardInsert
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+_Values = Optional[Mapping[Union[str, ColumnElement], Any]]
+
+
+class MergeWhen(ClauseElement):
+    """One WHEN clause of a MERGE INTO statement. Build these with the when_* methods of Merge."""
+
+    __visit_name__ = "merge_when"
+
+    _traverse_internals = [
+        ("kind", InternalTraversal.dp_string),
+        ("action", InternalTraversal.dp_string),
+        ("condition", InternalTraversal.dp_clauseelement),
+        ("star", InternalTraversal.dp_boolean),
+        ("values", InternalTraversal.dp_clauseelement_tuples),
+    ]
+
+    def __init__(self, kind: str, action: str, target, condition, values: _Values):
+        self.kind = kind
+        self.action = action
+        self.condition = (
+            coercions.expect(roles.WhereHavingRole, condition)
+            if condition is not None
+            else None
+        )
+        # UPDATE SET * and INSERT * copy every column of the source by name
+        self.star = values is None
+        self.values: Tuple[Tuple[ColumnElement, ColumnElement], ...] = tuple(
+            _coerce_value(target, key, value) for key, value in (values or {}).items()
+        )
+
+
+def _coerce_value(target, key, value) -> Tuple[ColumnElement, ColumnElement]:
+    name = key if isinstance(key, str) else key.key
+    try:
+        column = target.c[name]
+    except KeyError as e:
+        raise exc.ArgumentError(
+            f"Unconsumed column name {name!r}: {target.name} has no such column"
+        ) from e
+    return column, coercions.expect(
+        roles.ExpressionElementRole, value, type_=column.type
+    )
+
+
+class Merge(Generative, Executable, ClauseElement):
+    """A MERGE INTO statement. Build one with merge()."""
+
+    __visit_name__ = "merge"
+
+    _traverse_internals = [
+        ("target", InternalTraversal.dp_clauseelement),
+        ("source", InternalTraversal.dp_clauseelement),
+        ("on_clause", InternalTraversal.dp_clauseelement),
+        ("whens", InternalTraversal.dp_clauseelement_tuple),
+    ]
+
+    def __init__(self, target):
+        self.target = coercions.expect(roles.DMLTableRole, target)
+        self.source = None
+        self.on_clause = None
+        self.whens: Tuple[MergeWhen, ...] = ()
+
+    @_generative
+    def using(self, source) -> "Merge":
+        """Set the source rows: a table, a named subquery or a named values() construct"""
+        self.source = coercions.expect(roles.FromClauseRole, source)
+        return self
+
+    @_generative
+    def on(self, condition) -> "Merge":
+        """Set the condition that matches a source row to a target row"""
+        self.on_clause = coercions.expect(roles.OnClauseRole, condition)
+        return self
+
+    @_generative
+    def when_matched_update(self, set_: _Values = None, condition=None) -> "Merge":
+        """Update matched target rows. `set_` maps target columns to new values; if it is omitted,
+        every column is copied from the source row (UPDATE SET *).
+        """
+        self.whens += (MergeWhen("MATCHED", "UPDATE", self.target, condition, set_),)
+        return self
+
+    @_generative
+    def when_matched_delete(self, condition=None) -> "Merge":
+        """Delete matched target rows"""
+        self.whens += (MergeWhen("MATCHED", "DELETE", self.target, condition, {}),)
+        return self
+
+    @_generative
+    def when_not_matched_insert(
+        self, values: _Values = None, condition=None
+    ) -> "Merge":
+        """Insert source rows that match no target row. `values` maps target columns to values; if
+        it is omitted, every column is copied from the source row (INSERT *).
+        """
+        self.whens += (
+            MergeWhen("NOT MATCHED", "INSERT", self.target, condition, values),
+        )
+        return self
+
+    @_generative
+    def when_not_matched_by_source_delete(self, condition=None) -> "Merge":
+        """Delete target rows that match no source row"""
+        self.whens += (
+            MergeWhen("NOT MATCHED BY SOURCE", "DELETE", self.target, condition, {}),
+        )
+        return self
+
+
+def merge(target) -> Merge:
+    """Construct a MERGE INTO statement that upserts into `target` in a single round trip:
+
+        stmt = (
+            merge(users)
+            .using(updates)
+            .on(users.c.id == updates.c.id)
+            .when_matched_update(set_={"name": updates.c.name})
+            .when_not_matched_insert()
+        )
+
+    The source can be another table, a subquery or a values() construct, and must be named.
+    """
+    return Merge(target)
+
+
+@compiles(Merge, "databricks")
+def compile_merge(merge, compiler, **kw):
+    if merge.source is None or merge.on_clause is None:
+        raise exc.CompileError("MERGE INTO requires using() and on()")
+    if not merge.whens:
+        raise exc.CompileError("MERGE INTO requires at least one when_*() clause")
+
+    froms = {merge.target, merge.source}
+    compiler.stack.append(
+        {"correlate_froms": froms, "asfrom_froms": froms, "selectable": merge}
+    )
+    text = "MERGE INTO %s\nUSING %s\nON %s" % (
+        compiler.process(merge.target, asfrom=True, **kw),
+        compiler.process(merge.source, asfrom=True, **kw),
+        compiler.process(merge.on_clause, **kw),
+    )
+    for when in merge.whens:
+        text += "\n" + compiler.process(when, **kw)
+    compiler.stack.pop(-1)
+    return text
+
+
+@compiles(MergeWhen, "databricks")
+def compile_merge_when(when, compiler, **kw):
+    text = "WHEN " + when.kind
+    if when.condition is not None:
+        text += " AND " + compiler.process(when.condition, **kw)
+    text += " THEN " + when.action
+
+    columns = [compiler.preparer.format_column(column) for column, _ in when.values]
+    values = [compiler.process(value, **kw) for _, value in when.values]
+    if when.action == "UPDATE":
+        if when.star:
+            return text + " SET *"
+        return text + " SET " + ", ".join(f"{c} = {v}" for c, v in zip(columns, values))
+    if when.action == "INSERT":
+        if when.star:
+            return text + " *"
+        return text + " (%s) VALUES (%s)" % (", ".join(columns), ", ".join(values))
+    return text
+
+
+class Insert(StandardInsert):
+    """An INSERT statement that can also overwrite rows of the table. Build one with insert()."""
+
+    stringify_dialect = "databricks"
+
+    _traverse_internals = StandardInsert._traverse_internals + [
+        ("_overwrite", InternalTraversal.dp_boolean),
+        ("_replace_where", InternalTraversal.dp_clauseelement),
+    ]
+
+    _overwrite = False
+    _replace_where = None
+
+    @_generative
+    def overwrite(self) -> "Insert":
+        """Replace every row of the table with the inserted rows (INSERT OVERWRITE). Pass several
+        rows with values() or from_select(): executing it with a list of parameter sets would run
+        one statement per batch, each wiping out the one before, so that raises an error.
+        """
+        if self._replace_where is not None:
+            raise exc.InvalidRequestError(
+                "This Insert construct already has a REPLACE WHERE clause"
+            )
+        self._overwrite = True
+        return self
+
+    @_generative
+    def replace_where(self, predicate) -> "Insert":
+        """Atomically delete the rows that match `predicate` and insert the rows of the query given
+        to from_select(), which must all match it too (INSERT INTO ... REPLACE WHERE)
+        """
+        if self._overwrite:
+            raise exc.InvalidRequestError(
+                "This Insert construct is already an INSERT OVERWRITE"
+            )
+        self._replace_where = coercions.expect(roles.WhereHavingRole, predicate)
+        return self
+
+
+def insert(table) -> Insert:
+    """Construct an INSERT statement that supports Databricks' overwriting forms:
+
+        insert(events).overwrite().from_select(["id", "day"], staged)
+        insert(events).replace_where(events.c.day == day).from_select(["id", "day"], staged)
+
+    Otherwise it is the same as sqlalchemy.insert().
+    """
+    return Insert(table)
+
+
+@compiles(Insert, "databricks")
+def compile_insert(insert, compiler, **kw):
+    if insert._replace_where is not None:
+        return _compile_insert_replace_where(insert, compiler, **kw)
+
+    if insert._overwrite and compiler.for_executemany:
+        raise exc.InvalidRequestError(
+            "INSERT OVERWRITE can't be executed with several parameter sets, since each batch "
+            "would replace the rows of the one before. Pass the rows to values() instead."
+        )
+
+    text = compiler.visit_insert(insert, **kw)
+    if not insert._overwrite:
+        return text
+    # Only the keyword before the table name differs, so let the standard compiler render the rest
+    into = "INTO " + compiler.preparer.format_table(insert.table)
+    before, _, after = text.partition(into)
+    return before + "OVERWRITE " + compiler.preparer.format_table(insert.table) + after
+
+
+def _compile_insert_replace_where(insert, compiler, **kw):
+    # REPLACE WHERE takes no column list: the query's columns are matched to the table's by position
+    if insert.select is None:
+        raise exc.CompileError("INSERT INTO ... REPLACE WHERE requires from_select()")
+    if list(insert._select_names) != [column.key for column in insert.table.c]:
+        raise exc.CompileError(
+            "INSERT INTO ... REPLACE WHERE requires the query to select every column of "
+            f"{insert.table.name} in order"
+        )
+
+    froms = {insert.table}
+    compiler.stack.append(
+        {"correlate_froms": froms, "asfrom_froms": froms, "selectable": insert}
+    )
+    text = "INSERT INTO %s REPLACE WHERE %s %s" % (
+        compiler.preparer.format_table(insert.table),
+        compiler.process(insert._replace_where, include_table=False, **kw),
+        compiler.process(insert.select, **kw),
+    )
+    compiler.stack.pop(-1)
+    return text
+
+
+FILE_FORMATS = ("AVRO", "BINARYFILE", "CSV", "JSON", "ORC", "PARQUET", "TEXT", "XML")
+
+
+class CopyInto(Executable, ClauseElement):
+    """A COPY INTO statement. Build one with copy_into()."""
+
+    __visit_name__ = "copy_into"
+
+    _traverse_internals = [
+        ("table", InternalTraversal.dp_clauseelement),
+        ("source_path", InternalTraversal.dp_string),
+        ("file_format", InternalTraversal.dp_string),
+        ("files", InternalTraversal.dp_string_list),
+        ("select", InternalTraversal.dp_clauseelement_tuple),
+        ("format_options", InternalTraversal.dp_plain_dict),
+        ("copy_options", InternalTraversal.dp_plain_dict),
+    ]
+
+    def __init__(
+        self,
+        table,
+        source_path: str,
+        file_format: str,
+        format_options: Optional[Mapping[str, Any]],
+        copy_options: Optional[Mapping[str, Any]],
+        files: Optional[Sequence[str]],
+        select: Optional[Sequence[Any]],
+    ):
+        self.table = coercions.expect(roles.DMLTableRole, table)
+        self.source_path = source_path
+        if file_format.upper() not in FILE_FORMATS:
+            raise exc.ArgumentError(
+                f"Unsupported COPY INTO file format {file_format!r}"
+            )
+        self.file_format = file_format.upper()
+        self.files = list(files) if files is not None else None
+        self.select = (
+            tuple(
+                coercions.expect(roles.ColumnsClauseRole, expression)
+                for expression in select
+            )
+            if select is not None
+            else None
+        )
+        self.format_options = _string_options(format_options)
+        self.copy_options = _string_options(copy_options)
+
+
+def _string_options(options: Optional[Mapping[str, Any]]) -> dict:
+    # COPY INTO only accepts string option values, and Spark spells booleans in lower case
+    return {
+        key: str(value).lower() if isinstance(value, bool) else str(value)
+        for key, value in (options or {}).items()
+    }
+
+
+def copy_into(
+    table,
+    source_path: str,
+    file_format: str = "PARQUET",
+    format_options: Optional[Mapping[str, Any]] = None,
+    copy_options: Optional[Mapping[str, Any]] = None,
+    files: Optional[Sequence[str]] = None,
+    select: Optional[Sequence[Any]] = None,
+) -> CopyInto:
+    """Construct a COPY INTO statement that loads the files at `source_path` into `table`:
+
+        copy_into(events, "/Volumes/main/default/landing/events", "CSV",
+                  format_options={"header": True}, copy_options={"mergeSchema": True})
+
+    `files` limits the load to the named files in `source_path`. COPY INTO skips files it has
+    already loaded, so running the statement again is safe. `select` transforms the files' columns
+    while loading, for example [column("id"), func.parse_json(column("data")).label("data")].
+    """
+    return CopyInto(
+        table, source_path, file_format, format_options, copy_options, files, select
+    )
+
+
+@compiles(CopyInto, "databricks")
+def compile_copy_into(copy, compiler, **kw):
+    def literal(value):
+        return compiler.render_literal_value(value, sqltypes.String())
+
+    def options(values):
+        return ", ".join(f"{literal(k)} = {literal(v)}" for k, v in values.items())
+
+    source = literal(copy.source_path)
+    if copy.select is not None:
+        columns = ", ".join(
+            compiler.process(
+                expression,
+                include_table=False,
+                literal_binds=True,
+                within_columns_clause=True,
+                **kw,
+            )
+            for expression in copy.select
+        )
+        source = f"(SELECT {columns} FROM {source})"
+
+    text = "COPY INTO %s\nFROM %s\nFILEFORMAT = %s" % (
+        compiler.preparer.format_table(copy.table),
+        source,
+        copy.file_format,
+    )
+    if copy.files is not None:
+        text += "\nFILES = (%s)" % ", ".join(literal(name) for name in copy.files)
+    if copy.format_options:
+        text += "\nFORMAT_OPTIONS (%s)" % options(copy.format_options)
+    if copy.copy_options:
+        text += "\nCOPY_OPTIONS (%s)" % options(copy.copy_options)
+    return text
@@ -0,0 +1,185 @@
+"""
+This module contains instrumentation for DatabricksDialect's reflection methods: how often each one
+is called, how often a cache answers it without a query, how many round trips to the warehouse it
+costs, how many rows those return and how long it takes.
+
+Every dialect keeps the totals in its reflection_stats attribute. Each call is also reported to
+listeners of the after_reflection_call event:
+
+    @event.listens_for(engine, "after_reflection_call")
+    def receive_after_reflection_call(call):
+        ...
+"""
+
+import contextlib
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.event import dispatcher
+from sqlalchemy.event.registry import EventTarget
+
+
+class ReflectionCall:
+    """One call of an instrumented reflection method"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.round_trips = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    @property
+    def cache_hit(self) -> bool:
+        """True if the call was answered without querying the warehouse"""
+        return self.round_trips == 0
+
+    def __repr__(self):
+        return (
+            f"ReflectionCall({self.operation!r}, round_trips={self.round_trips}, "
+            f"rows={self.rows}, seconds={self.seconds:.3f})"
+        )
+
+
+class ReflectionOperationStats:
+    """The totals of every call of one instrumented reflection method"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.round_trips = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def _add(self, call: ReflectionCall) -> None:
+        self.calls += 1
+        if call.cache_hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        self.round_trips += call.round_trips
+        self.rows += call.rows
+        self.seconds += call.seconds
+
+    def __repr__(self):
+        return (
+            f"ReflectionOperationStats(calls={self.calls}, cache_hits={self.cache_hits}, "
+            f"cache_misses={self.cache_misses}, round_trips={self.round_trips}, "
+            f"rows={self.rows}, seconds={self.seconds:.3f})"
+        )
+
+
+class ReflectionStats(EventTarget):
+    """Reflection totals for one dialect, keyed by operation name. Safe to share between threads.
+
+    A round trip made while several instrumented calls are in progress on the same thread, for
+    example a DESCRIBE TABLE EXTENDED run by get_columns, counts towards each of them.
+    """
+
+    dispatch: dispatcher["ReflectionStats"]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: Dict[str, ReflectionOperationStats] = {}
+        self._local = threading.local()
+
+    def __getitem__(self, operation: str) -> ReflectionOperationStats:
+        with self._lock:
+            return self._operations.setdefault(operation, ReflectionOperationStats())
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the totals as a dictionary of operation -> dictionary of counters"""
+        with self._lock:
+            return {
+                operation: dict(vars(stats))
+                for operation, stats in self._operations.items()
+            }
+
+    def reset(self) -> None:
+        """Set every total back to zero"""
+        with self._lock:
+            self._operations.clear()
+
+    def _in_progress(self) -> List[ReflectionCall]:
+        calls = getattr(self._local, "calls", None)
+        if calls is None:
+            calls = self._local.calls = []
+        return calls
+
+    @contextlib.contextmanager
+    def _measure(self, operation: str):
+        call = ReflectionCall(operation)
+        in_progress = self._in_progress()
+        in_progress.append(call)
+        start = time.perf_counter()
+        try:
+            yield call
+        finally:
+            call.seconds = time.perf_counter() - start
+            in_progress.remove(call)
+            with self._lock:
+                self._operations.setdefault(operation, ReflectionOperationStats())._add(
+                    call
+                )
+            self.dispatch.after_reflection_call(call)
+
+    def record_round_trip(self, rows: int = 0) -> None:
+        """Count one query to the warehouse that returned `rows` rows against the instrumented calls
+        in progress on this thread
+        """
+        for call in self._in_progress():
+            call.round_trips += 1
+            call.rows += rows
+
+
+def instrumented(operation: str):
+    """Decorate a reflection method of DatabricksDialect so its calls are recorded in the dialect's
+    ReflectionStats under `operation`. Put it above @reflection.cache, so calls answered by a cache
+    are counted too. Generator methods are measured until they are exhausted.
+    """
+
+    def decorate(fn):
+        if inspect.isgeneratorfunction(fn):
+
+            @functools.wraps(fn)
+            def wrapped_generator(self, *args, **kw):
+                with self.reflection_stats._measure(operation):
+                    yield from fn(self, *args, **kw)
+
+            return wrapped_generator
+
+        @functools.wraps(fn)
+        def wrapped(self, *args, **kw):
+            with self.reflection_stats._measure(operation):
+                return fn(self, *args, **kw)
+
+        return wrapped
+
+    return decorate
+
+
+class ReflectionEvents(event.Events[ReflectionStats]):
+    """Events for DatabricksDialect's reflection instrumentation.
+
+    Listen on an Engine, a DatabricksDialect or a ReflectionStats.
+    """
+
+    _target_class_doc = "SomeEngine"
+    _dispatch_target = ReflectionStats
+
+    @classmethod
+    def _accept_with(cls, target: Any, identifier: str) -> Optional[ReflectionStats]:
+        if isinstance(target, Engine):
+            target = target.dialect
+        stats = getattr(target, "reflection_stats", target)
+        if isinstance(stats, ReflectionStats):
+            return stats
+        return None
+
+    def after_reflection_call(self, call: ReflectionCall) -> None:
+        """Called after each call of an instrumented reflection method, with its ReflectionCall"""
@@ -0,0 +1,112 @@
+"""
+This module contains helpers for writing pandas DataFrames with DataFrame.to_sql():
+
+    df.to_sql("events", conn, dtype=pandas_dtypes(df), method=pandas_insert_method)
+
+pandas is not a dependency of this package, so nothing here imports it.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+import pyarrow
+
+from databricks.sqlalchemy._bulk import StagingBackend, insert_arrow
+from databricks.sqlalchemy._dml import insert
+from databricks.sqlalchemy._types import (
+    TIMESTAMP,
+    TIMESTAMP_NTZ,
+    TINYINT,
+    DatabricksVariant,
+)
+
+
+def pandas_dtypes(df) -> Dict[str, Any]:
+    """Return the column types for DataFrame.to_sql(dtype=...) that pandas wouldn't choose itself:
+    TINYINT for int8 columns, TIMESTAMP_NTZ and TIMESTAMP for datetime columns without and with a
+    time zone, and DatabricksVariant for object columns whose first value is a dict or a list.
+    """
+
+    dtypes: Dict[str, Any] = {}
+    for name, series in df.items():
+        kind = series.dtype.kind
+        if str(series.dtype) in ("int8", "Int8"):
+            dtypes[name] = TINYINT()
+        elif kind == "M":
+            has_tz = getattr(series.dtype, "tz", None) is not None
+            dtypes[name] = TIMESTAMP() if has_tz else TIMESTAMP_NTZ()
+        elif kind == "O":
+            first = series.first_valid_index()
+            if first is not None and isinstance(series[first], (dict, list)):
+                dtypes[name] = DatabricksVariant()
+    return dtypes
+
+
+def _variant_json(value):
+    # None, NaN and NaT are NULL. Everything else, strings included, is a VARIANT value to
+    # serialise, as DatabricksVariant does when it binds it
+    if value is None or value != value:
+        return None
+    return json.dumps(value, separators=(",", ":"))
+
+
+class PandasInsertMethod:
+    """An insert method for DataFrame.to_sql(method=...). Instead of one INSERT per row, or one
+    multi-row INSERT per chunk that may exceed the parameter limit, it executes each chunk of the
+    DataFrame as an executemany(), which the dialect batches into multi-row INSERT ... VALUES
+    statements. When a `staging` backend is given and the chunk has at least staging_min_rows
+    rows, the chunk is converted to Arrow and written through Parquet files and COPY INTO with
+    insert_arrow() instead.
+
+    pandas_insert_method is an instance without staging.
+    """
+
+    def __init__(
+        self, staging: Optional[StagingBackend] = None, staging_min_rows: int = 10_000
+    ):
+        self.staging = staging
+        self.staging_min_rows = staging_min_rows
+
+    def __call__(self, pd_table, conn, keys, data_iter) -> int:
+        rows = list(data_iter)
+        if not rows:
+            return 0
+        table = pd_table.table
+        variants = [
+            i
+            for i, key in enumerate(keys)
+            if isinstance(table.c[key].type, DatabricksVariant)
+        ]
+
+        if self.staging is None or len(rows) < self.staging_min_rows:
+            # DatabricksVariant serialises the values it binds
+            params = [dict(zip(keys, row)) for row in rows]
+            conn.execute(insert(table), params)
+            return len(params)
+
+        frame = getattr(pd_table, "frame", None)
+        if frame is not None and len(frame) == len(rows):
+            # The chunk is the whole DataFrame, so Arrow can convert its columns at once rather
+            # than the Python objects pandas made of them
+            if pd_table.index is not None:
+                frame = frame.reset_index()
+            columns = [frame.iloc[:, i] for i in range(len(keys))]
+        else:
+            columns = [list(column) for column in zip(*rows)]
+
+        # Arrow can't infer one type for a column of arbitrary dicts and lists
+        arrays = [
+            (
+                pyarrow.array(
+                    [_variant_json(value) for value in column], pyarrow.string()
+                )
+                if i in variants
+                else pyarrow.array(column, from_pandas=True)
+            )
+            for i, column in enumerate(columns)
+        ]
+        arrow_table = pyarrow.Table.from_arrays(arrays, names=list(keys))
+        return insert_arrow(conn, table, arrow_table, staging=self.staging)
+
+
+pandas_insert_method = PandasInsertMethod()
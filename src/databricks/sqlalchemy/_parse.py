@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
+import copy
+import functools
 import re
 
 import sqlalchemy
@@ -31,6 +33,50 @@ def _match_table_not_found_string(message: str) -> bool:
     )
 
 
+def _match_schema_not_found_string(message: str) -> bool:
+    """Return True if the message contains a substring indicating that a schema was not found"""
+
+    DBR_LTE_12_NOT_FOUND_STRING = "not found"
+    DBR_GT_12_NOT_FOUND_STRING = "SCHEMA_NOT_FOUND"
+    return any(
+        [
+            "Database" in message and DBR_LTE_12_NOT_FOUND_STRING in message,
+            DBR_GT_12_NOT_FOUND_STRING in message,
+        ]
+    )
+
+
+_QUALIFIED_SCHEMA_PATTERN = re.compile(
+    r"^(`(?:[^`]|``)+`|[^.`]+)\.(`(?:[^`]|``)+`|[^.`]+)$"
+)
+
+
+def split_catalog_schema(schema: str) -> Tuple[Optional[str], str]:
+    """Split a schema name qualified with its catalog, such as "main.default" or "`my.catalog`.default",
+    into its catalog and schema. The catalog is None if the schema name isn't qualified.
+    """
+
+    match = _QUALIFIED_SCHEMA_PATTERN.match(schema)
+    if not match:
+        return None, schema
+
+    catalog, schema = (
+        part[1:-1].replace("``", "`") if part.startswith("`") else part
+        for part in match.groups()
+    )
+    return catalog, schema
+
+
+def join_catalog_schema(catalog: str, schema: str) -> str:
+    """The inverse of split_catalog_schema"""
+
+    catalog, schema = (
+        f"`{part.replace('`', '``')}`" if re.search(r"[.`]", part) else part
+        for part in (catalog, schema)
+    )
+    return f"{catalog}.{schema}"
+
+
 def _describe_table_extended_result_to_dict_list(
     result: CursorResult,
 ) -> List[Dict[str, str]]:
@@ -155,7 +201,10 @@ def _parse_fk_from_constraint_string(constraint_str: str) -> dict:
 
 
 def build_fk_dict(
-    fk_name: str, fk_constraint_string: str, schema_name: Optional[str]
+    fk_name: str,
+    fk_constraint_string: str,
+    schema_name: Optional[str],
+    catalog_name: Optional[str] = None,
 ) -> dict:
     """
     Given a foriegn key name and a foreign key constraint string, return a dictionary
@@ -174,13 +223,27 @@ def build_fk_dict(
 
     referred schema will be None if the schema_name argument is None.
     This is required by SQLAlchey's ComponentReflectionTest::test_get_foreign_keys
+
+    If catalog_name is the catalog of the constrained table and the referred table is in a
+    different catalog, referred_schema is qualified with that catalog, as in "other.some_schema",
+    whatever schema_name is.
     """
 
     # The foreign key name is not contained in the constraint string so we
     # need to add it manually
     base_fk_dict = _parse_fk_from_constraint_string(fk_constraint_string)
-
-    if not schema_name:
+    referred_catalog = extract_three_level_identifier_from_constraint_string(
+        fk_constraint_string
+    )["catalog"]
+
+    schema_override_dict: Dict[str, Optional[str]]
+    if catalog_name is not None and referred_catalog != catalog_name:
+        schema_override_dict = dict(
+            referred_schema=join_catalog_schema(
+                referred_catalog, base_fk_dict["referred_schema"]
+            )
+        )
+    elif not schema_name:
         schema_override_dict = dict(referred_schema=None)
     else:
         schema_override_dict = {}
@@ -229,6 +292,106 @@ def build_pk_dict(pk_name: str, pk_constraint_string: str) -> dict:
     return {"constrained_columns": constrained_columns, "name": pk_name}
 
 
+def build_pk_dicts_from_information_schema(rows) -> Dict[str, dict]:
+    """Group the rows of a primary key query against information_schema into one dictionary per table.
+
+    Each row must expose table_name, constraint_name and column_name, ordered by table_name and
+    then by the column's position in the constraint. The dictionaries have the same shape as the
+    output of build_pk_dict.
+    """
+
+    pk_dicts: Dict[str, dict] = {}
+    for row in rows:
+        pk_dict = pk_dicts.setdefault(
+            row.table_name, {"constrained_columns": [], "name": row.constraint_name}
+        )
+        pk_dict["constrained_columns"].append(row.column_name)
+
+    return pk_dicts
+
+
+def build_fk_dicts_from_information_schema(
+    rows, schema_name: Optional[str]
+) -> Dict[str, List[dict]]:
+    """Group the rows of a foreign key query against information_schema into a list of dictionaries per table.
+
+    Each row must expose table_name, constraint_name, column_name, referred_schema, referred_table and
+    referred_column, ordered by table_name, constraint_name and then by the column's position in the
+    constraint. The dictionaries have the same shape as the output of build_fk_dict, including
+    referred_schema being None if the schema_name argument is None.
+
+    A referred table in another catalog isn't in this catalog's information_schema, so its rows have
+    a referred_table of None. They're skipped: the caller must read those tables' foreign keys from
+    DESCRIBE TABLE EXTENDED instead.
+    """
+
+    fk_dicts: Dict[str, Dict[str, dict]] = {}
+    for row in rows:
+        if row.referred_table is None:
+            continue
+        table_fks = fk_dicts.setdefault(row.table_name, {})
+        fk_dict = table_fks.get(row.constraint_name)
+        if fk_dict is None:
+            fk_dict = table_fks[row.constraint_name] = {
+                "name": row.constraint_name,
+                "constrained_columns": [],
+                "referred_table": row.referred_table,
+                "referred_columns": [],
+                "referred_schema": row.referred_schema if schema_name else None,
+            }
+        fk_dict["constrained_columns"].append(row.column_name)
+        fk_dict["referred_columns"].append(row.referred_column)
+
+    return {
+        table_name: list(table_fks.values())
+        for table_name, table_fks in fk_dicts.items()
+    }
+
+
+def build_generated_column_dicts_from_information_schema(
+    rows,
+) -> Dict[str, Dict[str, dict]]:
+    """Group the rows of an information_schema.columns query for identity and generated columns
+    into a dictionary of table name -> column name -> the ReflectedColumn keys to add.
+
+    Each row must expose table_name, column_name, is_identity, identity_generation,
+    identity_start, identity_increment, identity_minimum, identity_maximum, identity_cycle,
+    is_generated and generation_expression. An identity
+    column gets an "identity" key and autoincrement=True. A generated column gets a "computed"
+    key, which is always persisted because Delta stores generated columns.
+    """
+
+    column_dicts: Dict[str, Dict[str, dict]] = {}
+    for row in rows:
+        extra: Dict[str, Any] = {}
+        if row.is_identity == "YES":
+            identity = {
+                "always": row.identity_generation == "ALWAYS",
+                "cycle": row.identity_cycle == "YES",
+            }
+            # information_schema returns these as strings, or NULL when they aren't set
+            for key, value in [
+                ("start", row.identity_start),
+                ("increment", row.identity_increment),
+                ("minvalue", row.identity_minimum),
+                ("maxvalue", row.identity_maximum),
+            ]:
+                if value is not None:
+                    identity[key] = int(value)
+            extra["identity"] = identity
+            extra["autoincrement"] = True
+        elif row.is_generated == "ALWAYS" and row.generation_expression:
+            extra["computed"] = {
+                "sqltext": row.generation_expression,
+                "persisted": True,
+            }
+        else:
+            continue
+        column_dicts.setdefault(row.table_name, {})[row.column_name] = extra
+
+    return column_dicts
+
+
 def match_dte_rows_by_value(dte_output: List[Dict[str, str]], match: str) -> List[dict]:
     """Return a list of dictionaries containing only the col_name:data_type pairs where the `data_type`
     value contains the match argument.
@@ -298,6 +461,96 @@ def get_comment_from_dte_output(dte_output: List[Dict[str, str]]) -> Optional[st
         return output[0]["data_type"]
 
 
+def get_view_text_from_dte_output(dte_output: List[Dict[str, str]]) -> Optional[str]:
+    """Returns the value of the "View Text" col_name data in dte_output, which is only present
+    for views
+    """
+    output = match_dte_rows_by_key(dte_output, "View Text")
+    if not output:
+        return None
+    else:
+        return output[0]["data_type"]
+
+
+def get_section_columns_from_dte_output(
+    dte_output: List[Dict[str, str]], section: str
+) -> List[str]:
+    """Return the column names listed in a section of the DESCRIBE TABLE EXTENDED output, such as
+    "# Partition Information". Each section starts with a "# col_name" header row and ends at the
+    next blank row. Returns an empty list if the section isn't present.
+    """
+
+    output = []
+    in_section = False
+    for row_dict in dte_output:
+        col_name = row_dict["col_name"].strip()
+        if in_section:
+            if not col_name:
+                break
+            if not col_name.startswith("#"):
+                output.append(col_name)
+        elif col_name == section:
+            in_section = True
+
+    return output
+
+
+# Splits "k1=v1,k2=v2" on the commas that start a new key, so values may contain commas
+_TABLE_PROPERTY_SEPARATOR = re.compile(r",(?=[\w.\-]+=)")
+
+
+def get_table_properties_from_dte_output(
+    dte_output: List[Dict[str, str]]
+) -> Dict[str, str]:
+    """Return the "Table Properties" of the DESCRIBE TABLE EXTENDED output, which look like
+    [delta.minReaderVersion=1,delta.minWriterVersion=2], as a dictionary.
+    """
+
+    output = match_dte_rows_by_key(dte_output, "Table Properties")
+    if not output:
+        return {}
+
+    properties_str = output[0]["data_type"].strip()
+    if properties_str.startswith("[") and properties_str.endswith("]"):
+        properties_str = properties_str[1:-1]
+
+    properties = {}
+    for pair in _TABLE_PROPERTY_SEPARATOR.split(properties_str):
+        key, sep, value = pair.partition("=")
+        if sep:
+            properties[key.strip()] = value
+    return properties
+
+
+def get_table_options_from_dte_output(
+    dte_output: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Return the partition columns, liquid clustering columns and table properties found in the
+    DESCRIBE TABLE EXTENDED output, keyed by their dialect option names. Options the table
+    doesn't have are left out.
+    """
+
+    options: Dict[str, Any] = {}
+
+    partition_by = get_section_columns_from_dte_output(
+        dte_output, "# Partition Information"
+    )
+    if partition_by:
+        options["databricks_partition_by"] = partition_by
+
+    cluster_by = get_section_columns_from_dte_output(
+        dte_output, "# Clustering Information"
+    )
+    if cluster_by:
+        options["databricks_cluster_by"] = cluster_by
+
+    table_properties = get_table_properties_from_dte_output(dte_output)
+    if table_properties:
+        options["databricks_table_properties"] = table_properties
+
+    return options
+
+
 # The keys of this dictionary are the values we expect to see in a
 # TGetColumnsRequest's .TYPE_NAME attribute.
 # These are enumerated in ttypes.py as class TTypeId.
@@ -314,18 +567,20 @@ GET_COLUMNS_TYPE_MAP = {
     "varchar": sqlalchemy.types.String,
     "char": sqlalchemy.types.String,
     "binary": sqlalchemy.types.String,
-    "array": sqlalchemy.types.String,
-    "map": sqlalchemy.types.String,
-    "struct": sqlalchemy.types.String,
+    "interval": sqlalchemy.types.String,
     "uniontype": sqlalchemy.types.String,
     "variant": type_overrides.DatabricksVariant,
     "decimal": sqlalchemy.types.Numeric,
     "timestamp": type_overrides.TIMESTAMP,
     "timestamp_ntz": type_overrides.TIMESTAMP_NTZ,
     "date": sqlalchemy.types.Date,
+    "void": sqlalchemy.types.NullType,
 }
 
 
+_DECIMAL_PATTERN = re.compile(r"DECIMAL\((\d+),\s*(\d+)\)", re.IGNORECASE)
+
+
 def parse_numeric_type_precision_and_scale(type_name_str):
     """Return an intantiated sqlalchemy Numeric() type that preserves the precision and scale indicated
     in the output from TGetColumnsRequest.
@@ -336,33 +591,157 @@ def parse_numeric_type_precision_and_scale(type_name_str):
     If type_name_str is "DECIMAL(18,5) returns sqlalchemy.types.Numeric(18,5)
     """
 
-    pattern = re.compile(r"DECIMAL\((\d+,\d+)\)")
-    match = re.search(pattern, type_name_str)
-    precision_and_scale = match.group(1)
-    precision, scale = tuple(precision_and_scale.split(","))
+    match = re.search(_DECIMAL_PATTERN, type_name_str)
+    if not match:
+        # A bare DECIMAL, for example as compiled from an unparameterised Numeric()
+        return sqlalchemy.types.Numeric()
+    precision, scale = match.groups()
 
     return sqlalchemy.types.Numeric(int(precision), int(scale))
 
 
-def parse_column_info_from_tgetcolumnsresponse(thrift_resp_row) -> ReflectedColumn:
-    """Returns a dictionary of the ReflectedColumn schema parsed from
-    a single of the result of a TGetColumnsRequest thrift RPC
-    """
+# Backquoted identifiers, words, quoted strings (in struct field comments), or punctuation
+_TYPE_TOKEN_PATTERN = re.compile(r"\s*(`(?:[^`]|``)*`|\w+|'(?:[^'\\]|\\.)*'|\S)")
 
-    pat = re.compile(r"^\w+")
 
-    # This method assumes a valid TYPE_NAME field in the response.
-    # TODO: add error handling in case TGetColumnsResponse format changes
+class _TypeStringParser:
+    """A recursive descent parser for Databricks type names, including nested complex types such
+    as ARRAY<MAP<STRING,STRUCT<a:INT,b:DECIMAL(10,2)>>>.
+    """
+
+    def __init__(self, type_name_str: str):
+        self.type_name_str = type_name_str
+        self.tokens = _TYPE_TOKEN_PATTERN.findall(type_name_str)
+        self.position = 0
 
-    _raw_col_type = re.search(pat, thrift_resp_row.TYPE_NAME).group(0).lower()  # type: ignore
-    _col_type = GET_COLUMNS_TYPE_MAP[_raw_col_type]
+    def peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
 
-    if _raw_col_type == "decimal":
-        final_col_type = parse_numeric_type_precision_and_scale(
-            thrift_resp_row.TYPE_NAME
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise DatabricksSqlAlchemyParseException(
+                f"Expected {expected or 'a type'} at token {self.position} of type name {self.type_name_str!r}"
+            )
+        self.position += 1
+        return token
+
+    def parse(self):
+        name = self.take().lower()
+
+        if name == "array":
+            self.take("<")
+            item_type = self.parse()
+            self.take(">")
+            return type_overrides.DatabricksArray(item_type)
+
+        if name == "map":
+            self.take("<")
+            key_type = self.parse()
+            self.take(",")
+            value_type = self.parse()
+            self.take(">")
+            return type_overrides.DatabricksMap(key_type, value_type)
+
+        if name == "struct":
+            return type_overrides.DatabricksStruct(self.parse_struct_fields())
+
+        arg_tokens = []
+        if self.peek() == "(":
+            self.take("(")
+            arg_tokens.append(self.take())
+            while self.peek() == ",":
+                self.take(",")
+                arg_tokens.append(self.take())
+            self.take(")")
+
+        if name == "interval":
+            # The qualifier, as in INTERVAL DAY TO SECOND or INTERVAL YEAR, doesn't affect the type
+            while (self.peek() or "").upper() in (
+                "YEAR",
+                "MONTH",
+                "DAY",
+                "HOUR",
+                "MINUTE",
+                "SECOND",
+                "TO",
+            ):
+                self.take()
+
+        # Arguments such as the ANY in GEOMETRY(ANY) aren't lengths or precisions we understand
+        if not all(token.isdigit() for token in arg_tokens):
+            return self.unrecognised()
+        args = [int(token) for token in arg_tokens]
+
+        if name == "decimal":
+            return sqlalchemy.types.Numeric(*args)
+        if name in ("varchar", "char") and args:
+            return sqlalchemy.types.String(args[0])
+
+        if name not in GET_COLUMNS_TYPE_MAP:
+            return self.unrecognised()
+        return GET_COLUMNS_TYPE_MAP[name]
+
+    def unrecognised(self):
+        sqlalchemy.util.warn(
+            f"Did not recognize type '{self.type_name_str}', reflecting it as NullType"
         )
-    else:
-        final_col_type = _col_type
+        return sqlalchemy.types.NullType
+
+    def parse_struct_fields(self):
+        fields = []
+        self.take("<")
+        while self.peek() != ">":
+            if fields:
+                self.take(",")
+            field_name = self.take()
+            if field_name.startswith("`"):
+                field_name = field_name[1:-1].replace("``", "`")
+            if self.peek() == ":":
+                self.take(":")
+            field_type = self.parse()
+
+            # Ignore NOT NULL and COMMENT '...', which may follow a field's type
+            while (self.peek() or "").upper() in ("NOT", "NULL", "COMMENT"):
+                if self.take().upper() == "COMMENT":
+                    self.take()
+
+            fields.append((field_name, field_type))
+        self.take(">")
+        return fields
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_type_string_cached(type_name_str: str):
+    return _TypeStringParser(type_name_str).parse()
+
+
+def parse_type_string(type_name_str: str):
+    """Return the sqlalchemy type for a Databricks type name such as INT, DECIMAL(18,5) or
+    ARRAY<STRUCT<a:INT,b:STRING>>.
+
+    Simple types are returned as classes, and parameterised and complex types as instances. Wide
+    tables repeat the same few type names, so parsing is memoised and each caller gets its own
+    copy of an instance.
+
+    type_name_str
+      A type name as found in TGetColumnsReq.TYPE_NAME, or as compiled by this dialect
+    """
+
+    parsed = _parse_type_string_cached(type_name_str)
+    if isinstance(parsed, type):
+        return parsed
+    return copy.deepcopy(parsed)
+
+
+def parse_column_info_from_tgetcolumnsresponse(thrift_resp_row) -> ReflectedColumn:
+    """Returns a dictionary of the ReflectedColumn schema parsed from
+    a single of the result of a TGetColumnsRequest thrift RPC
+    """
+
+    final_col_type = parse_type_string(thrift_resp_row.TYPE_NAME)
 
     # See comments about autoincrement in test_suite.py
     # Since Databricks SQL doesn't currently support inline AUTOINCREMENT declarations
@@ -373,7 +752,8 @@ def parse_column_info_from_tgetcolumnsresponse(thrift_resp_row) -> ReflectedColu
     # it ever returns a `YES`.
 
     # Per the guidance in SQLAlchemy's docstrings, we prefer to not even include an autoincrement
-    # key in this dictionary.
+    # key in this dictionary. Identity columns get one, along with their identity and computed keys,
+    # from information_schema.columns instead (see build_generated_column_dicts_from_information_schema).
     this_column = {
         "name": thrift_resp_row.COLUMN_NAME,
         "type": final_col_type,
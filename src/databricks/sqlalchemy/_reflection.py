@@ -0,0 +1,334 @@
+"""
+This module contains reflection entry points that build on top of DatabricksDialect's
+batched reflection methods.
+"""
+
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from sqlalchemy import (
+    ForeignKeyConstraint,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    inspect,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.reflection import Inspector, ObjectKind, ObjectScope
+
+# The key in Table.info under which the table's last_altered time is kept, so that
+# refresh_reflected_metadata() can tell whether the table has changed since it was reflected
+VERSION_INFO_KEY = "databricks_last_altered"
+
+# The key set in an Inspector's info_cache while it autoloads a table for a dialect with
+# lazy_reflection=True, so the dialect knows to defer everything but the columns
+AUTOLOAD_INFO_KEY = "databricks_lazy_autoload"
+
+
+class DatabricksInspector(Inspector):
+    """The Inspector returned by inspect() for a Databricks engine or connection"""
+
+    def reflect_table(self, table: Table, *args: Any, **kw: Any) -> None:
+        """Reflect a table as Inspector.reflect_table() does. With lazy_reflection=True only its
+        columns are reflected, until load_deferred_reflection() is called on it.
+        """
+
+        if not getattr(self.dialect, "lazy_reflection", False):
+            return super().reflect_table(table, *args, **kw)
+
+        # Referred tables are autoloaded from inside this call, so restore rather than pop
+        autoloading = self.info_cache.get(AUTOLOAD_INFO_KEY, False)
+        self.info_cache[AUTOLOAD_INFO_KEY] = True
+        try:
+            super().reflect_table(table, *args, **kw)
+        finally:
+            self.info_cache[AUTOLOAD_INFO_KEY] = autoloading
+
+
+def _connect(bind: Union[Engine, Connection]):
+    if isinstance(bind, Engine):
+        return bind.connect()
+    return contextlib.nullcontext(bind)
+
+
+def _record_table_versions(
+    metadata: MetaData, schema: Optional[str], versions: Mapping[str, str]
+) -> None:
+    for table in metadata.tables.values():
+        if table.schema == schema and table.name.lower() in versions:
+            table.info[VERSION_INFO_KEY] = versions[table.name.lower()]
+
+
+def reflect_parallel(
+    engine: Engine,
+    metadata: MetaData,
+    schema: Optional[str] = None,
+    max_workers: int = 4,
+    **reflect_kw: Any,
+) -> None:
+    """Reflect the tables in `schema` into `metadata`, like MetaData.reflect(), but run the dialect's
+    reflection queries concurrently on up to max_workers connections checked out of the engine's pool.
+
+    DatabricksDialect reflects columns, primary keys and foreign keys with one query each for the
+    whole schema. MetaData.reflect() runs these one after another. Here each runs on its own
+    connection, so they take as long as the slowest of them instead of their sum. With
+    reflect_table_options=True, the DESCRIBE TABLE EXTENDED per table that reads table options is
+    spread over max_workers more tasks. The results are merged into one Inspector, which
+    MetaData.reflect() then reads from without further round trips.
+
+    Any other keyword arguments (views, only, extend_existing, resolve_fks, ...) are passed to
+    MetaData.reflect().
+    """
+
+    dialect = engine.dialect
+    only = reflect_kw.get("only")
+    filter_names = list(only) if only is not None and not callable(only) else None
+    kind = ObjectKind.ANY if reflect_kw.get("views") else ObjectKind.TABLE
+
+    lookups = [
+        (dialect.get_multi_columns, filter_names),
+        (dialect.get_multi_pk_constraint, filter_names),
+        (dialect.get_multi_foreign_keys, filter_names),
+    ]
+
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+
+        # Every lookup needs the list of tables first. Fetch it once here and hand each worker a
+        # copy of the cache so the workers don't each fetch it again.
+        # The inspector caches these lists, so build a new one rather than extending them
+        names = list(inspector.get_table_names(schema))
+        if reflect_kw.get("views"):
+            names = names + inspector.get_view_names(schema)
+        shared_cache = dict(inspector.info_cache)
+
+        if getattr(dialect, "reflect_table_options", False):
+            # Table options take a DESCRIBE per table, so deal the tables out to every worker
+            if filter_names is not None:
+                names = filter_names
+            for i in range(min(max_workers, len(names))):
+                lookups.append((dialect.get_multi_table_options, names[i::max_workers]))
+
+        def run(lookup):
+            method, lookup_filter_names = lookup
+            info_cache = dict(shared_cache)
+            with engine.connect() as worker_connection:
+                # The lookups are generators, so exhaust them to run the queries
+                for _ in method(
+                    worker_connection,
+                    schema=schema,
+                    filter_names=lookup_filter_names,
+                    kind=kind,
+                    scope=ObjectScope.ANY,
+                    info_cache=info_cache,
+                ):
+                    pass
+            return info_cache
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for info_cache in pool.map(run, lookups):
+                inspector.info_cache.update(info_cache)
+
+        # MetaData.reflect() accepts an Inspector at runtime, though it's only annotated for
+        # Engine and Connection
+        metadata.reflect(bind=inspector, schema=schema, **reflect_kw)  # type: ignore
+
+        _record_table_versions(
+            metadata,
+            schema,
+            dialect._get_table_versions(  # type: ignore
+                connection, schema, info_cache=inspector.info_cache
+            )
+            or {},
+        )
+
+
+def get_view_definitions(
+    bind: Union[Engine, Connection], schema: Optional[str] = None
+) -> Dict[str, str]:
+    """Return a dictionary of lowercased view name -> definition for every view and materialized
+    view in `schema`, with one information_schema.views query.
+
+    Inspector.get_view_definition() reads from the same query within one Inspector, so this is
+    only a shortcut for tools that want every view body at once.
+
+    If the catalog has no information_schema, as in hive_metastore, each view is described with
+    DESCRIBE TABLE EXTENDED instead, which costs one round trip per view.
+    """
+
+    with _connect(bind) as connection:
+        return connection.dialect._get_view_definitions(  # type: ignore
+            connection, schema=schema, info_cache={}
+        )
+
+
+def load_deferred_reflection(
+    table: Table, bind: Union[Engine, Connection, Inspector]
+) -> Table:
+    """Reflect the primary key, foreign keys, comment and table options of a table that was
+    autoloaded by a dialect with lazy_reflection=True, and add them to the table.
+
+    All four share a single DESCRIBE TABLE EXTENDED. Constraints already present on the table
+    are left alone, so calling this more than once is harmless. Referred tables aren't loaded:
+    a foreign key resolves once its referred table is in the same MetaData.
+
+    Call this before mapping an ORM class to the table, since the mapper needs the primary key.
+    """
+
+    inspector = inspect(bind)
+    schema = table.schema
+
+    if not table.primary_key.columns:
+        add_reflected_pk_constraint(
+            table, inspector.get_pk_constraint(table.name, schema=schema)
+        )
+    add_reflected_foreign_keys(
+        table, inspector.get_foreign_keys(table.name, schema=schema)
+    )
+
+    if table.comment is None:
+        table.comment = inspector.get_table_comment(table.name, schema=schema)["text"]
+
+    table.dialect_kwargs.update(inspector.get_table_options(table.name, schema=schema))
+
+    return table
+
+
+def add_reflected_pk_constraint(table: Table, pk: Mapping[str, Any]) -> None:
+    """Add a primary key in the shape returned by get_pk_constraint to table"""
+    if pk["constrained_columns"]:
+        table.append_constraint(
+            PrimaryKeyConstraint(*pk["constrained_columns"], name=pk.get("name"))
+        )
+
+
+def add_reflected_foreign_keys(
+    table: Table, foreign_keys: Sequence[Mapping[str, Any]]
+) -> None:
+    """Add foreign keys in the shape returned by get_foreign_keys to table, skipping any that
+    the table already has a constraint of the same name for.
+    """
+
+    existing = {fk.name for fk in table.foreign_key_constraints}
+    for fk in foreign_keys:
+        if fk["name"] in existing:
+            continue
+        referred = [fk["referred_table"]]
+        if fk["referred_schema"] is not None:
+            referred.insert(0, fk["referred_schema"])
+        table.append_constraint(
+            ForeignKeyConstraint(
+                fk["constrained_columns"],
+                [".".join(referred + [column]) for column in fk["referred_columns"]],
+                name=fk["name"],
+                link_to_name=True,
+            )
+        )
+
+
+def refresh_reflected_metadata(
+    bind: Union[Engine, Connection], metadata: MetaData, schema: Optional[str] = None
+) -> List[str]:
+    """Bring the reflected tables in `schema` up to date with the warehouse and return the names of
+    the tables that changed.
+
+    One information_schema query finds each table's last_altered time. Only the tables whose
+    time moved since they were reflected are reflected again, together, with the dialect's
+    batched queries. Their Table objects are updated in place: columns are replaced, and
+    constraints and comments are refreshed. SQLAlchemy can't remove a column from a Table, so a
+    table that lost columns is replaced in metadata with a newly reflected Table. Tables that were
+    dropped are removed from metadata. Tables that were created aren't added.
+
+    Tables reflected with reflect_parallel() or loaded with load_reflection_snapshot() know their
+    time already. For any other table, the first call records its current time and assumes it is
+    up to date, so call this once right after reflecting.
+
+    Raises NotImplementedError if the catalog has no information_schema, as in hive_metastore.
+    """
+
+    tables = [table for table in metadata.tables.values() if table.schema == schema]
+
+    with _connect(bind) as connection:
+        inspector = inspect(connection)
+        versions: Optional[Dict[str, str]] = connection.dialect._get_table_versions(  # type: ignore
+            connection, schema, info_cache=inspector.info_cache
+        )
+        if versions is None:
+            raise NotImplementedError(
+                "refresh_reflected_metadata() needs information_schema, which this catalog "
+                "doesn't have"
+            )
+
+        changed = []
+        for table in tables:
+            version = versions.get(table.name.lower())
+            if version is None:
+                metadata.remove(table)
+                changed.append(table)
+            elif VERSION_INFO_KEY not in table.info:
+                table.info[VERSION_INFO_KEY] = version
+            elif table.info[VERSION_INFO_KEY] != version:
+                changed.append(table)
+
+        altered = [table for table in changed if table.name.lower() in versions]
+        if altered:
+            previous_columns = {table: list(table.columns) for table in altered}
+            # Reflection only ever adds foreign keys, so remove the old ones first
+            for table in altered:
+                for constraint in list(table.foreign_key_constraints):
+                    table.constraints.discard(constraint)
+                    for fk in constraint.elements:
+                        table.foreign_keys.discard(fk)
+                        fk.parent.foreign_keys.discard(fk)
+            _reflect_only(inspector, metadata, schema, altered)
+
+            # Reflection replaces every column it finds, so a column that is still the same object
+            # no longer exists
+            shrunk = [
+                table
+                for table, columns in previous_columns.items()
+                if any(table.columns.get(column.key) is column for column in columns)
+            ]
+            for table in shrunk:
+                metadata.remove(table)
+            if shrunk:
+                _reflect_only(inspector, metadata, schema, shrunk)
+
+            for table in altered:
+                metadata.tables[table.key].info[VERSION_INFO_KEY] = versions[
+                    table.name.lower()
+                ]
+
+    return sorted(table.name for table in changed)
+
+
+def _reflect_only(
+    inspector: Inspector,
+    metadata: MetaData,
+    schema: Optional[str],
+    tables: Sequence[Table],
+) -> None:
+    """Reflect tables into metadata again, extending any that are still in it"""
+
+    # MetaData.reflect() keys what it reflects by the warehouse's lowercased names, so a table
+    # declared with a mixed-case name is reflected on its own. Both accept an Inspector at
+    # runtime, though they're only annotated for Engine and Connection.
+    batched = [table.name for table in tables if table.name == table.name.lower()]
+    if batched:
+        metadata.reflect(
+            bind=inspector,  # type: ignore
+            schema=schema,
+            views=True,
+            only=batched,
+            extend_existing=True,
+        )
+    for table in tables:
+        if table.name != table.name.lower():
+            Table(
+                table.name,
+                metadata,
+                schema=schema,
+                autoload_with=inspector,  # type: ignore
+                extend_existing=True,
+            )
@@ -0,0 +1,319 @@
+"""
+This module contains an opt-in reflection cache that outlives a single Inspector.
+
+SQLAlchemy's @reflection.cache only lasts as long as one Inspector, so every new process reflects
+the same schemas from scratch. ReflectionCache keeps reflected columns, constraints and comments
+in a local SQLite file. Each entry is stored alongside the table's version (its last_altered time
+in information_schema.tables), so an entry is only served while the table hasn't changed.
+"""
+
+import functools
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.types import NullType, String, TypeEngine
+
+from databricks.sqlalchemy._parse import parse_type_string
+from databricks.sqlalchemy._types import (
+    DatabricksArray,
+    DatabricksMap,
+    DatabricksStruct,
+)
+
+# Bump this if the layout of a stored value changes. Entries with a different version are ignored.
+CACHE_FORMAT_VERSION = 2
+
+_TYPE_KEY = "__databricks_type__"
+
+# Stay well below SQLite's limit on the number of host parameters in one statement
+_MAX_KEYS_PER_QUERY = 500
+
+
+def _type_name(type_: TypeEngine, dialect: Dialect) -> str:
+    """Return the Databricks type name that parse_type_string() reads back as type_.
+
+    The dialect compiles String() to STRING whatever its length, so a reflected VARCHAR(n) or
+    CHAR(n) is written as VARCHAR(n) instead, including inside complex types. NullType, which
+    unrecognised types are reflected as, doesn't compile and is written as VOID.
+    """
+
+    if isinstance(type_, NullType):
+        return "VOID"
+    if isinstance(type_, DatabricksArray):
+        return f"ARRAY<{_type_name(type_.item_type, dialect)}>"
+    if isinstance(type_, DatabricksMap):
+        key_type = _type_name(type_.key_type, dialect)
+        return f"MAP<{key_type},{_type_name(type_.value_type, dialect)}>"
+    if isinstance(type_, DatabricksStruct):
+        fields = ",".join(
+            f"{dialect.identifier_preparer.quote(name)}:{_type_name(field_type, dialect)}"
+            for name, field_type in type_.fields
+        )
+        return f"STRUCT<{fields}>"
+    if isinstance(type_, String) and type_.length is not None:
+        return f"VARCHAR({type_.length})"
+    return type_.compile(dialect=dialect)
+
+
+class _ReflectedValueEncoder(json.JSONEncoder):
+    """Encodes sqlalchemy types (which appear in reflected columns) as their Databricks type name"""
+
+    def __init__(self, *args, dialect: Dialect, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dialect = dialect
+
+    def default(self, o):
+        if isinstance(o, type) and issubclass(o, TypeEngine):
+            o = o()
+        if isinstance(o, TypeEngine):
+            return {_TYPE_KEY: _type_name(o, self.dialect)}
+        return super().default(o)
+
+
+def _decode_reflected_value(obj: Dict[str, Any]) -> Any:
+    if _TYPE_KEY in obj:
+        return parse_type_string(obj[_TYPE_KEY])
+    return obj
+
+
+def dumps_reflected(value: Any, dialect: Dialect) -> str:
+    """Serialise the output of a reflection method to JSON. Types are stored as Databricks type names."""
+    return json.dumps(
+        value, cls=_ReflectedValueEncoder, dialect=dialect, separators=(",", ":")
+    )
+
+
+def loads_reflected(value: str) -> Any:
+    """The inverse of dumps_reflected"""
+    return json.loads(value, object_hook=_decode_reflected_value)
+
+
+class ReflectionCache:
+    """A size-bounded, TTL-limited store of reflection results in a local SQLite database.
+
+    Entries are keyed by a string and stored with a version. get_many() only returns an entry if
+    its stored version matches the version passed in and it is younger than ttl seconds. When
+    more than max_entries are stored, the oldest entries are evicted.
+
+    Pass ":memory:" as the path to keep the cache in this process only.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dialect: Dialect,
+        ttl: float = 3600,
+        max_entries: int = 10000,
+    ):
+        self.path = path
+        self.dialect = dialect
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reflection_cache (
+                    key TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    format INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    value TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS reflection_cache_stored_at ON reflection_cache (stored_at)"
+            )
+
+    def get_many(self, versions: Mapping[str, str]) -> Dict[str, Any]:
+        """Return the fresh entries among the given keys.
+
+        versions
+          A mapping of key -> the current version of the table that key describes
+        """
+
+        if not versions:
+            return {}
+
+        oldest = time.time() - self.ttl
+        keys = list(versions)
+        rows: List[Any] = []
+        with self._lock:
+            for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                batch = keys[i : i + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(batch))
+                rows += self._conn.execute(
+                    f"SELECT key, version, value FROM reflection_cache "
+                    f"WHERE key IN ({placeholders}) AND format = ? AND stored_at >= ?",
+                    [*batch, CACHE_FORMAT_VERSION, oldest],
+                ).fetchall()
+
+        return {
+            key: loads_reflected(value)
+            for key, version, value in rows
+            if versions[key] == version
+        }
+
+    def set_many(self, entries: Mapping[str, Any], versions: Mapping[str, str]):
+        """Store each entry under its key with the matching version from versions, then evict
+        expired entries and any beyond max_entries.
+        """
+
+        if not entries:
+            return
+
+        now = time.time()
+        rows = [
+            (
+                key,
+                versions[key],
+                CACHE_FORMAT_VERSION,
+                now,
+                dumps_reflected(value, self.dialect),
+            )
+            for key, value in entries.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO reflection_cache VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "DELETE FROM reflection_cache WHERE stored_at < ?", [now - self.ttl]
+            )
+            self._conn.execute(
+                "DELETE FROM reflection_cache WHERE key IN ("
+                "SELECT key FROM reflection_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                [self.max_entries],
+            )
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reflection_cache")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ExistenceCache:
+    """A size-bounded, TTL-limited, in-memory record of which tables exist and which don't.
+
+    It holds single tables, keyed by (catalog, schema, table), and complete listings of a schema,
+    keyed by (catalog, schema). A table missing from a listing doesn't exist. Names are compared
+    case-insensitively like Databricks identifiers. Entries are forgotten after ttl seconds. When
+    more than max_entries tables (or listings) are stored, the least recently stored are evicted.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._tables: "OrderedDict[Tuple[str, str, str], Tuple[float, bool]]" = (
+            OrderedDict()
+        )
+        self._listings: "OrderedDict[Tuple[str, str], Tuple[float, FrozenSet[str]]]" = (
+            OrderedDict()
+        )
+
+    def _fresh(self, entries: "OrderedDict", key: Tuple) -> Optional[Any]:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del entries[key]
+            return None
+        return value
+
+    def _store(self, entries: "OrderedDict", key: Tuple, value: Any, now: float):
+        entries.pop(key, None)
+        entries[key] = (now, value)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get(self, catalog: str, schema: str, table: str) -> Optional[bool]:
+        """Return whether the table exists, or None if that isn't known"""
+
+        schema_key = (catalog.lower(), schema.lower())
+        with self._lock:
+            exists = self._fresh(self._tables, schema_key + (table.lower(),))
+            if exists is not None:
+                return exists
+            listing = self._fresh(self._listings, schema_key)
+            if listing is not None:
+                return table.lower() in listing
+            return None
+
+    def set_many(self, catalog: str, schema: str, exists: Mapping[str, bool]):
+        """Record whether each of the tables in a schema exists"""
+
+        schema_key = (catalog.lower(), schema.lower())
+        now = time.monotonic()
+        with self._lock:
+            for table, table_exists in exists.items():
+                self._store(
+                    self._tables, schema_key + (table.lower(),), table_exists, now
+                )
+
+    def set_listing(self, catalog: str, schema: str, tables: Iterable[str]):
+        """Record that the tables in a schema are exactly these"""
+
+        with self._lock:
+            self._store(
+                self._listings,
+                (catalog.lower(), schema.lower()),
+                frozenset(table.lower() for table in tables),
+                time.monotonic(),
+            )
+
+    def invalidate(self, catalog: str, schema: str, tables: Iterable[str]):
+        """Forget what is known about some tables, including the listing of their schema"""
+
+        schema_key = (catalog.lower(), schema.lower())
+        with self._lock:
+            self._listings.pop(schema_key, None)
+            for table in tables:
+                self._tables.pop(schema_key + (table.lower(),), None)
+
+    def clear(self):
+        """Forget everything"""
+        with self._lock:
+            self._tables.clear()
+            self._listings.clear()
+
+
+def persistent_reflection_cache(kind: str):
+    """Decorate a single-table reflection method of DatabricksDialect so its result is served from
+    the dialect's ReflectionCache while the table is unchanged.
+
+    kind
+      The name under which results are stored. Batched get_multi_* methods that return the same
+      shape of result must store them under the same kind.
+    """
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapped(self, connection, table_name, schema=None, **kw):
+            def fetch(_):
+                return {
+                    table_name: fn(self, connection, table_name, schema=schema, **kw)
+                }
+
+            results = self._with_reflection_cache(
+                connection, kind, schema, [table_name], fetch, **kw
+            )
+            return results[table_name]
+
+        return wrapped
+
+    return decorate
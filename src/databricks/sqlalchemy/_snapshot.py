@@ -0,0 +1,190 @@
+"""
+This module contains reflection snapshots: the dialect's reflection output for a schema, saved to a
+file that can be shipped alongside an application and loaded into a MetaData without connecting to
+a warehouse.
+
+A snapshot is JSON, gzip-compressed when the path ends in .gz. Column types are stored as their
+Databricks type names, the same way the persistent reflection cache stores them.
+"""
+
+import gzip
+from typing import IO, Any, Dict, List, Optional, Union
+
+from sqlalchemy import Column, Computed, Identity, MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.reflection import ObjectKind
+
+from databricks.sqlalchemy._reflection import (
+    VERSION_INFO_KEY,
+    _connect,
+    add_reflected_foreign_keys,
+    add_reflected_pk_constraint,
+)
+from databricks.sqlalchemy._reflection_cache import dumps_reflected, loads_reflected
+
+# Bump this if the layout of a snapshot changes. Loading a snapshot with a different version fails.
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+    return open(path, mode, encoding="utf-8")
+
+
+def _get_table_versions(
+    connection: Connection, schema: Optional[str], views: bool, info_cache: dict
+) -> Dict[str, str]:
+    """Return a dictionary of table name -> last_altered time for the tables (and views, if views
+    is True) in schema.
+    """
+
+    dialect = connection.dialect
+    rows = dialect._get_information_schema_tables(  # type: ignore
+        connection, schema=schema, info_cache=info_cache
+    )
+    return {
+        row.table_name: str(row.last_altered)
+        for row in rows or []
+        if views or row.table_type not in dialect.VIEW_TABLE_TYPES  # type: ignore
+    }
+
+
+def dump_reflection_snapshot(
+    bind: Union[Engine, Connection],
+    path: str,
+    schema: Optional[str] = None,
+    views: bool = False,
+) -> None:
+    """Reflect the tables in `schema` and write their columns, primary keys, foreign keys,
+    comments and table options to a snapshot file at path.
+
+    Each table's last_altered time is saved too, so check_reflection_snapshot() can tell when the
+    snapshot is out of date. Table options are only included by a dialect with
+    reflect_table_options=True.
+    """
+
+    with _connect(bind) as connection:
+        inspector = inspect(connection)
+        kind = ObjectKind.ANY if views else ObjectKind.TABLE
+
+        columns = inspector.get_multi_columns(schema, kind=kind)
+        pk_constraints = inspector.get_multi_pk_constraint(schema, kind=kind)
+        foreign_keys = inspector.get_multi_foreign_keys(schema, kind=kind)
+        comments = inspector.get_multi_table_comment(schema, kind=kind)
+        options = inspector.get_multi_table_options(schema, kind=kind)
+        versions = _get_table_versions(
+            connection, schema, views, info_cache=inspector.info_cache
+        )
+
+        tables = {}
+        for key, table_columns in columns.items():
+            table_name = key[1]
+            tables[table_name] = {
+                "version": versions.get(table_name),
+                "columns": table_columns,
+                "pk_constraint": pk_constraints[key],
+                "foreign_keys": foreign_keys[key],
+                "table_comment": comments[key],
+                "table_options": options.get(key, {}),
+            }
+
+        snapshot = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "catalog": connection.dialect._resolve_schema(schema)[0],  # type: ignore
+            "schema": schema,
+            "views": views,
+            "tables": tables,
+        }
+
+    with _open(path, "w") as f:
+        f.write(dumps_reflected(snapshot, connection.dialect))
+
+
+def _read_snapshot(path: str) -> Dict[str, Any]:
+    with _open(path, "r") as f:
+        snapshot = loads_reflected(f.read())
+
+    if snapshot.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is a version {snapshot.get('format')} reflection snapshot. "
+            f"This version of databricks-sqlalchemy reads version {SNAPSHOT_FORMAT_VERSION}."
+        )
+    return snapshot
+
+
+def _build_column(column: Dict[str, Any]) -> Column:
+    args: List[Any] = []
+    if column.get("identity") is not None:
+        args.append(Identity(**column["identity"]))
+    if column.get("computed") is not None:
+        args.append(Computed(**column["computed"]))
+
+    return Column(
+        column["name"],
+        column["type"],
+        *args,
+        nullable=column["nullable"],
+        server_default=(
+            text(column["default"]) if column.get("default") is not None else None
+        ),
+        autoincrement=column.get("autoincrement", "auto"),
+        comment=column.get("comment"),
+    )
+
+
+def load_reflection_snapshot(
+    path: str, metadata: Optional[MetaData] = None
+) -> MetaData:
+    """Build the Tables saved by dump_reflection_snapshot() into metadata (or a new MetaData) and
+    return it. This doesn't connect to a warehouse.
+    """
+
+    if metadata is None:
+        metadata = MetaData()
+
+    snapshot = _read_snapshot(path)
+    for table_name, reflected in snapshot["tables"].items():
+        columns = [_build_column(column) for column in reflected["columns"]]
+        table = Table(
+            table_name,
+            metadata,
+            *columns,
+            schema=snapshot["schema"],
+            comment=reflected["table_comment"]["text"],
+            **reflected.get("table_options", {}),
+        )
+        add_reflected_pk_constraint(table, reflected["pk_constraint"])
+        add_reflected_foreign_keys(table, reflected["foreign_keys"])
+        if reflected["version"] is not None:
+            table.info[VERSION_INFO_KEY] = reflected["version"]
+
+    return metadata
+
+
+def check_reflection_snapshot(bind: Union[Engine, Connection], path: str) -> List[str]:
+    """Return the names of the tables that were created, dropped or altered since the snapshot at
+    path was taken, with one information_schema query. An empty list means the snapshot is current.
+
+    Raises ValueError if bind would read the schema from a different catalog than the snapshot
+    was taken from.
+    """
+
+    snapshot = _read_snapshot(path)
+    with _connect(bind) as connection:
+        catalog = connection.dialect._resolve_schema(snapshot["schema"])[0]  # type: ignore
+        if catalog != snapshot["catalog"]:
+            raise ValueError(
+                f"{path} is a snapshot of catalog {snapshot['catalog']}, but this connection "
+                f"reads from catalog {catalog}"
+            )
+        current = _get_table_versions(
+            connection, snapshot["schema"], snapshot["views"], info_cache={}
+        )
+
+    saved = {name: table["version"] for name, table in snapshot["tables"].items()}
+    return sorted(
+        name
+        for name in saved.keys() | current.keys()
+        if saved.get(name) != current.get(name)
+    )
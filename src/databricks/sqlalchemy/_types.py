@@ -351,6 +351,8 @@ class DatabricksArray(UserDefinedType):
             item_processor = identity_processor
 
         def process(value):
+            if value is None:
+                return None
             return [item_processor(val) for val in value]
 
         return process
@@ -387,6 +389,8 @@ class DatabricksMap(UserDefinedType):
             value_processor = identity_processor
 
         def process(value):
+            if value is None:
+                return None
             return {
                 key_processor(key): value_processor(value)
                 for key, value in value.items()
@@ -402,6 +406,47 @@ def compile_databricks_map(type_, compiler, **kw):
     return f"MAP<{key_type},{value_type}>"
 
 
+class DatabricksStruct(UserDefinedType):
+    """
+    A custom struct type made of named fields, each of which can be any other SQLAlchemy type.
+
+    Examples:
+        DatabricksStruct([("a", Integer), ("b", String)])   -> STRUCT<a:INT,b:STRING>
+        DatabricksStruct([("tags", DatabricksArray(String))]) -> STRUCT<tags:ARRAY<STRING>>
+    """
+
+    def __init__(self, fields):
+        self.fields = [
+            (name, type_() if isinstance(type_, type) else type_)
+            for name, type_ in fields
+        ]
+
+    def bind_processor(self, dialect):
+        field_processors = {
+            name: type_.bind_processor(dialect) or identity_processor
+            for name, type_ in self.fields
+        }
+
+        def process(value):
+            if value is None:
+                return None
+            return {
+                key: field_processors.get(key, identity_processor)(val)
+                for key, val in value.items()
+            }
+
+        return process
+
+
+@compiles(DatabricksStruct, "databricks")
+def compile_databricks_struct(type_, compiler, **kw):
+    fields = ",".join(
+        f"{compiler.dialect.identifier_preparer.quote(name)}:{compiler.process(field_type, **kw)}"
+        for name, field_type in type_.fields
+    )
+    return f"STRUCT<{fields}>"
+
+
 class DatabricksVariant(UserDefinedType):
     """
     A custom variant type for storing semi-structured data including STRUCT, ARRAY, MAP, and scalar types.
@@ -1,30 +1,58 @@
-from typing import Any, List, Optional, Dict, Union
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import databricks.sqlalchemy._ddl as dialect_ddl_impl
 import databricks.sqlalchemy._types as dialect_type_impl
 from databricks import sql
 from databricks.sqlalchemy._parse import (
     _describe_table_extended_result_to_dict_list,
+    _match_schema_not_found_string,
     _match_table_not_found_string,
     build_fk_dict,
+    build_fk_dicts_from_information_schema,
     build_pk_dict,
+    build_generated_column_dicts_from_information_schema,
+    build_pk_dicts_from_information_schema,
     get_fk_strings_from_dte_output,
     get_pk_strings_from_dte_output,
     get_comment_from_dte_output,
+    get_view_text_from_dte_output,
+    get_table_options_from_dte_output,
     parse_column_info_from_tgetcolumnsresponse,
+    join_catalog_schema,
+    split_catalog_schema,
+)
+from databricks.sqlalchemy._instrumentation import ReflectionStats, instrumented
+from databricks.sqlalchemy._reflection import AUTOLOAD_INFO_KEY, DatabricksInspector
+from databricks.sqlalchemy._reflection_cache import (
+    ExistenceCache,
+    ReflectionCache,
+    persistent_reflection_cache,
 )
 
 import sqlalchemy
-from sqlalchemy import DDL, event
+from sqlalchemy import DDL, event, inspect, text
 from sqlalchemy.engine import Connection, Engine, default, reflection
 from sqlalchemy.engine.interfaces import (
     ReflectedForeignKeyConstraint,
     ReflectedPrimaryKeyConstraint,
     ReflectedColumn,
     ReflectedTableComment,
+    TableKey,
 )
-from sqlalchemy.engine.reflection import ReflectionDefaults
+from sqlalchemy.engine.reflection import ObjectKind, ObjectScope, ReflectionDefaults
 from sqlalchemy.exc import DatabaseError, SQLAlchemyError
+from sqlalchemy.schema import CreateTable, DropTable
 
 try:
     import alembic
@@ -37,7 +65,11 @@ else:
         __dialect__ = "databricks"
 
 
+import json
 import logging
+import re
+import threading
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +84,13 @@ class DatabricksDialect(default.DefaultDialect):
     preparer = dialect_ddl_impl.DatabricksIdentifierPreparer  # type: ignore
     ddl_compiler = dialect_ddl_impl.DatabricksDDLCompiler
     statement_compiler = dialect_ddl_impl.DatabricksStatementCompiler
+    inspector = DatabricksInspector
     supports_statement_cache: bool = True
     supports_multivalues_insert: bool = True
+    # Databricks has no RETURNING, so executemany() of an INSERT is batched into multi-row
+    # INSERT ... VALUES statements even without it
+    use_insertmanyvalues: bool = True
+    use_insertmanyvalues_wo_returning: bool = True
     supports_native_decimal: bool = True
     supports_sane_rowcount: bool = False
     non_native_boolean_check_constraint: bool = False
@@ -82,10 +119,199 @@ class DatabricksDialect(default.DefaultDialect):
     EMPTY_INDEX: List
     EMPTY_FK = EMPTY_INDEX = []
 
+    # The information_schema.tables table_type values that denote a view rather than a table
+    VIEW_TABLE_TYPES = ["VIEW", "MATERIALIZED_VIEW"]
+
+    def __init__(
+        self,
+        reflection_cache_path: Optional[str] = None,
+        reflection_cache_ttl: float = 3600,
+        reflection_cache_max_entries: int = 10000,
+        lazy_reflection: bool = False,
+        reflect_generated_columns: bool = False,
+        reflect_table_options: bool = False,
+        existence_cache_ttl: Optional[float] = None,
+        existence_cache_max_entries: int = 10000,
+        prewarm_schemas: Optional[Sequence[str]] = None,
+        insertmanyvalues_max_parameters: int = 256,
+        insertmanyvalues_max_statement_bytes: int = 16 * 1024 * 1024,
+        **kwargs: Any,
+    ):
+        """
+        reflection_cache_path
+          Opt in to a reflection cache that persists across processes by passing the path of a
+          local SQLite file (or ":memory:" for a cache shared by every Inspector in this process).
+          Reflected columns, constraints and comments are then only fetched from the warehouse
+          when the table's last_altered time in information_schema.tables has changed.
+
+        reflection_cache_ttl
+          Seconds after which a cached entry is refetched even if its table hasn't changed.
+
+        reflection_cache_max_entries
+          The maximum number of entries kept in the cache. The oldest entries are evicted first.
+
+        lazy_reflection
+          When True, Table(..., autoload_with=...) only reflects columns. The primary key, foreign
+          keys, comment and table options are left empty until load_deferred_reflection() is
+          called on the table, so autoloading a table never runs DESCRIBE TABLE EXTENDED for
+          constraints that aren't used. MetaData.reflect() and Inspector methods are unaffected.
+
+        reflect_generated_columns
+          When True, column reflection also queries information_schema.columns for identity and
+          generated columns, and reports them with the identity and computed keys. This costs one
+          more round trip per schema, or per table when a single table is autoloaded. Catalogs
+          without an information_schema, such as hive_metastore, are reflected without these keys.
+
+        reflect_table_options
+          When True, reflecting several tables at once, as MetaData.reflect() does, also reads each
+          table's partitioning, clustering and table properties, which costs one DESCRIBE TABLE
+          EXTENDED per table. A single autoloaded table always gets them, from the DESCRIBE that
+          reads its constraints.
+
+        existence_cache_ttl
+          Opt in to remembering the result of has_table() and has_multi_table(), whether or not the
+          table exists, for this many seconds across every Inspector and connection of the engine.
+          CREATE TABLE and DROP TABLE compiled by this dialect forget the entry for their table.
+          Tables created or dropped any other way may be reported wrongly until the entry expires.
+
+        existence_cache_max_entries
+          The maximum number of tables the existence cache remembers. The oldest are evicted first.
+
+        prewarm_schemas
+          Schemas to reflect on a background thread when the engine first connects, so the first
+          Inspector doesn't pay for it on the request path. Every table and view in each schema is
+          reflected into the reflection cache, which defaults to ":memory:" if
+          reflection_cache_path isn't given, and into the existence cache if it's enabled. List
+          None for the engine's default schema: like the reflection cache, it tells reflecting
+          schema=None apart from naming the default schema.
+
+        insertmanyvalues_max_parameters
+          The most named parameters sent with one statement when executemany() of an INSERT is
+          batched into multi-row INSERT ... VALUES statements. A batch always holds at least one
+          row, so a row with more parameters than this is sent on its own.
+
+        insertmanyvalues_max_statement_bytes
+          The most bytes of UTF-8 statement text plus bound parameter values such a batch may
+          have. Batches are sized to fit both limits, and to hold no more than
+          insertmanyvalues_page_size rows.
+        """
+
+        super().__init__(**kwargs)
+
+        self.lazy_reflection = lazy_reflection
+        self.reflect_generated_columns = reflect_generated_columns
+        self.reflect_table_options = reflect_table_options
+        # SQLAlchemy's own parameter cap leaves no room for a single row of a table wider than
+        # it, so it's turned off and the statement compiler applies this one instead
+        self.insertmanyvalues_max_parameters = 0
+        self.insertmanyvalues_max_batch_parameters = insertmanyvalues_max_parameters
+        self.insertmanyvalues_max_statement_bytes = insertmanyvalues_max_statement_bytes
+        self.reflection_stats = ReflectionStats()
+
+        self.prewarm_schemas = list(prewarm_schemas or [])
+        self._prewarm_thread: Optional[threading.Thread] = None
+        if self.prewarm_schemas and not reflection_cache_path:
+            reflection_cache_path = ":memory:"
+
+        self._reflection_cache: Optional[ReflectionCache] = None
+        if reflection_cache_path:
+            self._reflection_cache = ReflectionCache(
+                reflection_cache_path,
+                dialect=self,
+                ttl=reflection_cache_ttl,
+                max_entries=reflection_cache_max_entries,
+            )
+
+        self._existence_cache: Optional[ExistenceCache] = None
+        if existence_cache_ttl is not None:
+            self._existence_cache = ExistenceCache(
+                existence_cache_ttl, max_entries=existence_cache_max_entries
+            )
+
+        # SHOW TABLES listings has_table() keeps per connection. See _check_table_names()
+        self._connection_listings: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, str], Optional[Set[str]]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
     @classmethod
     def import_dbapi(cls):
         return sql
 
+    @classmethod
+    def engine_created(cls, engine: Engine) -> None:
+        """Called once create_engine() has built an engine for this dialect"""
+
+        dialect: DatabricksDialect = engine.dialect  # type: ignore[assignment]
+        event.listen(
+            engine, "before_cursor_execute", dialect._forget_connection_listings
+        )
+        event.listen(engine, "after_execute", dialect._forget_created_or_dropped)
+
+    def _forget_connection_listings(self, conn, *args) -> None:
+        """Any statement might create or drop a table, so drop the listings kept for its connection"""
+
+        self._connection_listings.pop(conn, None)
+
+    def _forget_created_or_dropped(
+        self, conn, clauseelement, multiparams, params, execution_options, result
+    ) -> None:
+        """Once a CREATE TABLE or DROP TABLE has run, drop the table from the existence cache,
+        honouring schema_translate_map
+        """
+
+        if not isinstance(clauseelement, (CreateTable, DropTable)):
+            return
+        table = clauseelement.element
+        schema = table.schema
+        translate_map = execution_options.get("schema_translate_map") or {}
+        if schema in translate_map:
+            schema = translate_map[schema]
+        self._forget_existence(schema, table.name)
+
+    def initialize(self, connection):
+        """Called once, on the engine's first connection"""
+
+        super().initialize(connection)
+
+        if self.prewarm_schemas:
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm,
+                args=(connection.engine,),
+                name="databricks-sqlalchemy-prewarm",
+                daemon=True,
+            )
+            self._prewarm_thread.start()
+
+    def _prewarm(self, engine: Engine) -> None:
+        """Reflect every table and view in prewarm_schemas into the dialect's caches. Runs on its
+        own thread and connection. Failures are logged, since a cold cache is only slower.
+        """
+
+        for schema in self.prewarm_schemas:
+            try:
+                with engine.connect() as connection:
+                    inspector = inspect(connection)
+                    inspector.get_multi_columns(schema, kind=ObjectKind.ANY)
+                    inspector.get_multi_pk_constraint(schema, kind=ObjectKind.ANY)
+                    inspector.get_multi_foreign_keys(schema, kind=ObjectKind.ANY)
+                    inspector.get_multi_table_comment(schema, kind=ObjectKind.ANY)
+                    if self.reflect_table_options:
+                        inspector.get_multi_table_options(schema, kind=ObjectKind.ANY)
+
+                    if self._existence_cache is not None:
+                        catalog_name, schema_name = self._resolve_schema(schema)
+                        names = self._get_existing_table_names(
+                            connection,
+                            catalog_name,
+                            schema_name,
+                            info_cache=inspector.info_cache,
+                        )
+                        self._remember_existence(catalog_name, schema_name, names)
+            except Exception:
+                logger.warning(
+                    "Could not prewarm reflection of schema %s", schema, exc_info=True
+                )
+
     def _force_paramstyle_to_native_mode(self):
         """This method can be removed after databricks-sql-connector wholly switches to NATIVE ParamApproach.
 
@@ -121,38 +347,294 @@ class DatabricksDialect(default.DefaultDialect):
 
         return [], kwargs
 
+    def _resolve_schema(self, schema: Optional[str]) -> Tuple[str, str]:
+        """Return the catalog and schema that a schema argument refers to.
+
+        A schema may be qualified with its catalog, as in "main.default", so that one engine can
+        reflect any catalog. Otherwise it's in the catalog from the connection string. None means
+        the schema from the connection string.
+        """
+
+        if schema is None:
+            return self.catalog, self.schema
+        catalog, schema = split_catalog_schema(schema)
+        return catalog or self.catalog, schema
+
+    @instrumented("get_columns")
+    @persistent_reflection_cache("columns")
     def get_columns(
         self, connection, table_name, schema=None, **kwargs
     ) -> List[ReflectedColumn]:
         """Return information about columns in `table_name`."""
 
+        catalog_name, schema_name = self._resolve_schema(schema)
         with self.get_connection_cursor(connection) as cur:
             resp = cur.columns(
-                catalog_name=self.catalog,
-                schema_name=schema or self.schema,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
                 table_name=table_name,
             ).fetchall()
+        self.reflection_stats.record_round_trip(len(resp))
 
         if not resp:
             # TGetColumnsRequest will not raise an exception if passed a table that doesn't exist
             # But Databricks supports tables with no columns. So if the result is an empty list,
             # we need to check if the table exists (and raise an exception if not) or simply return
             # an empty list.
-            self._describe_table_extended(
-                connection,
-                table_name,
-                self.catalog,
-                schema or self.schema,
-                expect_result=False,
-            )
+            self._get_table_description(connection, table_name, schema=schema, **kwargs)
             return resp
         columns = []
         for col in resp:
             row_dict = parse_column_info_from_tgetcolumnsresponse(col)
             columns.append(row_dict)
 
+        self._add_generated_column_info(
+            connection, schema, {table_name: columns}, table_name=table_name, **kwargs
+        )
         return columns
 
+    @reflection.cache
+    def _get_columns_by_table(
+        self,
+        connection,
+        schema: Optional[str] = None,
+        table_name_pattern: Optional[str] = None,
+        **kw: Any,
+    ) -> Dict[str, List[ReflectedColumn]]:
+        """Fetch the columns of every table in `schema` with a single TGetColumnsRequest.
+
+        Returns a dictionary of table name -> list of ReflectedColumn. Passing table_name=None makes the
+        request a wildcard over the whole schema. The rows are the same ones get_columns fetches one table
+        at a time, so each is parsed with parse_column_info_from_tgetcolumnsresponse exactly as before.
+        """
+
+        catalog_name, schema_name = self._resolve_schema(schema)
+        with self.get_connection_cursor(connection) as cur:
+            resp = cur.columns(
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                table_name=table_name_pattern,
+            ).fetchall()
+        self.reflection_stats.record_round_trip(len(resp))
+
+        columns_by_table: Dict[str, List[ReflectedColumn]] = {}
+        for col in resp:
+            row_dict = parse_column_info_from_tgetcolumnsresponse(col)
+            columns_by_table.setdefault(col.TABLE_NAME, []).append(row_dict)
+
+        self._add_generated_column_info(
+            connection, schema, columns_by_table, table_name=table_name_pattern, **kw
+        )
+        return columns_by_table
+
+    def _add_generated_column_info(
+        self,
+        connection: Connection,
+        schema: Optional[str],
+        columns_by_table: Dict[str, List[ReflectedColumn]],
+        table_name: Optional[str] = None,
+        **kw: Any,
+    ) -> None:
+        """Add the identity and computed keys to the identity and generated columns in
+        columns_by_table, in place.
+
+        TGetColumnsResponse doesn't mark these columns, so this runs one information_schema.columns
+        query for the whole schema, or for table_name only if it's given. It does nothing unless
+        the dialect was created with reflect_generated_columns=True.
+        """
+
+        if not self.reflect_generated_columns or not any(columns_by_table.values()):
+            return
+
+        extra_by_table = self._get_generated_columns_by_table(
+            connection, schema=schema, table_name=table_name, **kw
+        )
+        for name, columns in columns_by_table.items():
+            extras = extra_by_table.get(name, {})
+            for column in columns:
+                column.update(extras.get(column["name"], {}))  # type: ignore
+
+    @reflection.cache
+    def _get_generated_columns_by_table(
+        self,
+        connection: Connection,
+        schema: Optional[str] = None,
+        table_name: Optional[str] = None,
+        **kw: Any,
+    ) -> Dict[str, Dict[str, dict]]:
+        """Fetch the identity and generated columns of every table in `schema` with one
+        information_schema query.
+
+        Returns a dictionary of table name -> column name -> the keys to add to its ReflectedColumn.
+        If table_name is passed, only that table's columns are fetched. The dictionary is empty if
+        the catalog has no information_schema.
+        """
+
+        table_filter = "AND table_name = :table_name" if table_name else ""
+        stmt = text(
+            f"""
+            SELECT table_name, column_name, is_identity, identity_generation,
+                   identity_start, identity_increment, identity_minimum, identity_maximum,
+                   identity_cycle, is_generated, generation_expression
+            FROM {self._information_schema_target(schema)}.columns
+            WHERE table_schema = :schema
+              AND (is_identity = 'YES' OR is_generated = 'ALWAYS')
+              {table_filter}
+            """
+        )
+        params = self._information_schema_params(schema, table_name=table_name)
+        result = self._query_information_schema(connection, stmt, params)
+        if result is None:
+            return {}
+        return build_generated_column_dicts_from_information_schema(result)
+
+    def _query_information_schema(
+        self, connection: Connection, stmt, params: Dict[str, Any]
+    ) -> Optional[Sequence[Any]]:
+        """Run a query against information_schema and return its rows, or None if the catalog has
+        no information_schema, like hive_metastore outside Unity Catalog.
+        """
+
+        try:
+            rows = connection.execute(stmt, params).all()
+        except DatabaseError as e:
+            message = str(e)
+            if _match_table_not_found_string(message) or _match_schema_not_found_string(
+                message
+            ):
+                self.reflection_stats.record_round_trip()
+                return None
+            raise e
+        self.reflection_stats.record_round_trip(len(rows))
+        return rows
+
+    def _get_multi_reflection_names(
+        self,
+        connection,
+        schema: Optional[str],
+        filter_names: Optional[Collection[str]],
+        scope: ObjectScope,
+        kind: ObjectKind,
+        **kw: Any,
+    ) -> List[str]:
+        """Return the names of the objects a get_multi_* method should yield results for.
+
+        This follows the same rules as DefaultDialect._default_multi_reflect, so the batched
+        implementations reflect exactly the tables and views the per-table fallbacks would have.
+        """
+
+        if filter_names and scope is ObjectScope.ANY and kind is ObjectKind.ANY:
+            # Table(..., autoload_with=...) passes the names through unverified. Names that
+            # don't exist are dropped by the get_multi_* method that consumes this list.
+            return list(filter_names)
+
+        names_fns = []
+        if ObjectScope.DEFAULT in scope:
+            if ObjectKind.TABLE in kind:
+                names_fns.append(self.get_table_names)
+            if ObjectKind.VIEW in kind:
+                names_fns.append(self.get_view_names)
+            if ObjectKind.MATERIALIZED_VIEW in kind:
+                names_fns.append(self.get_materialized_view_names)
+        if ObjectScope.TEMPORARY in scope and ObjectKind.VIEW in kind:
+            names_fns.append(self.get_temp_view_names)
+
+        # SHOW VIEWS lists temporary and materialized views too, so a name can come back twice
+        names: Dict[str, None] = {}
+        for fn in names_fns:
+            names.update(dict.fromkeys(fn(connection, schema=schema, **kw)))
+
+        if filter_names:
+            _filter = set(filter_names)
+            return [name for name in names if name in _filter]
+
+        return list(names)
+
+    def _autoloading_lazily(self, kw: Dict[str, Any]) -> bool:
+        """Whether a get_multi_* call is part of a Table autoload that lazy_reflection defers"""
+
+        info_cache = kw.get("info_cache") or {}
+        return self.lazy_reflection and info_cache.get(AUTOLOAD_INFO_KEY, False)
+
+    def _reflect_each(
+        self,
+        method,
+        connection: Connection,
+        schema: Optional[str],
+        names: List[str],
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, Any]]:
+        """Call a single-table reflection method for each of names, skipping tables that don't
+        exist.
+
+        Table(..., autoload_with=...) reflects one table. Its primary key, foreign keys, comment
+        and options are then read from one memoised DESCRIBE TABLE EXTENDED rather than from a
+        query against information_schema for each of them.
+        """
+
+        for table_name in names:
+            try:
+                result = method(connection, table_name, schema=schema, **kw)
+            except sqlalchemy.exc.NoSuchTableError:
+                continue
+            yield (schema, table_name), result
+
+    @instrumented("get_multi_columns")
+    def get_multi_columns(
+        self,
+        connection,
+        *,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        kind: ObjectKind = ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, List[ReflectedColumn]]]:
+        """Return information about columns in all tables in `schema`.
+
+        SQLAlchemy's default implementation calls get_columns once per table, which costs one
+        TGetColumnsRequest per table. Here the whole schema is fetched in one request.
+        """
+
+        kw.pop("unreflectable", None)
+        names = self._get_multi_reflection_names(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        if not names:
+            return
+
+        def fetch(missing: List[str]) -> Dict[str, List[ReflectedColumn]]:
+            # Autoloading a single table shouldn't pull the columns of the whole schema
+            columns_by_table = self._get_columns_by_table(
+                connection,
+                schema=schema,
+                table_name_pattern=missing[0] if len(missing) == 1 else None,
+                info_cache=kw.get("info_cache"),
+            )
+
+            fetched = {}
+            for table_name in missing:
+                if table_name in columns_by_table:
+                    fetched[table_name] = columns_by_table[table_name]
+                    continue
+
+                # Either the table has no columns or the name was never verified (see
+                # _get_multi_reflection_names). get_columns tells these two cases apart.
+                try:
+                    fetched[table_name] = self.get_columns(
+                        connection, table_name, schema=schema, **kw
+                    )
+                except sqlalchemy.exc.NoSuchTableError:
+                    pass
+            return fetched
+
+        columns = self._with_reflection_cache(
+            connection, "columns", schema, names, fetch, **kw
+        )
+        for table_name in names:
+            if table_name in columns:
+                yield (schema, table_name), columns[table_name]
+
     def _describe_table_extended(
         self,
         connection: Connection,
@@ -188,12 +670,60 @@ class DatabricksDialect(default.DefaultDialect):
             raise e
 
         if not expect_result:
+            self.reflection_stats.record_round_trip()
             return None
 
         fmt_result = _describe_table_extended_result_to_dict_list(result)
+        self.reflection_stats.record_round_trip(len(fmt_result))
         return fmt_result
 
+    @instrumented("describe_table_extended")
+    def _get_table_description(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: Optional[str] = None,
+        catalog: Optional[str] = None,
+        **kw: Any,
+    ) -> List[Dict[str, str]]:
+        """Return the DESCRIBE TABLE EXTENDED rows for a table, running the statement at most once per inspection.
+
+        The primary key, foreign key, comment and existence lookups all read the same output, so it
+        is memoised in the Inspector's info_cache keyed by catalog, schema and table name.
+
+        Raises NoSuchTableError if the table is not present in the schema.
+        """
+
+        catalog_name, schema_name = self._resolve_schema(schema)
+        return self._describe_table_extended_memo(
+            connection,
+            table_name=table_name,
+            catalog_name=catalog or catalog_name,
+            schema_name=schema_name,
+            info_cache=kw.get("info_cache"),
+        )
+
     @reflection.cache
+    def _describe_table_extended_memo(
+        self,
+        connection: Connection,
+        table_name: str,
+        catalog_name: str,
+        schema_name: str,
+        **kw: Any,
+    ) -> List[Dict[str, str]]:
+        """A wrapper around _describe_table_extended that SQLAlchemy's reflection cache can key on.
+        Call _get_table_description instead, which fills in the default catalog and schema first.
+        """
+        return self._describe_table_extended(  # type: ignore
+            connection=connection,
+            table_name=table_name,
+            catalog_name=catalog_name,
+            schema_name=schema_name,
+        )
+
+    @reflection.cache
+    @persistent_reflection_cache("pk_constraint")
     def get_pk_constraint(
         self,
         connection,
@@ -212,14 +742,12 @@ class DatabricksDialect(default.DefaultDialect):
               the name of the primary key constraint
         """
 
-        result = self._describe_table_extended(
-            connection=connection,
-            table_name=table_name,
-            schema_name=schema,
+        result = self._get_table_description(
+            connection, table_name, schema=schema, **kw
         )
 
-        # Type ignore is because mypy knows that self._describe_table_extended *can*
-        # return None (even though it never will since expect_result defaults to True)
+        # Type ignore is because get_pk_strings_from_dte_output is annotated as Optional
+        # (even though it always returns a list)
         raw_pk_constraints: List = get_pk_strings_from_dte_output(result)  # type: ignore
         if not any(raw_pk_constraints):
             return self.EMPTY_PK  # type: ignore
@@ -238,20 +766,18 @@ class DatabricksDialect(default.DefaultDialect):
         # TODO: figure out how to return sqlalchemy.interfaces in a way that mypy respects
         return build_pk_dict(pk_name, pk_constraint_string)  # type: ignore
 
+    @reflection.cache
+    @persistent_reflection_cache("foreign_keys")
     def get_foreign_keys(
         self, connection, table_name, schema=None, **kw
     ) -> List[ReflectedForeignKeyConstraint]:
         """Return information about foreign_keys in `table_name`."""
 
-        result = self._describe_table_extended(
-            connection=connection,
-            table_name=table_name,
-            schema_name=schema,
+        result = self._get_table_description(
+            connection, table_name, schema=schema, **kw
         )
 
-        # Type ignore is because mypy knows that self._describe_table_extended *can*
-        # return None (even though it never will since expect_result defaults to True)
-        raw_fk_constraints: List = get_fk_strings_from_dte_output(result)  # type: ignore
+        raw_fk_constraints: List = get_fk_strings_from_dte_output(result)
 
         if not any(raw_fk_constraints):
             return self.EMPTY_FK
@@ -261,38 +787,429 @@ class DatabricksDialect(default.DefaultDialect):
             fk_name = constraint_dict.get("col_name")
             fk_constraint_string = constraint_dict.get("data_type")
             this_constraint_dict = build_fk_dict(
-                fk_name, fk_constraint_string, schema_name=schema
+                fk_name,
+                fk_constraint_string,
+                schema_name=schema,
+                catalog_name=self._resolve_schema(schema)[0],
             )
             fk_constraints.append(this_constraint_dict)
 
+        self._qualify_referred_schemas(fk_constraints, schema)
+
         # TODO: figure out how to return sqlalchemy.interfaces in a way that mypy respects
         return fk_constraints  # type: ignore
 
+    def _information_schema_target(self, schema: Optional[str] = None) -> str:
+        """Return the information_schema of the catalog that `schema` is in, quoted for use in a
+        FROM clause
+        """
+        catalog_name, _ = self._resolve_schema(schema)
+        return f"{self.identifier_preparer.quote_identifier(catalog_name)}.information_schema"
+
+    def _information_schema_params(
+        self, schema: Optional[str], **names: Optional[str]
+    ) -> Dict[str, str]:
+        """Return the bind parameters of a query against information_schema: the name of `schema`,
+        and each of names that isn't None. Unity Catalog stores identifiers lowercased, so they're
+        lowercased to match however the caller spelled them.
+        """
+
+        params = {"schema": self._resolve_schema(schema)[1].lower()}
+        params.update((key, name.lower()) for key, name in names.items() if name)
+        return params
+
+    @reflection.cache
+    def _get_pk_constraints_by_table(
+        self,
+        connection: Connection,
+        schema: Optional[str] = None,
+        table_name: Optional[str] = None,
+        **kw: Any,
+    ) -> Optional[Dict[str, dict]]:
+        """Fetch the primary key constraints of every table in `schema` with one information_schema query.
+
+        Returns a dictionary of table name -> primary key dictionary. If table_name is passed, only that
+        table's constraint is fetched. Returns None if the catalog has no information_schema.
+        """
+
+        _info_schema = self._information_schema_target(schema)
+        table_filter = "AND tc.table_name = :table_name" if table_name else ""
+        stmt = text(
+            f"""
+            SELECT tc.table_name, tc.constraint_name, kcu.column_name
+            FROM {_info_schema}.table_constraints AS tc
+            JOIN {_info_schema}.key_column_usage AS kcu
+              ON tc.constraint_catalog = kcu.constraint_catalog
+             AND tc.constraint_schema = kcu.constraint_schema
+             AND tc.constraint_name = kcu.constraint_name
+            WHERE tc.table_schema = :schema
+              AND tc.constraint_type = 'PRIMARY KEY'
+              {table_filter}
+            ORDER BY tc.table_name, kcu.ordinal_position
+            """
+        )
+        params = self._information_schema_params(schema, table_name=table_name)
+        result = self._query_information_schema(connection, stmt, params)
+        if result is None:
+            return None
+        return build_pk_dicts_from_information_schema(result)
+
+    @reflection.cache
+    def _get_foreign_keys_by_table(
+        self,
+        connection: Connection,
+        schema: Optional[str] = None,
+        table_name: Optional[str] = None,
+        **kw: Any,
+    ) -> Optional[Dict[str, List[dict]]]:
+        """Fetch the foreign key constraints of every table in `schema` with one information_schema query.
+
+        Returns a dictionary of table name -> list of foreign key dictionaries. If table_name is passed,
+        only that table's constraints are fetched. Returns None if the catalog has no
+        information_schema.
+        """
+
+        _info_schema = self._information_schema_target(schema)
+        table_filter = "AND kcu.table_name = :table_name" if table_name else ""
+        stmt = text(
+            f"""
+            SELECT kcu.table_name, rc.constraint_name, kcu.column_name,
+                   ref.table_schema AS referred_schema,
+                   ref.table_name AS referred_table,
+                   ref.column_name AS referred_column
+            FROM {_info_schema}.referential_constraints AS rc
+            JOIN {_info_schema}.key_column_usage AS kcu
+              ON rc.constraint_catalog = kcu.constraint_catalog
+             AND rc.constraint_schema = kcu.constraint_schema
+             AND rc.constraint_name = kcu.constraint_name
+            LEFT JOIN {_info_schema}.key_column_usage AS ref
+              ON rc.unique_constraint_catalog = ref.constraint_catalog
+             AND rc.unique_constraint_schema = ref.constraint_schema
+             AND rc.unique_constraint_name = ref.constraint_name
+             AND kcu.position_in_unique_constraint = ref.ordinal_position
+            WHERE kcu.table_schema = :schema
+              {table_filter}
+            ORDER BY kcu.table_name, rc.constraint_name, kcu.ordinal_position
+            """
+        )
+        params = self._information_schema_params(schema, table_name=table_name)
+        result = self._query_information_schema(connection, stmt, params)
+        if result is None:
+            return None
+        fk_by_table = build_fk_dicts_from_information_schema(result, schema_name=schema)
+        for fks in fk_by_table.values():
+            self._qualify_referred_schemas(fks, schema)
+
+        # A referred table in another catalog isn't in this catalog's information_schema, so
+        # it has no match in ref. DESCRIBE TABLE EXTENDED names its catalog.
+        for name in {row.table_name for row in result if row.referred_table is None}:
+            fk_by_table[name] = self.get_foreign_keys(
+                connection, name, schema=schema, **kw
+            )
+        return fk_by_table
+
+    def _qualify_referred_schemas(
+        self, foreign_keys: List[dict], schema: Optional[str]
+    ) -> None:
+        """If `schema` is qualified with its catalog, qualify each foreign key's referred schema with
+        the same catalog, so referred tables are looked up in that catalog too.
+        """
+
+        catalog_name, _ = split_catalog_schema(schema) if schema else (None, None)
+        if catalog_name is None:
+            return
+        for fk in foreign_keys:
+            referred_schema = fk["referred_schema"]
+            # A referred schema in another catalog is qualified already
+            if (
+                referred_schema is not None
+                and split_catalog_schema(referred_schema)[0] is None
+            ):
+                fk["referred_schema"] = join_catalog_schema(
+                    catalog_name, fk["referred_schema"]
+                )
+
+    def get_multi_pk_constraint(
+        self,
+        connection,
+        *,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        kind: ObjectKind = ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, ReflectedPrimaryKeyConstraint]]:
+        """Return information about the primary key constraint of all tables in `schema`.
+
+        SQLAlchemy's default implementation calls get_pk_constraint once per table, which runs
+        DESCRIBE TABLE EXTENDED once per table. Here the whole schema is read from information_schema.
+        """
+
+        kw.pop("unreflectable", None)
+        names = self._get_multi_reflection_names(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        if not names:
+            return
+
+        if self._autoloading_lazily(kw):
+            # The primary key is reflected on demand by load_deferred_reflection()
+            for table_name in names:
+                yield (schema, table_name), ReflectionDefaults.pk_constraint()
+            return
+
+        if filter_names and len(names) == 1:
+            yield from self._reflect_each(
+                self.get_pk_constraint, connection, schema, names, **kw
+            )
+            return
+
+        def fetch(missing: List[str]) -> Dict[str, dict]:
+            pk_by_table = self._get_pk_constraints_by_table(
+                connection,
+                schema=schema,
+                table_name=missing[0] if len(missing) == 1 else None,
+                info_cache=kw.get("info_cache"),
+            )
+            if pk_by_table is None:
+                return dict(
+                    (table_name, pk)
+                    for (_, table_name), pk in self._reflect_each(
+                        self.get_pk_constraint, connection, schema, missing, **kw
+                    )
+                )
+            return {
+                name: pk_by_table.get(name.lower(), self.EMPTY_PK) for name in missing
+            }
+
+        pk_constraints = self._with_reflection_cache(
+            connection, "pk_constraint", schema, names, fetch, **kw
+        )
+        for table_name in names:
+            yield (schema, table_name), pk_constraints[table_name]
+
+    def get_multi_foreign_keys(
+        self,
+        connection,
+        *,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        kind: ObjectKind = ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, List[ReflectedForeignKeyConstraint]]]:
+        """Return information about foreign_keys in all tables in `schema`.
+
+        SQLAlchemy's default implementation calls get_foreign_keys once per table, which runs
+        DESCRIBE TABLE EXTENDED once per table. Here the whole schema is read from information_schema.
+        """
+
+        kw.pop("unreflectable", None)
+        names = self._get_multi_reflection_names(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        if not names:
+            return
+
+        if self._autoloading_lazily(kw):
+            # The foreign keys are reflected on demand by load_deferred_reflection()
+            for table_name in names:
+                yield (schema, table_name), ReflectionDefaults.foreign_keys()
+            return
+
+        if filter_names and len(names) == 1:
+            yield from self._reflect_each(
+                self.get_foreign_keys, connection, schema, names, **kw
+            )
+            return
+
+        def fetch(missing: List[str]) -> Dict[str, List[dict]]:
+            fk_by_table = self._get_foreign_keys_by_table(
+                connection,
+                schema=schema,
+                table_name=missing[0] if len(missing) == 1 else None,
+                info_cache=kw.get("info_cache"),
+            )
+            if fk_by_table is None:
+                return dict(
+                    (table_name, fks)
+                    for (_, table_name), fks in self._reflect_each(
+                        self.get_foreign_keys, connection, schema, missing, **kw
+                    )
+                )
+            return {
+                name: fk_by_table.get(name.lower(), self.EMPTY_FK) for name in missing
+            }
+
+        foreign_keys = self._with_reflection_cache(
+            connection, "foreign_keys", schema, names, fetch, **kw
+        )
+        for table_name in names:
+            yield (schema, table_name), foreign_keys[table_name]
+
     def get_indexes(self, connection, table_name, schema=None, **kw):
         """SQLAlchemy requires this method. Databricks doesn't support indexes."""
         return self.EMPTY_INDEX
 
     @reflection.cache
-    def get_table_names(self, connection: Connection, schema=None, **kwargs):
-        """Return a list of tables in the current schema."""
+    def _get_information_schema_tables(
+        self, connection: Connection, schema: Optional[str] = None, **kw: Any
+    ) -> Optional[Sequence[Any]]:
+        """Return the information_schema.tables rows for every table and view in `schema`, or None
+        if the catalog has no information_schema.
 
-        _target_catalog = self.catalog
-        _target_schema = schema or self.schema
-        _target = f"`{_target_catalog}`.`{_target_schema}`"
+        One query serves get_table_names, get_view_names, get_materialized_view_names and
+        get_multi_table_comment, which tell the objects apart by their table_type.
+        """
 
-        stmt = DDL(f"SHOW TABLES FROM {_target}")
+        stmt = text(
+            f"""
+            SELECT table_name, table_type, comment, last_altered
+            FROM {self._information_schema_target(schema)}.tables
+            WHERE table_schema = :schema
+            ORDER BY table_name
+            """
+        )
+        return self._query_information_schema(
+            connection, stmt, self._information_schema_params(schema)
+        )
 
-        tables_result = connection.execute(stmt).all()
-        views_result = self.get_view_names(connection=connection, schema=schema)
+    @reflection.cache
+    def _show_table_types(
+        self, connection: Connection, schema: Optional[str] = None, **kw: Any
+    ) -> Dict[str, str]:
+        """Return a dictionary of table name -> table_type for every table and view in `schema`,
+        from SHOW TABLES and SHOW VIEWS. Used for catalogs that have no information_schema, which
+        don't tell tables apart beyond views and materialized views.
+        """
 
-        # In Databricks, SHOW TABLES FROM <schema> returns both tables and views.
-        # Potential optimisation: rewrite this to instead query information_schema
-        tables_minus_views = [
-            row.tableName for row in tables_result if row.tableName not in views_result
+        _target_catalog, _target_schema = self._resolve_schema(schema)
+        _target = f"`{_target_catalog}`.`{_target_schema}`"
+
+        tables = connection.execute(DDL(f"SHOW TABLES FROM {_target}")).all()
+        self.reflection_stats.record_round_trip(len(tables))
+        views = connection.execute(DDL(f"SHOW VIEWS FROM {_target}")).all()
+        self.reflection_stats.record_round_trip(len(views))
+
+        # Temporary views aren't listed by information_schema either
+        table_types = {row.tableName: "TABLE" for row in tables if not row.isTemporary}
+        for row in views:
+            if not row.isTemporary:
+                table_types[row.viewName] = (
+                    "MATERIALIZED_VIEW" if row.isMaterialized else "VIEW"
+                )
+        return table_types
+
+    def _get_names_by_table_type(
+        self,
+        connection: Connection,
+        schema: Optional[str],
+        table_types: Collection[str],
+        exclude: bool = False,
+        **kw: Any,
+    ) -> List[str]:
+        """Return the names of the objects in `schema` whose table_type is (or with exclude=True, isn't)
+        one of table_types.
+        """
+
+        info_cache = kw.get("info_cache")
+        rows = self._get_information_schema_tables(
+            connection, schema=schema, info_cache=info_cache
+        )
+        if rows is not None:
+            types = {row.table_name: row.table_type for row in rows}
+        else:
+            types = self._show_table_types(
+                connection, schema=schema, info_cache=info_cache
+            )
+        return [
+            name
+            for name, table_type in types.items()
+            if (table_type in table_types) ^ exclude
         ]
 
-        return tables_minus_views
+    def _get_table_versions(
+        self, connection: Connection, schema: Optional[str] = None, **kw: Any
+    ) -> Optional[Dict[str, str]]:
+        """Return a dictionary of table name -> the table's last_altered time, as a string, or None
+        if the catalog has no information_schema.
+
+        Any change to a Delta table, including to its columns, constraints or comment, moves its
+        last_altered time. So this identifies a version of the table's reflected metadata.
+        """
+
+        rows = self._get_information_schema_tables(
+            connection, schema=schema, info_cache=kw.get("info_cache")
+        )
+        if rows is None:
+            return None
+        return {row.table_name: str(row.last_altered) for row in rows}
+
+    def _with_reflection_cache(
+        self,
+        connection: Connection,
+        kind: str,
+        schema: Optional[str],
+        table_names: List[str],
+        fetch,
+        **kw: Any,
+    ) -> Dict[str, Any]:
+        """Return a dictionary of table name -> reflection result of this kind for table_names.
+
+        If the reflection cache is enabled, results for tables that haven't changed are served from
+        it and fetch is only called with the names that missed. fetch must return a dictionary of
+        table name -> result, omitting any table that doesn't exist.
+        """
 
+        if self._reflection_cache is None:
+            return fetch(table_names)
+
+        versions = self._get_table_versions(connection, schema=schema, **kw) or {}
+
+        # Temporary views aren't in information_schema so they're never cached
+        keys = {
+            name: self._reflection_cache_key(kind, schema, name.lower())
+            for name in table_names
+            if name.lower() in versions
+        }
+        key_versions = {key: versions[name.lower()] for name, key in keys.items()}
+        hits = self._reflection_cache.get_many(key_versions)
+
+        results = {name: hits[key] for name, key in keys.items() if key in hits}
+        missing = [name for name in table_names if name not in results]
+        if missing:
+            fetched = fetch(missing)
+            self._reflection_cache.set_many(
+                {keys[name]: fetched[name] for name in fetched if name in keys},
+                key_versions,
+            )
+            results.update(fetched)
+
+        return results
+
+    def _reflection_cache_key(
+        self, kind: str, schema: Optional[str], table_name: str
+    ) -> str:
+        """Return the key of a reflection result in the reflection cache.
+
+        Whether a schema was passed is part of the key because foreign keys report
+        referred_schema=None when it wasn't.
+        """
+        catalog_name, schema_name = self._resolve_schema(schema)
+        return json.dumps([kind, catalog_name, schema_name, table_name, schema is None])
+
+    @instrumented("get_table_names")
+    @reflection.cache
+    def get_table_names(self, connection: Connection, schema=None, **kwargs):
+        """Return a list of tables in the current schema."""
+
+        # In Databricks, SHOW TABLES FROM <schema> returns both tables and views.
+        # information_schema.tables tells them apart by table_type in a single query.
+        return self._get_names_by_table_type(
+            connection, schema, self.VIEW_TABLE_TYPES, exclude=True, **kwargs
+        )
+
+    @instrumented("get_view_names")
     @reflection.cache
     def get_view_names(
         self,
@@ -304,33 +1221,133 @@ class DatabricksDialect(default.DefaultDialect):
     ) -> List[str]:
         """Returns a list of string view names contained in the schema, if any."""
 
-        _target_catalog = self.catalog
-        _target_schema = schema or self.schema
+        if not only_temp:
+            table_types = (
+                ["MATERIALIZED_VIEW"] if only_materialized else self.VIEW_TABLE_TYPES
+            )
+            return self._get_names_by_table_type(
+                connection, schema, table_types, **kwargs
+            )
+
+        # Temporary views are scoped to the session so information_schema doesn't list them
+        _target_catalog, _target_schema = self._resolve_schema(schema)
         _target = f"`{_target_catalog}`.`{_target_schema}`"
 
         stmt = DDL(f"SHOW VIEWS FROM {_target}")
         result = connection.execute(stmt).all()
+        self.reflection_stats.record_round_trip(len(result))
 
-        return [
-            row.viewName
-            for row in result
-            if (not only_materialized or row.isMaterialized)
-            and (not only_temp or row.isTemporary)
-        ]
+        return [row.viewName for row in result if row.isTemporary]
+
+    @reflection.cache
+    def get_view_definition(
+        self,
+        connection: Connection,
+        view_name: str,
+        schema: Optional[str] = None,
+        **kw: Any,
+    ) -> str:
+        """Return the body of a view or materialized view.
+
+        Within an Inspector this reads from one information_schema.views query per schema, so
+        fetching the definitions of many views costs one round trip. Otherwise it queries only the
+        one view. Temporary views aren't in information_schema, so they raise NoSuchTableError.
+
+        If the catalog has no information_schema, the body is read from the view's DESCRIBE TABLE
+        EXTENDED output instead.
+        """
+
+        definitions: Optional[Dict[str, str]]
+        if kw.get("info_cache") is not None:
+            definitions = self._get_view_definitions(connection, schema=schema, **kw)
+        else:
+            definitions = self._query_view_definitions(
+                connection, schema, view_name=view_name
+            )
+        if definitions is None:
+            return self._describe_view_definition(connection, view_name, schema, **kw)
+
+        try:
+            return definitions[view_name.lower()]
+        except KeyError:
+            raise sqlalchemy.exc.NoSuchTableError(f"No such view {view_name}") from None
+
+    @reflection.cache
+    def _get_view_definitions(
+        self, connection: Connection, schema: Optional[str] = None, **kw: Any
+    ) -> Dict[str, str]:
+        """Return a dictionary of lowercased view name -> definition for every view in `schema`,
+        from one information_schema.views query.
+
+        If the catalog has no information_schema, each view is described on its own instead.
+        """
+
+        definitions = self._query_view_definitions(connection, schema)
+        if definitions is not None:
+            return definitions
+
+        return {
+            name.lower(): self._describe_view_definition(connection, name, schema, **kw)
+            for name in self.get_view_names(connection, schema=schema, **kw)
+        }
+
+    def _query_view_definitions(
+        self,
+        connection: Connection,
+        schema: Optional[str],
+        view_name: Optional[str] = None,
+    ) -> Optional[Dict[str, str]]:
+        """Query information_schema.views for the definitions of the views in `schema`, or of only
+        view_name if it's given. Call get_view_definition or _get_view_definitions instead.
+
+        Returns None if the catalog has no information_schema.
+        """
+
+        params = self._information_schema_params(schema, view_name=view_name)
+        stmt = f"""
+            SELECT table_name, view_definition
+            FROM {self._information_schema_target(schema)}.views
+            WHERE table_schema = :schema
+            """
+        if view_name is not None:
+            stmt += " AND table_name = :view_name"
+
+        rows = self._query_information_schema(connection, text(stmt), params)
+        if rows is None:
+            return None
+        return {row.table_name.lower(): row.view_definition for row in rows}
+
+    def _describe_view_definition(
+        self,
+        connection: Connection,
+        view_name: str,
+        schema: Optional[str] = None,
+        **kw: Any,
+    ) -> str:
+        """Read the body of a view from its DESCRIBE TABLE EXTENDED output.
+
+        Raises NoSuchTableError if view_name doesn't exist or isn't a view.
+        """
+
+        result = self._get_table_description(connection, view_name, schema, **kw)
+        definition = get_view_text_from_dte_output(result)
+        if definition is None:
+            raise sqlalchemy.exc.NoSuchTableError(f"No such view {view_name}")
+        return definition
 
     @reflection.cache
     def get_materialized_view_names(
         self, connection: Connection, schema: Optional[str] = None, **kw: Any
     ) -> List[str]:
         """A wrapper around get_view_names that fetches only the names of materialized views"""
-        return self.get_view_names(connection, schema, only_materialized=True)
+        return self.get_view_names(connection, schema, only_materialized=True, **kw)
 
     @reflection.cache
     def get_temp_view_names(
         self, connection: Connection, schema: Optional[str] = None, **kw: Any
     ) -> List[str]:
         """A wrapper around get_view_names that fetches only the names of temporary views"""
-        return self.get_view_names(connection, schema, only_temp=True)
+        return self.get_view_names(connection, schema, only_temp=True, **kw)
 
     def do_rollback(self, dbapi_connection):
         # Databricks SQL Does not support transactions
@@ -355,24 +1372,195 @@ class DatabricksDialect(default.DefaultDialect):
         except Exception:
             return False
 
+    @instrumented("has_table")
     @reflection.cache
     def has_table(
         self, connection, table_name, schema=None, catalog=None, **kwargs
     ) -> bool:
         """For internal dialect use, check the existence of a particular table
         or view in the database.
+
+        Within an Inspector this reads from one SHOW TABLES listing per schema, so checking many
+        tables costs one round trip. Otherwise it lists only the tables whose name matches.
         """
 
-        try:
-            self._describe_table_extended(
-                connection=connection,
-                table_name=table_name,
-                catalog_name=catalog,
-                schema_name=schema,
+        _target_catalog, _target_schema = self._resolve_schema(schema)
+        _target_catalog = catalog or _target_catalog
+
+        if self._existence_cache is not None:
+            cached = self._existence_cache.get(
+                _target_catalog, _target_schema, table_name
             )
-            return True
-        except sqlalchemy.exc.NoSuchTableError as e:
-            return False
+            if cached is not None:
+                return cached
+
+        if kwargs.get("info_cache") is not None:
+            names = self._get_existing_table_names(
+                connection, _target_catalog, _target_schema, **kwargs
+            )
+            self._remember_existence(_target_catalog, _target_schema, names)
+        else:
+            names = self._check_table_names(
+                connection, _target_catalog, _target_schema, table_name
+            )
+
+        return table_name.lower() in names
+
+    def _check_table_names(
+        self,
+        connection: Connection,
+        catalog_name: str,
+        schema_name: str,
+        table_name: str,
+    ) -> Set[str]:
+        """Run SHOW TABLES for has_table() outside an Inspector and return the lowercased names.
+
+        A single check lists only table_name. create_all() and drop_all() on SQLAlchemy 2.0 call
+        has_table() once per table though, so a second check of a schema on the same connection
+        lists the whole schema and keeps it for the checks after it. The next statement executed
+        on the connection forgets it.
+        """
+
+        schema_key = (catalog_name.lower(), schema_name.lower())
+        listings = dict(self._connection_listings.get(connection, {}))
+        listing = listings.get(schema_key)
+        if listing is not None:
+            return listing
+
+        checked_before = schema_key in listings
+        names = self._show_table_names(
+            connection,
+            catalog_name,
+            schema_name,
+            like=None if checked_before else table_name,
+        )
+
+        # SHOW TABLES itself forgot the connection's listings, so put them back
+        listings[schema_key] = names if checked_before else None
+        self._connection_listings[connection] = listings
+
+        if checked_before:
+            self._remember_existence(catalog_name, schema_name, names)
+        else:
+            self._remember_existence(
+                catalog_name, schema_name, names, checked_names=[table_name]
+            )
+        return names
+
+    @instrumented("has_multi_table")
+    def has_multi_table(
+        self,
+        connection: Connection,
+        table_names: Sequence[str],
+        schema: Optional[str] = None,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, bool]]:
+        """Check the existence of several tables or views in one schema with a single SHOW TABLES.
+
+        create_all() and drop_all() on SQLAlchemy 2.1 call this once per schema for every table they
+        might create or drop, and remember both hits and misses for the rest of the pass. 2.0 calls
+        has_table() per table instead, which lists the schema once it's asked a second time.
+        """
+
+        catalog_name, schema_name = self._resolve_schema(schema)
+
+        exists: Dict[str, bool] = {}
+        if self._existence_cache is not None:
+            for table_name in table_names:
+                cached = self._existence_cache.get(
+                    catalog_name, schema_name, table_name
+                )
+                if cached is not None:
+                    exists[table_name] = cached
+
+        unknown = [name for name in table_names if name not in exists]
+        if len(unknown) == 1:
+            exists[unknown[0]] = self.has_table(
+                connection, unknown[0], schema=schema, **kw
+            )
+        elif unknown:
+            names = self._get_existing_table_names(
+                connection, catalog_name, schema_name, **kw
+            )
+            self._remember_existence(catalog_name, schema_name, names)
+            exists.update((name, name.lower() in names) for name in unknown)
+
+        for table_name in table_names:
+            yield (schema, table_name), exists[table_name]
+
+    def _remember_existence(
+        self,
+        catalog_name: str,
+        schema_name: str,
+        existing_names: Set[str],
+        checked_names: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Store the result of SHOW TABLES in the existence cache, if enabled.
+
+        Without checked_names, existing_names is the complete listing of the schema. Otherwise it
+        was narrowed down with LIKE, so only the checked names are recorded.
+        """
+
+        if self._existence_cache is None:
+            return
+
+        if checked_names is None:
+            self._existence_cache.set_listing(catalog_name, schema_name, existing_names)
+        else:
+            self._existence_cache.set_many(
+                catalog_name,
+                schema_name,
+                {name: name.lower() in existing_names for name in checked_names},
+            )
+
+    def _forget_existence(self, schema: Optional[str], table_name: str) -> None:
+        """Drop a table from the existence cache, if enabled, and forget every connection's
+        listings. Called when DDL that creates or drops the table has been executed.
+        """
+
+        self._connection_listings.clear()
+        if self._existence_cache is not None:
+            self._existence_cache.invalidate(
+                *self._resolve_schema(schema), [table_name]
+            )
+
+    @reflection.cache
+    def _get_existing_table_names(
+        self, connection: Connection, catalog_name: str, schema_name: str, **kw: Any
+    ) -> Set[str]:
+        """Return the lowercased names of every table and view in a schema, including temporary
+        views. Call has_table or has_multi_table instead.
+        """
+        return self._show_table_names(connection, catalog_name, schema_name)
+
+    def _show_table_names(
+        self,
+        connection: Connection,
+        catalog_name: str,
+        schema_name: str,
+        like: Optional[str] = None,
+    ) -> Set[str]:
+        """Run SHOW TABLES on a schema and return the lowercased names. Returns an empty set if
+        the schema doesn't exist.
+
+        like narrows the listing down to one table name. The SHOW TABLES pattern is a regex, so
+        it's only applied to plain identifiers and callers must still compare names exactly.
+        """
+
+        stmt = f"SHOW TABLES FROM `{catalog_name}`.`{schema_name}`"
+        if like is not None and re.fullmatch(r"\w+", like):
+            stmt += f" LIKE '{like}'"
+
+        try:
+            result = connection.execute(DDL(stmt)).all()
+        except DatabaseError as e:
+            if _match_schema_not_found_string(str(e)):
+                self.reflection_stats.record_round_trip()
+                return set()
+            raise e
+        self.reflection_stats.record_round_trip(len(result))
+
+        return {row.tableName.lower() for row in result}
 
     def get_connection_cursor(self, connection):
         """Added for backwards compatibility with 1.3.x"""
@@ -387,15 +1575,40 @@ class DatabricksDialect(default.DefaultDialect):
             "Databricks dialect can't obtain a cursor context manager from the dbapi"
         )
 
+    @instrumented("get_schema_names")
     @reflection.cache
-    def get_schema_names(self, connection, **kw):
-        """Return a list of all schema names available in the database."""
-        stmt = DDL("SHOW SCHEMAS")
+    def get_schema_names(self, connection, catalog=None, **kw):
+        """Return a list of all schema names available in the database.
+
+        Pass catalog to list the schemas of a catalog other than the one in the connection string.
+        The names aren't qualified with the catalog.
+        """
+        if catalog is None:
+            stmt = DDL("SHOW SCHEMAS")
+        else:
+            stmt = DDL(
+                f"SHOW SCHEMAS IN {self.identifier_preparer.quote_identifier(catalog)}"
+            )
         result = connection.execute(stmt)
         schema_list = [row[0] for row in result]
+        self.reflection_stats.record_round_trip(len(schema_list))
         return schema_list
 
     @reflection.cache
+    def get_catalog_names(self, connection, **kw) -> List[str]:
+        """Return a list of all catalog names available in the workspace.
+
+        Reflect a schema in any of them by qualifying its name with the catalog, as in
+        MetaData.reflect(engine, schema="catalog.schema").
+        """
+        stmt = DDL("SHOW CATALOGS")
+        result = connection.execute(stmt)
+        catalog_list = [row[0] for row in result]
+        self.reflection_stats.record_round_trip(len(catalog_list))
+        return catalog_list
+
+    @reflection.cache
+    @persistent_reflection_cache("table_comment")
     def get_table_comment(
         self,
         connection: Connection,
@@ -403,10 +1616,8 @@ class DatabricksDialect(default.DefaultDialect):
         schema: Optional[str] = None,
         **kw: Any,
     ) -> ReflectedTableComment:
-        result = self._describe_table_extended(
-            connection=connection,
-            table_name=table_name,
-            schema_name=schema,
+        result = self._get_table_description(
+            connection, table_name, schema=schema, **kw
         )
 
         if result is None:
@@ -419,6 +1630,114 @@ class DatabricksDialect(default.DefaultDialect):
         else:
             return ReflectionDefaults.table_comment()
 
+    def get_multi_table_comment(
+        self,
+        connection,
+        *,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        kind: ObjectKind = ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, ReflectedTableComment]]:
+        """Return the comments of all tables in `schema`.
+
+        The comments come from the same information_schema.tables query that lists the table names,
+        instead of one DESCRIBE TABLE EXTENDED per table.
+        """
+
+        kw.pop("unreflectable", None)
+        names = self._get_multi_reflection_names(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        if self._autoloading_lazily(kw):
+            # The comment is reflected on demand by load_deferred_reflection()
+            for table_name in names:
+                yield (schema, table_name), ReflectionDefaults.table_comment()
+            return
+
+        if filter_names and len(names) == 1:
+            yield from self._reflect_each(
+                self.get_table_comment, connection, schema, names, **kw
+            )
+            return
+
+        rows = self._get_information_schema_tables(
+            connection, schema=schema, info_cache=kw.get("info_cache")
+        )
+        comments = {row.table_name: row.comment for row in rows or []}
+
+        for table_name in names:
+            key = (schema, table_name)
+            if table_name.lower() not in comments:
+                # Temporary views, unverified names from Table(..., autoload_with=...) and
+                # catalogs without information_schema
+                try:
+                    yield key, self.get_table_comment(
+                        connection, table_name, schema=schema, **kw
+                    )
+                except sqlalchemy.exc.NoSuchTableError:
+                    pass
+            elif comments[table_name.lower()]:
+                yield key, dict(text=comments[table_name.lower()])
+            else:
+                yield key, ReflectionDefaults.table_comment()
+
+    @reflection.cache
+    @persistent_reflection_cache("table_options")
+    def get_table_options(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: Optional[str] = None,
+        **kw: Any,
+    ) -> Dict[str, Any]:
+        """Return the table's partition columns, liquid clustering columns and table properties
+        from DESCRIBE TABLE EXTENDED, as the databricks_partition_by, databricks_cluster_by and
+        databricks_table_properties dialect options. Options the table doesn't have are left out.
+        """
+
+        result = self._get_table_description(
+            connection, table_name, schema=schema, **kw
+        )
+        return get_table_options_from_dte_output(result)
+
+    def get_multi_table_options(
+        self,
+        connection,
+        *,
+        schema: Optional[str] = None,
+        filter_names: Optional[Collection[str]] = None,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        kind: ObjectKind = ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[Tuple[TableKey, Dict[str, Any]]]:
+        """Return the dialect options of all tables in `schema`.
+
+        information_schema doesn't describe partitioning, clustering or table properties, so this
+        runs DESCRIBE TABLE EXTENDED once per table unless the reflection cache has the result.
+        Unless reflect_table_options is set, that's only done when a single table is reflected.
+        """
+
+        kw.pop("unreflectable", None)
+        names = self._get_multi_reflection_names(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        if self._autoloading_lazily(kw):
+            # The options are reflected on demand by load_deferred_reflection()
+            for table_name in names:
+                yield (schema, table_name), ReflectionDefaults.table_options()
+            return
+
+        if not self.reflect_table_options and not (filter_names and len(names) == 1):
+            for table_name in names:
+                yield (schema, table_name), ReflectionDefaults.table_options()
+            return
+
+        yield from self._reflect_each(
+            self.get_table_options, connection, schema, names, **kw
+        )
+
 
 @event.listens_for(Engine, "do_connect")
 def receive_do_connect(dialect, conn_rec, cargs, cparams):
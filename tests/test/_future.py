@@ -45,9 +45,7 @@ class FutureFeature(Enum):
     EMPTY_INSERT = "empty INSERT support"
     FK_OPTS = "foreign key option checking"
     GENERATED_COLUMNS = "Delta computed / generated columns support"
-    IDENTITY = "identity reflection"
     JSON = "JSON column type handling"
-    MULTI_PK = "get_multi_pk_constraint method"
     PROVISION = "event-driven engine configuration"
     REGEXP = "_visit_regexp"
     SANE_ROWCOUNT = "sane_rowcount support"
@@ -55,7 +53,6 @@ class FutureFeature(Enum):
     TEST_DESIGN = "required test-fixture overrides"
     TUPLE_LITERAL = "tuple-like IN markers completely"
     UUID = "native Uuid() type"
-    VIEW_DEF = "get_view_definition method"
 
 
 def render_future_feature(rsn: FutureFeature, extra=False) -> str:
@@ -159,12 +156,10 @@ class DifficultParametersTest(DifficultParametersTest):
 
 
 @pytest.mark.reviewed
-@pytest.mark.skip(render_future_feature(FutureFeature.IDENTITY, True))
+@pytest.mark.skip(render_future_feature(FutureFeature.TEST_DESIGN, True))
 class IdentityReflectionTest(IdentityReflectionTest):
-    """It's not clear _how_ to implement this for SQLAlchemy. Columns created with GENERATED ALWAYS AS IDENTITY
-    are not specially demarked in the output of TGetColumnsResponse or DESCRIBE TABLE EXTENDED.
-
-    We could theoretically parse this from the contents of `SHOW CREATE TABLE` but that feels like a hack.
+    """Identity columns are reflected from information_schema.columns. But this test's fixture creates identity
+    columns with Integer() types and options that DELTA IDENTITY columns don't support, like IdentityColumnTest.
     """
 
 
@@ -254,18 +249,6 @@ class ComponentReflectionTest(ComponentReflectionTest):
         """It's not clear what the expected ouput from this method would even _be_. Requires research."""
         pass
 
-    @pytest.mark.skip(render_future_feature(FutureFeature.VIEW_DEF))
-    def test_get_view_definition(self):
-        pass
-
-    @pytest.mark.skip(render_future_feature(FutureFeature.VIEW_DEF))
-    def test_get_view_definition_does_not_exist(self):
-        pass
-
-    @pytest.mark.skip(render_future_feature(FutureFeature.MULTI_PK))
-    def test_get_multi_pk_constraint(self):
-        pass
-
     @pytest.mark.skip(render_future_feature(FutureFeature.CHECK))
     def test_get_multi_check_constraints(self):
         pass
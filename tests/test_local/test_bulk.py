@@ -0,0 +1,367 @@
+"""Tests for bulk loading. These stage files in a temporary directory and fake the warehouse with a
+MagicMock connection.
+"""
+import datetime
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    create_engine,
+    exc,
+    select,
+    values,
+)
+
+from databricks.sqlalchemy import (
+    TIMESTAMP,
+    TINYINT,
+    DatabricksArray,
+    DatabricksMap,
+    DatabricksVariant,
+    LocalStaging,
+    VolumeStaging,
+    bulk_load,
+    copy_into,
+    insert,
+    insert_arrow,
+    merge,
+    write_parallel,
+)
+from databricks.sqlalchemy._arrow import cast_to_table
+
+engine = create_engine(
+    "databricks://token:****@****?http_path=****&catalog=****&schema=****"
+)
+
+events = Table("events", MetaData(), Column("id", Integer), Column("name", String))
+
+
+def compile(stmt):
+    return str(stmt.compile(bind=engine))
+
+
+class TestCopyInto:
+    def test_defaults(self):
+        assert compile(copy_into(events, "/Volumes/main/default/landing")) == (
+            "COPY INTO events\n"
+            "FROM '/Volumes/main/default/landing'\n"
+            "FILEFORMAT = PARQUET"
+        )
+
+    def test_options(self):
+        stmt = copy_into(
+            events,
+            "/Volumes/main/default/landing",
+            file_format="csv",
+            format_options={"header": True, "sep": "'"},
+            copy_options={"mergeSchema": False},
+            files=["a.csv", "b.csv"],
+        )
+
+        assert compile(stmt) == (
+            "COPY INTO events\n"
+            "FROM '/Volumes/main/default/landing'\n"
+            "FILEFORMAT = CSV\n"
+            "FILES = ('a.csv', 'b.csv')\n"
+            "FORMAT_OPTIONS ('header' = 'true', 'sep' = '\\'')\n"
+            "COPY_OPTIONS ('mergeSchema' = 'false')"
+        )
+
+    def test_unknown_file_format(self):
+        with pytest.raises(exc.ArgumentError):
+            copy_into(events, "/Volumes/main/default/landing", file_format="xlsx")
+
+
+class TestBulkLoad:
+    @pytest.fixture
+    def staging(self, tmp_path):
+        return LocalStaging(str(tmp_path / "staging"))
+
+    def executed(self, connection):
+        return [compile(call.args[0]) for call in connection.execute.call_args_list]
+
+    def test_rows_are_staged_and_copied(self, staging):
+        connection = MagicMock()
+        rows = [{"id": i, "name": str(i)} for i in range(5)]
+
+        loaded = bulk_load(
+            connection, events, rows, staging, rows_per_file=2, cleanup=False
+        )
+
+        assert loaded == 5
+        [statement] = self.executed(connection)
+        staged = sorted(os.listdir(staging.location))
+        assert len(staged) == 3
+        assert f"FILES = ({', '.join(repr(name) for name in staged)})" in statement
+        assert statement.startswith(f"COPY INTO events\nFROM '{staging.location}'")
+
+        table = pyarrow.concat_tables(
+            pyarrow.parquet.read_table(os.path.join(staging.location, name))
+            for name in staged
+        )
+        assert table.to_pylist() == rows
+
+    def test_dataframe(self, staging):
+        pandas = pytest.importorskip("pandas")
+        connection = MagicMock()
+        df = pandas.DataFrame({"id": [1, 2], "name": ["a", "b"]}, index=[10, 20])
+
+        assert bulk_load(connection, events, df, staging, cleanup=False) == 2
+        [name] = os.listdir(staging.location)
+        table = pyarrow.parquet.read_table(os.path.join(staging.location, name))
+        assert table.column_names == ["id", "name"]
+
+    def test_cleanup(self, staging):
+        connection = MagicMock()
+        connection.execute.side_effect = exc.DBAPIError("COPY INTO", None, Exception())
+
+        with pytest.raises(exc.DBAPIError):
+            bulk_load(connection, events, [{"id": 1, "name": "a"}], staging)
+        assert os.listdir(staging.location) == []
+
+    def test_empty(self, staging):
+        connection = MagicMock()
+
+        assert bulk_load(connection, events, [], staging) == 0
+        connection.execute.assert_not_called()
+
+
+def test_volume_staging():
+    connection = MagicMock()
+    staging = VolumeStaging("/Volumes/main/default/staging/")
+
+    staging.put(connection, "/tmp/it's.parquet", "a.parquet")
+    staging.remove(connection, "a.parquet")
+
+    assert [call.args[0] for call in connection.exec_driver_sql.call_args_list] == [
+        "PUT '/tmp/it\\'s.parquet' INTO '/Volumes/main/default/staging/a.parquet' OVERWRITE",
+        "REMOVE '/Volumes/main/default/staging/a.parquet'",
+    ]
+
+
+class TestInsertArrow:
+    @pytest.fixture
+    def table(self):
+        return Table(
+            "typed",
+            MetaData(),
+            Column("id", TINYINT),
+            Column("amount", Numeric(10, 2)),
+            Column("at", DateTime),
+            Column("at_utc", TIMESTAMP),
+            Column("tags", DatabricksArray(String)),
+            Column("attrs", DatabricksMap(String, Integer)),
+            Column("data", DatabricksVariant()),
+        )
+
+    @pytest.fixture
+    def arrow_table(self):
+        return pyarrow.table(
+            {
+                "id": pyarrow.array([1, 2], pyarrow.int64()),
+                "amount": [1.5, 2.25],
+                "at": pyarrow.array(
+                    [datetime.datetime(2024, 1, 1, 12, 0, 0, 1)] * 2,
+                    pyarrow.timestamp("ns"),
+                ),
+                "at_utc": [datetime.datetime(2024, 1, 1)] * 2,
+                "tags": [["a"], []],
+                "attrs": pyarrow.array(
+                    [[("a", 1)], []], pyarrow.map_(pyarrow.string(), pyarrow.int64())
+                ),
+                "data": [{"k": 1}, None],
+            }
+        )
+
+    def test_types(self, table, arrow_table):
+        cast = cast_to_table(arrow_table, table)
+
+        assert cast.schema == pyarrow.schema(
+            [
+                ("id", pyarrow.int8()),
+                ("amount", pyarrow.decimal128(10, 2)),
+                ("at", pyarrow.timestamp("us")),
+                ("at_utc", pyarrow.timestamp("us", tz="UTC")),
+                ("tags", pyarrow.list_(pyarrow.string())),
+                ("attrs", pyarrow.map_(pyarrow.string(), pyarrow.int32())),
+                ("data", pyarrow.string()),
+            ]
+        )
+        assert cast.column("data").to_pylist() == ['{"k":1}', None]
+
+    def test_unknown_column(self, table):
+        with pytest.raises(exc.ArgumentError):
+            cast_to_table(pyarrow.table({"nope": [1]}), table)
+
+    def test_values_are_batched_by_parameter_budget(self, table, arrow_table):
+        dbapi_connection = MagicMock()
+        cursor = dbapi_connection.cursor.return_value
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=lambda: dbapi_connection,
+        )
+        rows = pyarrow.concat_tables([arrow_table] * 40)
+
+        with engine.connect() as connection:
+            cursor.reset_mock()
+            assert insert_arrow(connection, table, rows) == 80
+
+        # 256 parameters fit 36 rows of 7 columns
+        batches = [call.args for call in cursor.execute.call_args_list]
+        assert [len(parameters) for _, parameters in batches] == [
+            36 * 7,
+            36 * 7,
+            8 * 7,
+        ]
+        statement, parameters = batches[0]
+        assert "PARSE_JSON(:`data__35`)" in statement
+        assert parameters["data__0"] == '{"k":1}'
+
+    def test_null_complex_values(self, table):
+        dbapi_connection = MagicMock()
+        cursor = dbapi_connection.cursor.return_value
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=lambda: dbapi_connection,
+        )
+        rows = pyarrow.table(
+            {
+                "tags": pyarrow.array([None, ["a"]], pyarrow.list_(pyarrow.string())),
+                "attrs": pyarrow.array(
+                    [None, None], pyarrow.map_(pyarrow.string(), pyarrow.int64())
+                ),
+            }
+        )
+
+        with engine.connect() as connection:
+            cursor.reset_mock()
+            assert insert_arrow(connection, table, rows) == 2
+
+        [(_, parameters)] = [call.args for call in cursor.execute.call_args_list]
+        assert parameters == {
+            "tags__0": None,
+            "attrs__0": None,
+            "tags__1": ["a"],
+            "attrs__1": None,
+        }
+
+    def test_chunk_rows(self, table, arrow_table):
+        connection = MagicMock()
+        connection.dialect = engine.dialect
+
+        insert_arrow(connection, table, arrow_table, chunk_rows=1)
+
+        assert connection.execute.call_count == 2
+
+    def test_staged(self, table, arrow_table, tmp_path):
+        connection = MagicMock()
+        staging = LocalStaging(str(tmp_path))
+
+        assert insert_arrow(connection, table, arrow_table, staging=staging) == 2
+
+        [call] = connection.execute.call_args_list
+        assert compile(call.args[0]).startswith(
+            "COPY INTO typed\n"
+            f"FROM (SELECT id, amount, at, at_utc, tags, attrs, parse_json(data) AS data FROM '{tmp_path}')"
+        )
+
+
+class TestWriteParallel:
+    @pytest.fixture
+    def executed(self):
+        # Each pooled connection is its own mock. A statement with the parameter "fail" fails
+        executed = []
+        lock = threading.Lock()
+
+        def execute(statement, parameters=None):
+            if parameters and "fail" in parameters.values():
+                raise RuntimeError("chunk failed")
+            with lock:
+                executed.append((statement, parameters))
+
+        def connect():
+            dbapi_connection = MagicMock()
+            cursor = dbapi_connection.cursor.return_value
+            cursor.execute.side_effect = execute
+            cursor.rowcount = 3
+            return dbapi_connection
+
+        self.engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=connect,
+        )
+        return executed
+
+    def test_chunks(self, executed):
+        rows = ({"id": i, "name": str(i)} for i in range(10))
+
+        result = write_parallel(
+            self.engine, insert(events), rows, chunk_rows=3, max_workers=2
+        )
+
+        assert [(chunk.index, chunk.rows) for chunk in result.chunks] == [
+            (0, 3),
+            (1, 3),
+            (2, 3),
+            (3, 1),
+        ]
+        assert result.errors == []
+        assert result.rows == 10
+        assert result.rowcount == 12
+        inserted = sorted(
+            parameters[key]
+            for statement, parameters in executed
+            if statement.startswith("INSERT")
+            for key in parameters
+            if key.startswith("id")
+        )
+        assert inserted == list(range(10))
+
+    def test_failed_chunk(self, executed):
+        rows = [{"id": i, "name": "fail" if i == 4 else str(i)} for i in range(9)]
+
+        result = write_parallel(self.engine, insert(events), rows, chunk_rows=3)
+
+        [failed] = result.errors
+        assert failed.index == 1
+        assert str(failed.error) == "chunk failed"
+        assert result.rows == 6
+        assert result.failed_rows == 3
+        assert (
+            sum(1 for statement, _ in executed if statement.startswith("INSERT")) == 2
+        )
+
+    def test_merge(self, executed):
+        def upsert(chunk):
+            source = select(
+                values(events.c.id, events.c.name, name="v").data(chunk)
+            ).subquery("src")
+            return (
+                merge(events)
+                .using(source)
+                .on(events.c.id == source.c.id)
+                .when_matched_update()
+                .when_not_matched_insert()
+            )
+
+        rows = [(i, str(i)) for i in range(5)]
+
+        result = write_parallel(self.engine, upsert, rows, chunk_rows=2)
+
+        assert len(result.chunks) == 3
+        assert result.rowcount == 9
+        merges = [
+            statement for statement, _ in executed if statement.startswith("MERGE")
+        ]
+        assert len(merges) == 3
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import Column, MetaData, String, Table, Numeric, Integer, create_engine, insert
+from sqlalchemy import Column, Computed, MetaData, String, Table, Numeric, Integer, create_engine, insert
 from sqlalchemy.schema import (
     CreateTable,
     DropColumnComment,
@@ -116,6 +116,22 @@ class TestTableComplexTypeDDL(DDLTestBase):
         assert "variant_col VARIANT" in output
 
 
+class TestGeneratedColumnDDL(DDLTestBase):
+    @pytest.mark.parametrize("persisted", [None, True, False])
+    def test_computed_column_is_never_stored_or_virtual(self, persisted):
+        table = Table(
+            "generated",
+            MetaData(),
+            Column("a", Integer),
+            Column("b", Integer, Computed("a * 2", persisted=persisted)),
+        )
+        output = self.compile(CreateTable(table))
+
+        assert "b INT GENERATED ALWAYS AS (a * 2)\n" in output
+        assert "STORED" not in output
+        assert "VIRTUAL" not in output
+
+
 class TestBindParamQuoting(DDLTestBase):
     """Regression tests for bind-parameter quoting.
 
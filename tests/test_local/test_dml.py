@@ -0,0 +1,329 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    column,
+    create_engine,
+    exc,
+    select,
+    values,
+)
+from sqlalchemy import insert as sqlalchemy_insert
+
+from databricks.sqlalchemy import insert, merge
+
+
+class DMLTestBase:
+    engine = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=****&schema=****"
+    )
+
+    def compile(self, stmt):
+        return stmt.compile(bind=self.engine)
+
+
+class TestMerge(DMLTestBase):
+    @pytest.fixture
+    def users(self) -> Table:
+        return Table(
+            "users",
+            MetaData(),
+            Column("id", Integer),
+            Column("name", String),
+        )
+
+    @pytest.fixture
+    def updates(self):
+        return values(
+            column("id", Integer), column("name", String), name="updates"
+        ).data([(1, "a"), (2, "b")])
+
+    def test_upsert_from_values(self, users, updates):
+        stmt = (
+            merge(users)
+            .using(updates)
+            .on(users.c.id == updates.c.id)
+            .when_matched_update(set_={"name": updates.c.name})
+            .when_not_matched_insert()
+        )
+        compiled = self.compile(stmt)
+
+        assert str(compiled) == (
+            "MERGE INTO users\n"
+            "USING (VALUES (:`param_1`, :`param_2`), (:`param_3`, :`param_4`)) AS updates (id, name)\n"
+            "ON users.id = updates.id\n"
+            "WHEN MATCHED THEN UPDATE SET name = updates.name\n"
+            "WHEN NOT MATCHED THEN INSERT *"
+        )
+        assert compiled.params == {
+            "param_1": 1,
+            "param_2": "a",
+            "param_3": 2,
+            "param_4": "b",
+        }
+
+    def test_conditions_and_explicit_values(self, users):
+        source = select(users).where(users.c.id > 10).subquery("source")
+        stmt = (
+            merge(users)
+            .using(source)
+            .on(users.c.id == source.c.id)
+            .when_matched_update(condition=source.c.name != users.c.name)
+            .when_matched_delete(condition=source.c.name.is_(None))
+            .when_not_matched_insert(values={users.c.id: source.c.id, "name": "new"})
+            .when_not_matched_by_source_delete(condition=users.c.id < 5)
+        )
+        compiled = self.compile(stmt)
+
+        assert str(compiled).endswith(
+            "ON users.id = source.id\n"
+            "WHEN MATCHED AND source.name != users.name THEN UPDATE SET *\n"
+            "WHEN MATCHED AND source.name IS NULL THEN DELETE\n"
+            "WHEN NOT MATCHED THEN INSERT (id, name) VALUES (source.id, :`param_1`)\n"
+            "WHEN NOT MATCHED BY SOURCE AND users.id < :`id_2` THEN DELETE"
+        )
+        assert compiled.params == {"id_1": 10, "param_1": "new", "id_2": 5}
+
+    def test_aliased_target(self, users, updates):
+        target = users.alias("t")
+        stmt = (
+            merge(target)
+            .using(updates)
+            .on(target.c.id == updates.c.id)
+            .when_not_matched_by_source_delete()
+        )
+
+        assert str(self.compile(stmt)).startswith("MERGE INTO users AS t\n")
+
+    def test_generative(self, users, updates):
+        stmt = merge(users).using(updates).on(users.c.id == updates.c.id)
+        stmt.when_matched_delete()
+
+        with pytest.raises(exc.CompileError):
+            self.compile(stmt)
+
+    def test_unknown_column(self, users, updates):
+        with pytest.raises(exc.ArgumentError):
+            merge(users).when_matched_update(set_={"nope": updates.c.name})
+
+    def test_cache_key_ignores_values(self, users):
+        source = Table("source", MetaData(), Column("id", Integer))
+
+        def stmt(name):
+            return (
+                merge(users)
+                .using(source)
+                .on(users.c.id == source.c.id)
+                .when_matched_update(set_={"name": name})
+            )
+
+        assert stmt("a")._generate_cache_key() == stmt("b")._generate_cache_key()
+
+
+class TestInsertOverwrite(DMLTestBase):
+    day = datetime.date(2024, 1, 1)
+
+    @pytest.fixture
+    def tables(self):
+        metadata = MetaData()
+        events = Table("events", metadata, Column("id", Integer), Column("day", Date))
+        staged = Table("staged", metadata, Column("id", Integer), Column("day", Date))
+        return events, staged
+
+    def test_plain_insert_is_unchanged(self, tables):
+        events, _ = tables
+        assert str(self.compile(insert(events).values(id=1))) == (
+            "INSERT INTO events (id) VALUES (:`id`)"
+        )
+
+    def test_overwrite_from_select(self, tables):
+        events, staged = tables
+        stmt = (
+            insert(events)
+            .overwrite()
+            .from_select(["id", "day"], select(staged).where(staged.c.day == self.day))
+        )
+        compiled = self.compile(stmt)
+
+        assert str(compiled) == (
+            "INSERT OVERWRITE events (id, day) SELECT staged.id, staged.day \n"
+            "FROM staged \n"
+            "WHERE staged.day = :`day_1`"
+        )
+        assert compiled.params == {"day_1": self.day}
+
+    def test_overwrite_values(self, tables):
+        events, _ = tables
+        stmt = insert(events).overwrite().values([{"id": 1, "day": self.day}])
+
+        assert str(self.compile(stmt)) == (
+            "INSERT OVERWRITE events (id, day) VALUES (:`id_m0`, :`day_m0`)"
+        )
+
+    def test_overwrite_executemany(self, tables):
+        events, _ = tables
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=MagicMock,
+        )
+        rows = [{"id": i, "day": self.day} for i in range(3)]
+
+        with engine.connect() as connection:
+            with pytest.raises(exc.InvalidRequestError, match="INSERT OVERWRITE"):
+                connection.execute(insert(events).overwrite(), rows)
+            connection.execute(insert(events).overwrite(), rows[0])
+
+    def test_replace_where(self, tables):
+        events, staged = tables
+        stmt = (
+            insert(events)
+            .replace_where(events.c.day == self.day)
+            .from_select(["id", "day"], select(staged).where(staged.c.day == self.day))
+        )
+        compiled = self.compile(stmt)
+
+        assert str(compiled) == (
+            "INSERT INTO events REPLACE WHERE day = :`day_1` "
+            "SELECT staged.id, staged.day \n"
+            "FROM staged \n"
+            "WHERE staged.day = :`day_2`"
+        )
+        assert compiled.params == {"day_1": self.day, "day_2": self.day}
+
+    def test_replace_where_requires_every_column(self, tables):
+        events, staged = tables
+        stmt = (
+            insert(events)
+            .replace_where(events.c.day == self.day)
+            .from_select(["id"], select(staged.c.id))
+        )
+
+        with pytest.raises(exc.CompileError):
+            self.compile(stmt)
+
+    def test_replace_where_requires_select(self, tables):
+        events, _ = tables
+        stmt = insert(events).replace_where(events.c.day == self.day).values(id=1)
+
+        with pytest.raises(exc.CompileError):
+            self.compile(stmt)
+
+    def test_overwrite_and_replace_where_are_exclusive(self, tables):
+        events, _ = tables
+
+        with pytest.raises(exc.InvalidRequestError):
+            insert(events).overwrite().replace_where(events.c.day == self.day)
+
+    def test_cache_key(self, tables):
+        events, staged = tables
+        query = select(staged)
+
+        overwrite = insert(events).overwrite().from_select(["id", "day"], query)
+        plain = insert(events).from_select(["id", "day"], query)
+
+        assert overwrite._generate_cache_key() != plain._generate_cache_key()
+
+
+class TestInsertManyValues(DMLTestBase):
+    """executemany() of an INSERT is sent as multi-row INSERT ... VALUES batches"""
+
+    table = Table(
+        "t",
+        MetaData(),
+        Column("id", Integer),
+        Column("a`b", String),
+        Column("c-d", String),
+    )
+
+    def executed(self, rows, **engine_kw):
+        dbapi_connection = MagicMock()
+        cursor = dbapi_connection.cursor.return_value
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=lambda: dbapi_connection,
+            **engine_kw,
+        )
+        with engine.connect() as connection:
+            cursor.reset_mock()
+            connection.execute(sqlalchemy_insert(self.table), rows)
+        cursor.executemany.assert_not_called()
+        return [call.args for call in cursor.execute.call_args_list]
+
+    def rows(self, count):
+        return [{"id": i, "a`b": str(i), "c-d": "x"} for i in range(count)]
+
+    def test_batches_by_parameter_budget(self):
+        batches = self.executed(self.rows(7), insertmanyvalues_max_parameters=9)
+
+        assert [len(parameters) for _, parameters in batches] == [9, 9, 3]
+
+    def test_batches_by_statement_size(self):
+        statement_bytes = len(str(self.compile(sqlalchemy_insert(self.table))))
+        batches = self.executed(
+            self.rows(7), insertmanyvalues_max_statement_bytes=statement_bytes + 100
+        )
+
+        assert all(len(statement) <= statement_bytes + 100 for statement, _ in batches)
+        assert sum(len(parameters) for _, parameters in batches) == 7 * 3
+        assert len(batches) > 1
+
+    def test_batches_by_value_bytes(self):
+        rows = [{"id": i, "a`b": "x" * 1000, "c-d": "é" * 500} for i in range(7)]
+        limit = 5000
+
+        batches = self.executed(rows, insertmanyvalues_max_statement_bytes=limit)
+
+        for statement, parameters in batches:
+            values_bytes = sum(len(str(v).encode()) for v in parameters.values())
+            assert len(statement.encode()) + values_bytes <= limit
+        assert sum(len(parameters) for _, parameters in batches) == 7 * 3
+        assert len(batches) > 1
+
+    def test_row_wider_than_parameter_budget(self):
+        wide = Table(
+            "wide", MetaData(), *(Column(f"c{i}", Integer) for i in range(300))
+        )
+        dbapi_connection = MagicMock()
+        cursor = dbapi_connection.cursor.return_value
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=****&schema=****",
+            creator=lambda: dbapi_connection,
+        )
+        rows = [{f"c{i}": i for i in range(300)}] * 2
+        with engine.connect() as connection:
+            cursor.reset_mock()
+            connection.execute(sqlalchemy_insert(wide), rows)
+
+        # Each row exceeds the 256 parameter default, so each is sent on its own
+        assert [len(call.args[1]) for call in cursor.execute.call_args_list] == [
+            300,
+            300,
+        ]
+
+    def test_page_size(self):
+        batches = self.executed(self.rows(7), insertmanyvalues_page_size=5)
+
+        assert [len(parameters) for _, parameters in batches] == [15, 6]
+
+    def test_backticks_in_names(self):
+        [(statement, parameters)] = self.executed(self.rows(2))
+
+        assert statement == (
+            "INSERT INTO t (id, `a``b`, `c-d`) VALUES "
+            "(:`id__0`, :`a``b__0`, :`c-d__0`), (:`id__1`, :`a``b__1`, :`c-d__1`)"
+        )
+        assert parameters == {
+            "id__0": 0,
+            "a`b__0": "0",
+            "c-d__0": "x",
+            "id__1": 1,
+            "a`b__1": "1",
+            "c-d__1": "x",
+        }
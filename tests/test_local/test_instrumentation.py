@@ -0,0 +1,115 @@
+"""Tests for the reflection instrumentation. These fake the warehouse with a MagicMock connection."""
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from databricks.sqlalchemy import DatabricksDialect
+
+ShowTablesRow = namedtuple("ShowTablesRow", ["database", "tableName", "isTemporary"])
+DteRow = namedtuple("DteRow", ["col_name", "data_type"])
+
+
+@pytest.fixture
+def dialect():
+    dialect = DatabricksDialect()
+    dialect.catalog = "main"
+    dialect.schema = "default"
+    return dialect
+
+
+@pytest.fixture
+def connection():
+    connection = MagicMock()
+    connection.execute.return_value.all.return_value = [
+        ShowTablesRow("default", "orders", False),
+        ShowTablesRow("default", "users", False),
+    ]
+    return connection
+
+
+def test_round_trips_and_rows(dialect, connection):
+    assert dialect.has_table(connection, "orders")
+
+    stats = dialect.reflection_stats["has_table"]
+    assert (stats.calls, stats.cache_hits, stats.cache_misses) == (1, 0, 1)
+    assert (stats.round_trips, stats.rows) == (1, 2)
+    assert stats.seconds > 0
+
+
+def test_cache_hits(dialect, connection):
+    info_cache: dict = {}
+    dialect.has_table(connection, "orders", info_cache=info_cache)
+    dialect.has_table(connection, "orders", info_cache=info_cache)
+    dialect.has_table(connection, "users", info_cache=info_cache)
+
+    stats = dialect.reflection_stats["has_table"]
+    assert (stats.calls, stats.cache_hits, stats.cache_misses) == (3, 2, 1)
+    assert stats.round_trips == 1
+
+
+def test_describe_table_extended(dialect, connection):
+    connection.execute.return_value.all.return_value = [
+        DteRow("id", "int"),
+        DteRow("orders_pk", "PRIMARY KEY (`id`)"),
+    ]
+    info_cache: dict = {}
+    dialect.get_pk_constraint(connection, "orders", info_cache=info_cache)
+    dialect.get_table_comment(connection, "orders", info_cache=info_cache)
+
+    stats = dialect.reflection_stats["describe_table_extended"]
+    assert (stats.calls, stats.cache_hits, stats.round_trips, stats.rows) == (
+        2,
+        1,
+        1,
+        2,
+    )
+
+
+def test_generators_are_measured_until_exhausted(dialect, connection):
+    results = dialect.has_multi_table(connection, ["orders", "users"])
+    assert dialect.reflection_stats.as_dict() == {}
+
+    dict(results)
+    assert dialect.reflection_stats["has_multi_table"].round_trips == 1
+
+
+def test_nested_calls_share_round_trips(dialect, connection):
+    dict(dialect.has_multi_table(connection, ["orders"]))
+
+    assert dialect.reflection_stats["has_multi_table"].round_trips == 1
+    assert dialect.reflection_stats["has_table"].round_trips == 1
+
+
+def test_reset(dialect, connection):
+    dialect.has_table(connection, "orders")
+    dialect.reflection_stats.reset()
+
+    assert dialect.reflection_stats.as_dict() == {}
+
+
+def test_after_reflection_call_event(connection):
+    engine = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+        creator=MagicMock,
+    )
+    calls = []
+
+    def receive(call):
+        calls.append(call)
+
+    event.listen(engine, "after_reflection_call", receive)
+
+    engine.dialect.has_table(connection, "orders")
+    engine.dialect.has_table(connection, "orders", info_cache={})
+
+    assert [(call.operation, call.cache_hit) for call in calls] == [
+        ("has_table", False),
+        ("has_table", False),
+    ]
+    assert calls[0].rows == 2
+
+    event.remove(engine, "after_reflection_call", receive)
+    engine.dialect.has_table(connection, "orders")
+    assert len(calls) == 2
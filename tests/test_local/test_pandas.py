@@ -0,0 +1,202 @@
+"""Tests for DataFrame.to_sql() helpers. These fake the warehouse with a MagicMock DBAPI connection."""
+import datetime
+import os
+from unittest.mock import MagicMock
+
+import pyarrow.parquet
+import pytest
+import sqlalchemy
+from sqlalchemy import create_engine
+
+from databricks.sqlalchemy import (
+    TIMESTAMP,
+    TIMESTAMP_NTZ,
+    TINYINT,
+    DatabricksVariant,
+    LocalStaging,
+    PandasInsertMethod,
+    pandas_dtypes,
+    pandas_insert_method,
+)
+
+pandas = pytest.importorskip("pandas")
+
+# The columns of SHOW TABLES, which to_sql() runs to check whether the table exists
+SHOW_TABLES_DESCRIPTION = [
+    (name, type_, None, None, None, None, None)
+    for name, type_ in [
+        ("database", "string"),
+        ("tableName", "string"),
+        ("isTemporary", "boolean"),
+    ]
+]
+
+
+@pytest.fixture
+def cursor():
+    dbapi_connection = MagicMock()
+    cursor = dbapi_connection.cursor.return_value
+    cursor.fetchall.return_value = []
+    cursor.description = SHOW_TABLES_DESCRIPTION
+    engine = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+        creator=lambda: dbapi_connection,
+    )
+    with engine.connect() as connection:
+        cursor.reset_mock()
+        cursor.connection = connection
+        yield cursor
+
+
+@pytest.fixture
+def df():
+    return pandas.DataFrame(
+        {
+            "id": pandas.Series([1, 2, 3], dtype="int8"),
+            "at": pandas.to_datetime(["2024-01-01 12:00"] * 3),
+            "data": [{"a": 1}, [1], None],
+        }
+    )
+
+
+def inserts(cursor):
+    return [
+        call.args
+        for call in cursor.execute.call_args_list
+        if call.args[0].startswith(("INSERT", "COPY"))
+    ]
+
+
+def test_pandas_dtypes(df):
+    df["at_utc"] = df["at"].dt.tz_localize("UTC")
+    df["name"] = ["a", "b", "c"]
+
+    dtypes = pandas_dtypes(df)
+
+    assert {name: type(type_) for name, type_ in dtypes.items()} == {
+        "id": TINYINT,
+        "at": TIMESTAMP_NTZ,
+        "at_utc": TIMESTAMP,
+        "data": DatabricksVariant,
+    }
+
+
+def test_values_in_chunks(cursor, df):
+    written = df.to_sql(
+        "t",
+        cursor.connection,
+        index=False,
+        dtype=pandas_dtypes(df),
+        method=pandas_insert_method,
+        chunksize=2,
+    )
+
+    assert written == 3
+    [(first, first_params), (second, second_params)] = inserts(cursor)
+    assert first == (
+        "INSERT INTO t (id, at, data) VALUES "
+        "(:`id__0`, :`at__0`, PARSE_JSON(:`data__0`)), "
+        "(:`id__1`, :`at__1`, PARSE_JSON(:`data__1`))"
+    )
+    assert first_params == {
+        "id__0": 1,
+        "at__0": datetime.datetime(2024, 1, 1, 12),
+        "data__0": '{"a":1}',
+        "id__1": 2,
+        "at__1": datetime.datetime(2024, 1, 1, 12),
+        "data__1": "[1]",
+    }
+    assert second_params == {
+        "id": 3,
+        "at": datetime.datetime(2024, 1, 1, 12),
+        "data": None,
+    }
+
+
+def test_index(cursor, df):
+    df.index = pandas.Index([10, 20, 30], name="row")
+
+    df.to_sql(
+        "t", cursor.connection, dtype=pandas_dtypes(df), method=pandas_insert_method
+    )
+
+    [(_, params)] = inserts(cursor)
+    assert [params[f"row__{i}"] for i in range(3)] == [10, 20, 30]
+
+
+def test_staged(cursor, df, tmp_path):
+    staging = LocalStaging(str(tmp_path))
+    method = PandasInsertMethod(staging=staging, staging_min_rows=3)
+
+    df.to_sql(
+        "t",
+        cursor.connection,
+        index=False,
+        dtype=pandas_dtypes(df),
+        method=method,
+    )
+
+    [(statement, _)] = inserts(cursor)
+    assert statement.startswith(
+        f"COPY INTO t\nFROM (SELECT id, at, parse_json(data) AS data FROM '{tmp_path}')"
+    )
+
+
+def test_staging_min_rows(cursor, df, tmp_path):
+    method = PandasInsertMethod(LocalStaging(str(tmp_path)), staging_min_rows=4)
+
+    df.to_sql(
+        "t", cursor.connection, index=False, dtype=pandas_dtypes(df), method=method
+    )
+
+    [(statement, _)] = inserts(cursor)
+    assert statement.startswith("INSERT INTO t")
+
+
+def test_reads_rows_from_data_iter(cursor):
+    """The rows pandas passes are written as they are, without reading the DataFrame"""
+    table = sqlalchemy.Table(
+        "t",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("id", sqlalchemy.Integer),
+        sqlalchemy.Column("data", DatabricksVariant),
+    )
+    pd_table = MagicMock(spec=["table"], table=table)
+
+    written = pandas_insert_method(
+        pd_table,
+        cursor.connection,
+        ["id", "data"],
+        iter([(1, "hello"), (2, "123"), (3, [3])]),
+    )
+
+    assert written == 3
+    [(_, params)] = inserts(cursor)
+    assert params == {
+        "id__0": 1,
+        "data__0": '"hello"',
+        "id__1": 2,
+        "data__1": '"123"',
+        "id__2": 3,
+        "data__2": "[3]",
+    }
+
+
+def test_staged_variant_values_are_serialised(cursor, df, tmp_path):
+    staged = []
+
+    class RecordingStaging(LocalStaging):
+        def put(self, connection, local_path, name):
+            staged.append(pyarrow.parquet.read_table(local_path))
+            super().put(connection, local_path, name)
+
+    df["data"] = [{"a": 1}, "hello", None]
+    method = PandasInsertMethod(RecordingStaging(str(tmp_path)), staging_min_rows=3)
+
+    df.to_sql(
+        "t", cursor.connection, index=False, dtype=pandas_dtypes(df), method=method
+    )
+
+    [arrow_table] = staged
+    assert arrow_table.column("id").to_pylist() == [1, 2, 3]
+    assert arrow_table.column("data").to_pylist() == ['{"a":1}', '"hello"', None]
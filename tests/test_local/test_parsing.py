@@ -1,12 +1,20 @@
+from collections import namedtuple
+
 import pytest
 from databricks.sqlalchemy._parse import (
     extract_identifiers_from_string,
     extract_identifier_groups_from_string,
     extract_three_level_identifier_from_constraint_string,
     build_fk_dict,
+    build_fk_dicts_from_information_schema,
     build_pk_dict,
+    build_pk_dicts_from_information_schema,
     match_dte_rows_by_value,
     get_comment_from_dte_output,
+    get_table_options_from_dte_output,
+    join_catalog_schema,
+    parse_type_string,
+    split_catalog_schema,
     DatabricksSqlAlchemyParseException,
 )
 from sqlalchemy import (
@@ -20,12 +28,15 @@ from sqlalchemy import (
     Time,
     Uuid,
 )
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.types import NullType
 
 from databricks.sqlalchemy import (
     DatabricksArray,
     TIMESTAMP,
     TINYINT,
     DatabricksMap,
+    DatabricksStruct,
     TIMESTAMP_NTZ,
 )
 from databricks.sqlalchemy import DatabricksDialect
@@ -100,6 +111,17 @@ def test_build_fk_dict(tschema):
     }
 
 
+@pytest.mark.parametrize("tschema", [None, "some_schema"])
+def test_build_fk_dict_to_another_catalog(tschema):
+    fk_constraint_string = "FOREIGN KEY (`parent_user_id`) REFERENCES `other`.`some_schema`.`users` (`user_id`)"
+
+    result = build_fk_dict(
+        "some_fk_name", fk_constraint_string, schema_name=tschema, catalog_name="main"
+    )
+
+    assert result["referred_schema"] == "other.some_schema"
+
+
 def test_build_pk_dict():
     pk_constraint_string = "PRIMARY KEY (`id`, `name`, `email_address`)"
     pk_name = "pk1"
@@ -112,6 +134,40 @@ def test_build_pk_dict():
     }
 
 
+def test_build_pk_dicts_from_information_schema():
+    Row = namedtuple("Row", ["table_name", "constraint_name", "column_name"])
+    rows = [Row("t1", "t1_pk", "a"), Row("t1", "t1_pk", "b"), Row("t2", "t2_pk", "id")]
+
+    assert build_pk_dicts_from_information_schema(rows) == {
+        "t1": build_pk_dict("t1_pk", "PRIMARY KEY (`a`, `b`)"),
+        "t2": build_pk_dict("t2_pk", "PRIMARY KEY (`id`)"),
+    }
+
+
+@pytest.mark.parametrize("tschema", [None, "some_schema"])
+def test_build_fk_dicts_from_information_schema(tschema):
+    Row = namedtuple(
+        "Row",
+        "table_name constraint_name column_name referred_schema referred_table referred_column",
+    )
+    rows = [
+        Row("t2", "fk1", "pname", "some_schema", "tb1", "name"),
+        Row("t2", "fk1", "pid", "some_schema", "tb1", "id"),
+        Row("t2", "fk2", "parent_user_id", "some_schema", "users", "user_id"),
+        # A foreign key to a table in another catalog, which this catalog can't see
+        Row("t3", "fk3", "user_id", None, None, None),
+    ]
+    fk1 = "FOREIGN KEY (`pname`, `pid`) REFERENCES `main`.`some_schema`.`tb1` (`name`, `id`)"
+    fk2 = "FOREIGN KEY (`parent_user_id`) REFERENCES `main`.`some_schema`.`users` (`user_id`)"
+
+    assert build_fk_dicts_from_information_schema(rows, schema_name=tschema) == {
+        "t2": [
+            build_fk_dict("fk1", fk1, schema_name=tschema),
+            build_fk_dict("fk2", fk2, schema_name=tschema),
+        ]
+    }
+
+
 # This is a real example of the output from DESCRIBE TABLE EXTENDED as of 15 October 2023
 RAW_SAMPLE_DTE_OUTPUT = [
     ["id", "int"],
@@ -181,6 +237,46 @@ def test_get_comment_from_dte_output():
     assert get_comment_from_dte_output(FMT_SAMPLE_DT_OUTPUT) == "some comment"
 
 
+def test_get_table_options_from_dte_output():
+    assert get_table_options_from_dte_output(FMT_SAMPLE_DT_OUTPUT) == {
+        "databricks_table_properties": {
+            "delta.checkpoint.writeStatsAsJson": "false",
+            "delta.checkpoint.writeStatsAsStruct": "true",
+            "delta.minReaderVersion": "1",
+            "delta.minWriterVersion": "2",
+        }
+    }
+
+
+def test_get_partitioning_and_clustering_from_dte_output():
+    dte_output = [
+        {"col_name": col_name, "data_type": data_type}
+        for col_name, data_type in [
+            ["id", "int"],
+            ["day", "date"],
+            ["region", "string"],
+            ["", ""],
+            ["# Partition Information", ""],
+            ["# col_name", "data_type"],
+            ["day", "date"],
+            ["region", "string"],
+            ["", ""],
+            ["# Clustering Information", ""],
+            ["# col_name", "data_type"],
+            ["id", "int"],
+            ["", ""],
+            ["# Detailed Table Information", ""],
+            ["Table Properties", "[a.b=x,y,c=]"],
+        ]
+    ]
+
+    assert get_table_options_from_dte_output(dte_output) == {
+        "databricks_partition_by": ["day", "region"],
+        "databricks_cluster_by": ["id"],
+        "databricks_table_properties": {"a.b": "x,y", "c": ""},
+    }
+
+
 def get_databricks_non_compound_types():
     return [
         Integer(),
@@ -199,7 +295,11 @@ def get_databricks_non_compound_types():
 
 
 def get_databricks_compound_types():
-    return [DatabricksArray(String), DatabricksMap(String, String)]
+    return [
+        DatabricksArray(String),
+        DatabricksMap(String, String),
+        DatabricksStruct([("a", Integer), ("b c", String)]),
+    ]
 
 
 @pytest.mark.parametrize("internal_type", get_databricks_non_compound_types())
@@ -252,3 +352,99 @@ def test_multilevel_map_type_parsing(internal_type):
         internal_type.compile(dialect=dialect)
     )
     assert actual_parsed == expected_parsed
+
+
+def test_struct_parsing():
+    struct_type = DatabricksStruct(
+        [("id", BigInteger), ("select", DatabricksArray(String))]
+    )
+
+    assert (
+        struct_type.compile(dialect=dialect)
+        == "STRUCT<id:BIGINT,`select`:ARRAY<STRING>>"
+    )
+
+
+@pytest.mark.parametrize(
+    "type_name, expected",
+    [
+        ("INT", Integer),
+        ("string", String),
+        ("INTERVAL DAY TO SECOND", String),
+        ("TIMESTAMP_NTZ", TIMESTAMP_NTZ),
+    ],
+)
+def test_parse_simple_type_string(type_name, expected):
+    assert parse_type_string(type_name) is expected
+
+
+def test_parse_parameterised_type_strings():
+    decimal = parse_type_string("DECIMAL(18,5)")
+    varchar = parse_type_string("VARCHAR(10)")
+
+    assert (decimal.precision, decimal.scale) == (18, 5)
+    assert varchar.length == 10
+
+
+def test_parse_nested_type_string():
+    parsed = parse_type_string(
+        "ARRAY<MAP<STRING,STRUCT<a:INT,`b c`: DECIMAL(10,2) NOT NULL COMMENT 'x, y'>>>"
+    )
+
+    assert isinstance(parsed, DatabricksArray)
+    assert isinstance(parsed.item_type, DatabricksMap)
+    struct = parsed.item_type.value_type
+    assert isinstance(struct, DatabricksStruct)
+    assert [name for name, _ in struct.fields] == ["a", "b c"]
+    assert struct.fields[1][1].scale == 2
+
+
+@pytest.mark.parametrize(
+    "internal_type",
+    get_databricks_non_compound_types() + get_databricks_compound_types(),
+)
+def test_parse_type_string_round_trip(internal_type):
+    compiled = DatabricksArray(internal_type).compile(dialect=dialect)
+    parsed = parse_type_string(compiled)
+
+    assert parsed.compile(dialect=dialect) == compiled
+
+
+@pytest.mark.parametrize(
+    "type_name", ["GEOMETRY(ANY)", "GEOGRAPHY(4326)", "ARRAY<GEOMETRY(ANY)>"]
+)
+def test_parse_unrecognised_type_string(type_name):
+    with pytest.warns(SAWarning):
+        parsed = parse_type_string(type_name)
+
+    if isinstance(parsed, DatabricksArray):
+        assert isinstance(parsed.item_type, NullType)
+    else:
+        assert parsed is NullType
+
+
+def test_parse_type_string_returns_copies():
+    first = parse_type_string("ARRAY<VARCHAR(10)>")
+    first.item_type.length = 20
+
+    assert parse_type_string("ARRAY<VARCHAR(10)>").item_type.length == 10
+
+
+def test_parse_malformed_type_string():
+    with pytest.raises(DatabricksSqlAlchemyParseException):
+        parse_type_string("MAP<STRING>")
+
+
+@pytest.mark.parametrize(
+    "tschema, expected",
+    [
+        ("default", (None, "default")),
+        ("main.default", ("main", "default")),
+        ("`my.catalog`.default", ("my.catalog", "default")),
+        ("`a``b`.default", ("a`b", "default")),
+    ],
+)
+def test_split_catalog_schema(tschema, expected):
+    assert split_catalog_schema(tschema) == expected
+    if expected[0] is not None:
+        assert join_catalog_schema(*expected) == tschema
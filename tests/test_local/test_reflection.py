@@ -0,0 +1,1414 @@
+"""Tests for the batched reflection methods of DatabricksDialect.
+
+These tests mock the DBAPI cursor and the SQLAlchemy connection, so no warehouse is required.
+"""
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy
+from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy.engine import reflection
+from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+from databricks.sqlalchemy import (
+    DatabricksDialect,
+    get_view_definitions,
+    load_deferred_reflection,
+    reflect_parallel,
+    refresh_reflected_metadata,
+)
+from databricks.sqlalchemy._parse import parse_column_info_from_tgetcolumnsresponse
+from databricks.sqlalchemy._reflection import VERSION_INFO_KEY
+
+TGetColumnsRow = namedtuple(
+    "TGetColumnsRow",
+    ["TABLE_NAME", "COLUMN_NAME", "TYPE_NAME", "NULLABLE", "COLUMN_DEF", "REMARKS"],
+)
+
+COLUMNS_RESPONSE = [
+    TGetColumnsRow("users", "id", "BIGINT", 0, None, "primary key"),
+    TGetColumnsRow("users", "name", "STRING", 1, None, ""),
+    TGetColumnsRow("orders", "id", "INT", 0, None, None),
+    TGetColumnsRow("orders", "total", "DECIMAL(18,5)", 1, None, None),
+]
+
+
+def fake_tgetcolumns(catalog_name, schema_name, table_name):
+    """Mimic TGetColumnsRequest, where table_name=None matches every table"""
+    rows = [r for r in COLUMNS_RESPONSE if table_name in (None, r.TABLE_NAME)]
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    return result
+
+
+class GeneratedColumnRow(
+    namedtuple(
+        "GeneratedColumnRow",
+        [
+            "table_name",
+            "column_name",
+            "is_identity",
+            "identity_generation",
+            "identity_start",
+            "identity_increment",
+            "is_generated",
+            "generation_expression",
+        ],
+    )
+):
+    identity_minimum = identity_maximum = None
+    identity_cycle = "NO"
+
+
+@pytest.fixture
+def cursor():
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.columns.side_effect = fake_tgetcolumns
+    return cursor
+
+
+@pytest.fixture
+def dialect(cursor):
+    dialect = DatabricksDialect()
+    dialect.catalog = "main"
+    dialect.schema = "default"
+    dialect.get_connection_cursor = MagicMock(return_value=cursor)
+    dialect.get_table_names = MagicMock(return_value=["users", "orders", "empty"])
+    dialect._describe_table_extended = MagicMock(return_value=None)
+    return dialect
+
+
+class TestGetMultiColumns:
+    def test_single_request_for_whole_schema(self, dialect, cursor):
+        result = dict(dialect.get_multi_columns(MagicMock(), info_cache={}))
+
+        cursor.columns.assert_any_call(
+            catalog_name="main", schema_name="default", table_name=None
+        )
+        assert list(result) == [(None, "users"), (None, "orders"), (None, "empty")]
+        assert [c["name"] for c in result[(None, "users")]] == ["id", "name"]
+        assert result[(None, "users")][0]["comment"] == "primary key"
+        assert result[(None, "orders")][1]["type"].precision == 18
+
+    def test_identity_and_generated_columns(self, dialect):
+        dialect.reflect_generated_columns = True
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            GeneratedColumnRow("users", "id", "YES", "ALWAYS", "1", "1", None, None),
+            GeneratedColumnRow(
+                "orders", "total", "NO", None, None, None, "ALWAYS", "id * 2"
+            ),
+        ]
+
+        batched = dict(dialect.get_multi_columns(connection, info_cache={}))
+        users, orders = batched[(None, "users")], batched[(None, "orders")]
+
+        assert users[0]["identity"] == {
+            "always": True,
+            "start": 1,
+            "increment": 1,
+            "cycle": False,
+        }
+        assert users[0]["autoincrement"] is True
+        assert "identity" not in users[1]
+        assert orders[1]["computed"] == {"sqltext": "id * 2", "persisted": True}
+        (stmt, params), _ = connection.execute.call_args
+        assert "`main`.information_schema.columns" in str(stmt)
+        assert params == {"schema": "default"}
+
+    def test_identity_for_a_single_table(self, dialect):
+        dialect.reflect_generated_columns = True
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            GeneratedColumnRow("users", "id", "YES", "BY DEFAULT", "5", "2", None, None)
+        ]
+
+        (column, _) = dialect.get_columns(connection, "users")
+
+        assert column["identity"] == {
+            "always": False,
+            "start": 5,
+            "increment": 2,
+            "cycle": False,
+        }
+        (_, params), _ = connection.execute.call_args
+        assert params == {"schema": "default", "table_name": "users"}
+
+    def test_generated_columns_are_opt_in(self, dialect):
+        connection = MagicMock()
+
+        (column, _) = dialect.get_columns(connection, "users")
+
+        assert "identity" not in column
+        connection.execute.assert_not_called()
+
+    def test_catalog_without_information_schema(self, dialect):
+        dialect.reflect_generated_columns = True
+        connection = MagicMock()
+        connection.execute.side_effect = sqlalchemy.exc.DatabaseError(
+            "SELECT", {}, Exception("[TABLE_OR_VIEW_NOT_FOUND] ...")
+        )
+
+        batched = dict(
+            dialect.get_multi_columns(
+                connection, schema="hive_metastore.default", info_cache={}
+            )
+        )
+
+        assert [c["name"] for c in batched[("hive_metastore.default", "users")]] == [
+            "id",
+            "name",
+        ]
+        assert "identity" not in batched[("hive_metastore.default", "users")][0]
+
+    def test_table_without_columns_is_verified(self, dialect):
+        result = dict(dialect.get_multi_columns(MagicMock(), info_cache={}))
+
+        assert result[(None, "empty")] == []
+        dialect._describe_table_extended.assert_called_once()
+
+    def test_matches_get_columns(self, dialect):
+        batched = dict(dialect.get_multi_columns(MagicMock(), info_cache={}))
+        single = dialect.get_columns(MagicMock(), "users")
+
+        assert [c["name"] for c in batched[(None, "users")]] == [
+            c["name"] for c in single
+        ]
+
+    def test_filter_names(self, dialect):
+        result = dict(
+            dialect.get_multi_columns(
+                MagicMock(), filter_names=["orders"], info_cache={}
+            )
+        )
+        assert list(result) == [(None, "orders")]
+
+    def test_autoload_requests_only_one_table(self, dialect, cursor):
+        dict(
+            dialect.get_multi_columns(
+                MagicMock(),
+                filter_names=["users"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+                info_cache={},
+            )
+        )
+
+        cursor.columns.assert_called_once_with(
+            catalog_name="main", schema_name="default", table_name="users"
+        )
+        dialect.get_table_names.assert_not_called()
+
+    def test_autoload_missing_table_is_skipped(self, dialect):
+        dialect._describe_table_extended.side_effect = sqlalchemy.exc.NoSuchTableError(
+            "missing"
+        )
+        result = dict(
+            dialect.get_multi_columns(
+                MagicMock(),
+                filter_names=["missing"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+                info_cache={},
+            )
+        )
+        assert result == {}
+
+
+PkRow = namedtuple("PkRow", ["table_name", "constraint_name", "column_name"])
+FkRow = namedtuple(
+    "FkRow",
+    [
+        "table_name",
+        "constraint_name",
+        "column_name",
+        "referred_schema",
+        "referred_table",
+        "referred_column",
+    ],
+)
+
+
+class TestGetMultiConstraints:
+    @pytest.fixture
+    def connection(self):
+        return MagicMock()
+
+    def test_pk_constraints_from_one_query(self, dialect, connection):
+        connection.execute.return_value.all.return_value = [
+            PkRow("users", "users_pk", "id"),
+            PkRow("orders", "orders_pk", "id"),
+            PkRow("orders", "orders_pk", "line"),
+        ]
+
+        result = dict(dialect.get_multi_pk_constraint(connection, info_cache={}))
+
+        connection.execute.assert_called_once()
+        assert result == {
+            (None, "users"): {"constrained_columns": ["id"], "name": "users_pk"},
+            (None, "orders"): {
+                "constrained_columns": ["id", "line"],
+                "name": "orders_pk",
+            },
+            (None, "empty"): dialect.EMPTY_PK,
+        }
+
+    @pytest.mark.parametrize("tschema", [None, "default"])
+    def test_foreign_keys_from_one_query(self, dialect, connection, tschema):
+        connection.execute.return_value.all.return_value = [
+            FkRow("orders", "orders_fk", "user_id", "default", "users", "id"),
+        ]
+
+        result = dict(
+            dialect.get_multi_foreign_keys(connection, schema=tschema, info_cache={})
+        )
+
+        connection.execute.assert_called_once()
+        assert connection.execute.call_args.args[1] == {"schema": "default"}
+        assert result[(tschema, "orders")] == [
+            {
+                "name": "orders_fk",
+                "constrained_columns": ["user_id"],
+                "referred_table": "users",
+                "referred_columns": ["id"],
+                "referred_schema": tschema,
+            }
+        ]
+        assert result[(tschema, "users")] == dialect.EMPTY_FK
+
+    def test_foreign_key_to_another_catalog(self, dialect, connection):
+        # The referred table isn't in this catalog's key_column_usage, so ref is unmatched
+        connection.execute.return_value.all.return_value = [
+            FkRow("orders", "orders_fk", "user_id", None, None, None),
+        ]
+        dialect._describe_table_extended.return_value = [
+            {
+                "col_name": "orders_fk",
+                "data_type": "FOREIGN KEY (`user_id`) REFERENCES `crm`.`people`.`users` (`id`)",
+            }
+        ]
+
+        result = dict(dialect.get_multi_foreign_keys(connection, info_cache={}))
+
+        assert "LEFT JOIN" in str(connection.execute.call_args.args[0])
+        assert result[(None, "orders")] == [
+            {
+                "name": "orders_fk",
+                "constrained_columns": ["user_id"],
+                "referred_table": "users",
+                "referred_columns": ["id"],
+                "referred_schema": "crm.people",
+            }
+        ]
+
+    def test_autoload_reads_describe_table_extended(self, dialect, connection):
+        dialect._describe_table_extended.return_value = [
+            {"col_name": "orders_pk", "data_type": "PRIMARY KEY (`id`)"}
+        ]
+
+        result = dict(
+            dialect.get_multi_pk_constraint(
+                connection,
+                filter_names=["orders"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+                info_cache={},
+            )
+        )
+
+        assert result == {
+            (None, "orders"): {"constrained_columns": ["id"], "name": "orders_pk"}
+        }
+        connection.execute.assert_not_called()
+
+
+DteRow = namedtuple("DteRow", ["col_name", "data_type"])
+
+DTE_RESPONSE = [
+    DteRow("id", "bigint"),
+    DteRow("user_id", "bigint"),
+    DteRow("", ""),
+    DteRow("# Partition Information", ""),
+    DteRow("# col_name", "data_type"),
+    DteRow("user_id", "bigint"),
+    DteRow("", ""),
+    DteRow("# Detailed Table Information", ""),
+    DteRow("Comment", "some comment"),
+    DteRow("Table Properties", "[delta.minReaderVersion=1]"),
+    DteRow("", ""),
+    DteRow("# Constraints", ""),
+    DteRow("orders_pk", "PRIMARY KEY (`id`)"),
+    DteRow(
+        "orders_fk",
+        "FOREIGN KEY (`user_id`) REFERENCES `main`.`default`.`users` (`id`)",
+    ),
+]
+
+
+class TestDescribeTableExtendedMemo:
+    @pytest.fixture
+    def dialect(self):
+        dialect = DatabricksDialect()
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = DTE_RESPONSE
+        return connection
+
+    def test_one_describe_per_inspection(self, dialect, connection):
+        info_cache: dict = {}
+
+        assert dialect.get_pk_constraint(connection, "orders", info_cache=info_cache)
+        assert dialect.get_foreign_keys(connection, "orders", info_cache=info_cache)
+        assert dialect.get_table_comment(
+            connection, "orders", schema="default", info_cache=info_cache
+        ) == {"text": "some comment"}
+        assert dialect.get_table_options(
+            connection, "orders", info_cache=info_cache
+        ) == {
+            "databricks_partition_by": ["user_id"],
+            "databricks_table_properties": {"delta.minReaderVersion": "1"},
+        }
+
+        connection.execute.assert_called_once()
+
+    def test_multi_table_options_skips_missing_tables(self, dialect, connection):
+        def execute(stmt):
+            if "`gone`" in str(stmt):
+                raise sqlalchemy.exc.DatabaseError(
+                    "DESCRIBE", {}, Exception("[TABLE_OR_VIEW_NOT_FOUND] ...")
+                )
+            return connection.execute.return_value
+
+        connection.execute.side_effect = execute
+        dialect.reflect_table_options = True
+        result = dict(
+            dialect.get_multi_table_options(
+                connection,
+                filter_names=["orders", "gone"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+                info_cache={},
+            )
+        )
+
+        assert list(result) == [(None, "orders")]
+        assert result[(None, "orders")]["databricks_partition_by"] == ["user_id"]
+
+    def test_keyed_by_table(self, dialect, connection):
+        info_cache: dict = {}
+
+        dialect.get_pk_constraint(connection, "orders", info_cache=info_cache)
+        dialect.get_pk_constraint(connection, "users", info_cache=info_cache)
+
+        assert connection.execute.call_count == 2
+
+    def test_not_memoised_without_info_cache(self, dialect, connection):
+        dialect.get_pk_constraint(connection, "orders")
+        dialect.get_foreign_keys(connection, "orders")
+
+        assert connection.execute.call_count == 2
+
+
+class TestAutoload:
+    @pytest.fixture
+    def engine(self):
+        """An engine whose DBAPI cursor answers TGetColumnsRequest with the columns of `orders`
+        and DESCRIBE TABLE EXTENDED with DTE_RESPONSE. engine.round_trips records each request.
+        """
+        round_trips = []
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+
+        def columns(catalog_name, schema_name, table_name):
+            round_trips.append(f"TGetColumnsRequest {table_name}")
+            result = MagicMock()
+            result.fetchall.return_value = [
+                COLUMNS_RESPONSE[2],
+                TGetColumnsRow("orders", "user_id", "BIGINT", 1, None, None),
+            ]
+            return result
+
+        def execute(operation, parameters=None):
+            round_trips.append(operation)
+            rows = DTE_RESPONSE if operation.startswith("DESCRIBE") else []
+            cursor.description = [
+                (name, "string", None, None, None, None, None)
+                for name in ("col_name", "data_type")
+            ]
+            cursor.fetchall.return_value = [tuple(row) for row in rows]
+
+        cursor.columns.side_effect = columns
+        cursor.execute.side_effect = execute
+
+        dbapi_connection = MagicMock()
+        dbapi_connection.cursor.return_value = cursor
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=lambda: dbapi_connection,
+        )
+        with engine.connect():
+            pass
+        round_trips.clear()
+        engine.round_trips = round_trips
+        return engine
+
+    def test_single_table_reads_one_describe(self, engine):
+        orders = sqlalchemy.Table(
+            "orders", MetaData(), autoload_with=engine, resolve_fks=False
+        )
+
+        assert [c.name for c in orders.primary_key] == ["id"]
+        (fk,) = orders.foreign_keys
+        assert fk.target_fullname == "users.id"
+        assert orders.comment == "some comment"
+        assert orders.dialect_options["databricks"]["partition_by"] == ["user_id"]
+        assert engine.round_trips == [
+            "TGetColumnsRequest orders",
+            "DESCRIBE TABLE EXTENDED `main`.`default`.`orders`",
+        ]
+
+
+ShowTablesRow = namedtuple("ShowTablesRow", ["database", "tableName", "isTemporary"])
+
+
+class TestHasTable:
+    @pytest.fixture
+    def dialect(self):
+        dialect = DatabricksDialect()
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            ShowTablesRow("default", "orders", False),
+            ShowTablesRow("", "tmp_view", True),
+        ]
+        return connection
+
+    def statements(self, connection):
+        return [str(c.args[0]) for c in connection.execute.call_args_list]
+
+    def test_single_check_uses_like(self, dialect, connection):
+        assert dialect.has_table(connection, "Orders")
+        assert self.statements(connection) == [
+            "SHOW TABLES FROM `main`.`default` LIKE 'Orders'"
+        ]
+
+    def test_unusual_names_are_not_used_as_a_pattern(self, dialect, connection):
+        assert not dialect.has_table(connection, "it's")
+        assert self.statements(connection) == ["SHOW TABLES FROM `main`.`default`"]
+
+    def test_hits_and_misses_share_one_listing_per_inspection(
+        self, dialect, connection
+    ):
+        info_cache: dict = {}
+
+        assert dialect.has_table(connection, "orders", info_cache=info_cache)
+        assert dialect.has_table(connection, "tmp_view", info_cache=info_cache)
+        assert not dialect.has_table(connection, "users", info_cache=info_cache)
+        assert not dialect.has_table(connection, "users", info_cache=info_cache)
+
+        connection.execute.assert_called_once()
+
+    def test_has_multi_table(self, dialect, connection):
+        result = dict(
+            dialect.has_multi_table(connection, ["orders", "users"], schema="default")
+        )
+
+        assert result == {("default", "orders"): True, ("default", "users"): False}
+        assert self.statements(connection) == ["SHOW TABLES FROM `main`.`default`"]
+
+    def test_missing_schema(self, dialect, connection):
+        connection.execute.side_effect = sqlalchemy.exc.DatabaseError(
+            "SHOW TABLES", {}, Exception("[SCHEMA_NOT_FOUND] The schema `nope`...")
+        )
+        assert not dialect.has_table(connection, "orders", schema="nope")
+
+    def test_create_all_checks_each_schema_once(self):
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+        )
+        metadata = MetaData()
+        for name in ("a", "b", "c"):
+            sqlalchemy.Table(
+                name, metadata, sqlalchemy.Column("id", sqlalchemy.Integer)
+            )
+
+        listings = []
+
+        def show_table_names(connection, catalog_name, schema_name, like=None):
+            listings.append(like)
+            return {"a", "b", "c"}
+
+        engine.dialect._show_table_names = show_table_names  # type: ignore
+        metadata.create_all(engine)
+
+        # 2.1 checks the tables with one has_multi_table() call. 2.0 calls has_table() per table,
+        # which lists the whole schema on its second call
+        if sqlalchemy.__version__.startswith("2.0"):
+            assert listings == ["a", None]
+        else:
+            assert listings == [None]
+
+    def test_statement_forgets_connection_listing(self):
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+        )
+        dialect = engine.dialect
+
+        listings = []
+
+        def show_table_names(connection, catalog_name, schema_name, like=None):
+            listings.append(like)
+            return {"a", "b"}
+
+        dialect._show_table_names = show_table_names  # type: ignore
+        with engine.connect() as connection:
+            assert dialect.has_table(connection, "a")
+            assert dialect.has_table(connection, "b")
+            assert not dialect.has_table(connection, "c")
+            assert listings == ["a", None]
+
+            connection.exec_driver_sql("CREATE TABLE c (id INT)")
+            dialect.has_table(connection, "c")
+
+        assert listings == ["a", None, "c"]
+
+
+class TestExistenceCache:
+    @pytest.fixture
+    def dialect(self):
+        dialect = DatabricksDialect(existence_cache_ttl=60)
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            ShowTablesRow("default", "orders", False),
+        ]
+        return connection
+
+    def test_hits_and_misses_shared_across_inspections(self, dialect, connection):
+        assert dialect.has_table(connection, "orders", info_cache={})
+        assert not dialect.has_table(connection, "users", info_cache={})
+        assert dict(
+            dialect.has_multi_table(connection, ["Orders", "users"], info_cache={})
+        ) == {(None, "Orders"): True, (None, "users"): False}
+
+        connection.execute.assert_called_once()
+
+    def test_a_listing_answers_for_every_table_in_the_schema(self, dialect, connection):
+        dict(dialect.has_multi_table(connection, ["orders", "users"]))
+
+        assert not dialect.has_table(connection, "refunds")
+        connection.execute.assert_called_once()
+
+    def test_expired_entries_are_refetched(self, dialect, connection, monkeypatch):
+        dialect.has_table(connection, "orders")
+        monkeypatch.setattr(dialect._existence_cache, "ttl", -1)
+        dialect.has_table(connection, "orders")
+
+        assert connection.execute.call_count == 2
+
+    def test_eviction(self, connection):
+        dialect = DatabricksDialect(
+            existence_cache_ttl=60, existence_cache_max_entries=2
+        )
+        dialect.catalog, dialect.schema = "main", "default"
+        for name in ("a", "b", "c"):
+            # A fresh connection for each check, so none of them lists the whole schema
+            dialect.has_table(connection, name)
+            dialect._connection_listings.clear()
+        dialect.has_table(connection, "a")
+
+        assert connection.execute.call_count == 4
+
+    @pytest.mark.parametrize(
+        "ddl", [sqlalchemy.schema.CreateTable, sqlalchemy.schema.DropTable]
+    )
+    def test_executed_ddl_invalidates(self, ddl):
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+            existence_cache_ttl=60,
+        )
+        cache = engine.dialect._existence_cache
+        cache.set_many("main", "sales", {"orders": True, "users": True})
+        table = sqlalchemy.Table(
+            "orders", MetaData(), sqlalchemy.Column("id", sqlalchemy.Integer)
+        )
+
+        # Compiling alone leaves the cache alone
+        str(ddl(table).compile(dialect=engine.dialect))
+        assert cache.get("main", "sales", "orders")
+
+        with engine.connect() as connection:
+            connection.execution_options(
+                schema_translate_map={None: "main.sales"}
+            ).execute(ddl(table))
+
+        assert cache.get("main", "sales", "orders") is None
+        assert cache.get("main", "sales", "users")
+
+    def test_disabled_by_default(self, connection):
+        dialect = DatabricksDialect()
+        dialect.catalog, dialect.schema = "main", "default"
+        dialect.has_table(connection, "orders")
+        dialect.has_table(connection, "orders")
+
+        assert connection.execute.call_count == 2
+
+
+TablesRow = namedtuple(
+    "TablesRow", ["table_name", "table_type", "comment", "last_altered"]
+)
+
+TABLES_RESPONSE = [
+    TablesRow("events", "MANAGED", "all events", "2024-01-01 00:00:00"),
+    TablesRow("events_mv", "MATERIALIZED_VIEW", None, "2024-01-01 00:00:00"),
+    TablesRow("events_v", "VIEW", None, "2024-01-01 00:00:00"),
+    TablesRow("raw", "EXTERNAL", "", "2024-01-01 00:00:00"),
+]
+
+
+ViewsRow = namedtuple("ViewsRow", ["table_name", "view_definition"])
+
+
+class TestViewDefinition:
+    @pytest.fixture
+    def dialect(self):
+        dialect = DatabricksDialect()
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [
+            ViewsRow("users_v", "SELECT * FROM users"),
+            ViewsRow("orders_v", "SELECT * FROM orders"),
+        ]
+        return connection
+
+    def test_single_view(self, dialect, connection):
+        connection.execute.return_value.all.return_value = [
+            ViewsRow("users_v", "SELECT * FROM users")
+        ]
+
+        assert (
+            dialect.get_view_definition(connection, "Users_V", schema="other")
+            == "SELECT * FROM users"
+        )
+        (stmt, params), _ = connection.execute.call_args
+        assert "`main`.information_schema.views" in str(stmt)
+        assert "table_name = :view_name" in str(stmt)
+        assert params == {"schema": "other", "view_name": "users_v"}
+
+    def test_one_query_per_inspection(self, dialect, connection):
+        info_cache: dict = {}
+
+        assert (
+            dialect.get_view_definition(connection, "users_v", info_cache=info_cache)
+            == "SELECT * FROM users"
+        )
+        assert (
+            dialect.get_view_definition(connection, "orders_v", info_cache=info_cache)
+            == "SELECT * FROM orders"
+        )
+        with pytest.raises(sqlalchemy.exc.NoSuchTableError):
+            dialect.get_view_definition(connection, "users", info_cache=info_cache)
+
+        connection.execute.assert_called_once()
+        (stmt, _), _ = connection.execute.call_args
+        assert "view_name" not in str(stmt)
+
+    @pytest.fixture
+    def hive_connection(self, dialect, monkeypatch):
+        """A connection to a catalog without information_schema, where users_v is a view"""
+
+        def describe(connection, table_name, catalog_name, schema_name, **kw):
+            rows = [{"col_name": "id", "data_type": "int"}]
+            if table_name == "users_v":
+                rows.append(
+                    {"col_name": "View Text", "data_type": "SELECT * FROM users"}
+                )
+            return rows
+
+        monkeypatch.setattr(dialect, "_describe_table_extended", describe)
+        monkeypatch.setattr(dialect, "get_view_names", lambda *a, **kw: ["users_v"])
+        connection = MagicMock()
+        connection.execute.side_effect = sqlalchemy.exc.DatabaseError(
+            "SELECT", {}, Exception("[TABLE_OR_VIEW_NOT_FOUND] ...")
+        )
+        return connection
+
+    def test_describes_view_without_information_schema(self, dialect, hive_connection):
+        assert (
+            dialect.get_view_definition(hive_connection, "users_v")
+            == "SELECT * FROM users"
+        )
+        with pytest.raises(sqlalchemy.exc.NoSuchTableError):
+            dialect.get_view_definition(hive_connection, "users")
+
+    def test_describes_each_view_without_information_schema(
+        self, dialect, hive_connection
+    ):
+        info_cache: dict = {}
+
+        assert dialect._get_view_definitions(
+            hive_connection, info_cache=info_cache
+        ) == {"users_v": "SELECT * FROM users"}
+        assert (
+            dialect.get_view_definition(
+                hive_connection, "users_v", info_cache=info_cache
+            )
+            == "SELECT * FROM users"
+        )
+
+    def test_get_view_definitions(self, monkeypatch):
+        monkeypatch.setattr(
+            DatabricksDialect,
+            "_query_view_definitions",
+            MagicMock(return_value={"users_v": "SELECT * FROM users"}),
+        )
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+        )
+
+        assert get_view_definitions(engine) == {"users_v": "SELECT * FROM users"}
+
+
+class TestTableAndViewNames:
+    @pytest.fixture
+    def dialect(self):
+        dialect = DatabricksDialect()
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = TABLES_RESPONSE
+        return connection
+
+    def test_names_from_one_query(self, dialect, connection):
+        info_cache: dict = {}
+
+        tables = dialect.get_table_names(connection, info_cache=info_cache)
+        views = dialect.get_view_names(connection, info_cache=info_cache)
+        mvs = dialect.get_materialized_view_names(connection, info_cache=info_cache)
+
+        assert tables == ["events", "raw"]
+        assert views == ["events_mv", "events_v"]
+        assert mvs == ["events_mv"]
+        connection.execute.assert_called_once()
+        assert connection.execute.call_args.args[1] == {"schema": "default"}
+
+    def test_temp_views_use_show_views(self, dialect, connection):
+        ViewsRow = namedtuple("ViewsRow", ["viewName", "isTemporary"])
+        connection.execute.return_value.all.return_value = [
+            ViewsRow("tmp", True),
+            ViewsRow("events_v", False),
+        ]
+
+        assert dialect.get_temp_view_names(connection) == ["tmp"]
+        assert "SHOW VIEWS FROM" in str(connection.execute.call_args.args[0])
+
+    def test_multi_table_comment(self, dialect, connection):
+        result = dict(dialect.get_multi_table_comment(connection, info_cache={}))
+
+        assert result == {
+            (None, "events"): {"text": "all events"},
+            (None, "raw"): {"text": None},
+        }
+        connection.execute.assert_called_once()
+
+    def test_identifiers_are_lowercased(self, dialect, connection):
+        assert dialect.get_table_names(connection, schema="Sales") == ["events", "raw"]
+        assert connection.execute.call_args.args[1] == {"schema": "sales"}
+
+        connection.execute.return_value.all.return_value = [
+            PkRow("orders", "orders_pk", "id")
+        ]
+        result = dict(
+            dialect.get_multi_pk_constraint(
+                connection,
+                schema="Sales",
+                filter_names=["Orders", "Users"],
+                kind=ObjectKind.ANY,
+                scope=ObjectScope.ANY,
+                info_cache={},
+            )
+        )
+        assert connection.execute.call_args.args[1] == {"schema": "sales"}
+        assert result == {
+            ("Sales", "Orders"): {"constrained_columns": ["id"], "name": "orders_pk"},
+            ("Sales", "Users"): dialect.EMPTY_PK,
+        }
+
+    def test_catalog_without_information_schema(self, dialect, connection):
+        ShowTablesRow = namedtuple("ShowTablesRow", ["tableName", "isTemporary"])
+        ShowViewsRow = namedtuple(
+            "ShowViewsRow", ["viewName", "isTemporary", "isMaterialized"]
+        )
+
+        def execute(stmt, params=None):
+            result = MagicMock()
+            if "information_schema" in str(stmt):
+                raise sqlalchemy.exc.DatabaseError(
+                    "SELECT", {}, Exception("[TABLE_OR_VIEW_NOT_FOUND] ...")
+                )
+            elif str(stmt).startswith("SHOW TABLES"):
+                result.all.return_value = [
+                    ShowTablesRow("events", False),
+                    ShowTablesRow("events_v", False),
+                    ShowTablesRow("tmp", True),
+                ]
+            elif str(stmt).startswith("SHOW VIEWS"):
+                result.all.return_value = [
+                    ShowViewsRow("events_v", False, False),
+                    ShowViewsRow("tmp", True, False),
+                ]
+            else:
+                result.all.return_value = DTE_RESPONSE
+            return result
+
+        connection.execute.side_effect = execute
+        info_cache: dict = {}
+        schema = "hive_metastore.default"
+
+        assert dialect.get_table_names(connection, schema, info_cache=info_cache) == [
+            "events"
+        ]
+        assert dialect.get_view_names(connection, schema, info_cache=info_cache) == [
+            "events_v"
+        ]
+        assert dict(
+            dialect.get_multi_pk_constraint(
+                connection, schema=schema, info_cache=info_cache
+            )
+        ) == {(schema, "events"): {"constrained_columns": ["id"], "name": "orders_pk"}}
+        assert dict(
+            dialect.get_multi_table_comment(
+                connection, schema=schema, info_cache=info_cache
+            )
+        ) == {(schema, "events"): {"text": "some comment"}}
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """An engine whose batched reflection queries are faked and record the connection they ran on.
+    Tests can change engine.results to change what the queries return.
+    """
+    calls: dict = {}
+    results: dict = {}
+
+    def fake(name, result):
+        results[name] = result
+
+        def lookup(self, connection, **kw):
+            calls.setdefault(name, []).append(connection)
+            return results[name]
+
+        # reflection.cache keys its entries on the function's name
+        lookup.__name__ = name
+        return reflection.cache(lookup)
+
+    monkeypatch.setattr(
+        DatabricksDialect,
+        "_get_information_schema_tables",
+        fake(
+            "tables",
+            [TablesRow("users", "MANAGED", "people", None)]
+            + [TablesRow("orders", "MANAGED", None, None)],
+        ),
+    )
+    monkeypatch.setattr(
+        DatabricksDialect,
+        "_get_columns_by_table",
+        fake(
+            "columns",
+            {
+                "users": [
+                    parse_column_info_from_tgetcolumnsresponse(COLUMNS_RESPONSE[0])
+                ],
+                "orders": [
+                    parse_column_info_from_tgetcolumnsresponse(COLUMNS_RESPONSE[2]),
+                    parse_column_info_from_tgetcolumnsresponse(
+                        TGetColumnsRow("orders", "user_id", "BIGINT", 1, None, None)
+                    ),
+                ],
+            },
+        ),
+    )
+    monkeypatch.setattr(
+        DatabricksDialect,
+        "_get_pk_constraints_by_table",
+        fake("pk", {"users": {"constrained_columns": ["id"], "name": "users_pk"}}),
+    )
+    monkeypatch.setattr(
+        DatabricksDialect,
+        "_get_foreign_keys_by_table",
+        fake(
+            "fk",
+            {
+                "orders": [
+                    {
+                        "name": "orders_fk",
+                        "constrained_columns": ["user_id"],
+                        "referred_table": "users",
+                        "referred_columns": ["id"],
+                        "referred_schema": None,
+                    }
+                ]
+            },
+        ),
+    )
+
+    def describe(self, connection, table_name, **kw):
+        """DESCRIBE TABLE EXTENDED of a table, consistent with the faked queries above"""
+        calls.setdefault("describe", []).append(connection)
+        rows = []
+        pk = results["pk"].get(table_name)
+        if pk:
+            columns = ", ".join(f"`{c}`" for c in pk["constrained_columns"])
+            rows.append(
+                {"col_name": pk["name"], "data_type": f"PRIMARY KEY ({columns})"}
+            )
+        for fk in results["fk"].get(table_name, []):
+            columns = ", ".join(f"`{c}`" for c in fk["constrained_columns"])
+            referred = ", ".join(f"`{c}`" for c in fk["referred_columns"])
+            rows.append(
+                {
+                    "col_name": fk["name"],
+                    "data_type": f"FOREIGN KEY ({columns}) REFERENCES "
+                    f"`main`.`default`.`{fk['referred_table']}` ({referred})",
+                }
+            )
+        for row in results["tables"]:
+            if row.table_name == table_name and row.comment:
+                rows.append({"col_name": "Comment", "data_type": row.comment})
+        return rows
+
+    monkeypatch.setattr(DatabricksDialect, "_describe_table_extended", describe)
+
+    engine = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+        creator=MagicMock,
+    )
+    engine.calls = calls
+    engine.results = results
+    return engine
+
+
+class TestMultiCatalog:
+    @pytest.fixture
+    def connection(self):
+        return MagicMock()
+
+    def test_columns(self, dialect, cursor):
+        dict(
+            dialect.get_multi_columns(MagicMock(), schema="other.sales", info_cache={})
+        )
+
+        cursor.columns.assert_any_call(
+            catalog_name="other", schema_name="sales", table_name=None
+        )
+
+    def test_information_schema_of_the_catalog(self, dialect, connection):
+        connection.execute.return_value.all.return_value = [
+            FkRow("orders", "orders_fk", "user_id", "sales", "users", "id"),
+        ]
+
+        result = dict(
+            dialect.get_multi_foreign_keys(
+                connection, schema="`my.catalog`.sales", info_cache={}
+            )
+        )
+
+        assert "`my.catalog`.information_schema.referential_constraints" in str(
+            connection.execute.call_args.args[0]
+        )
+        assert connection.execute.call_args.args[1] == {"schema": "sales"}
+        (fk,) = result[("`my.catalog`.sales", "orders")]
+        assert fk["referred_schema"] == "`my.catalog`.sales"
+
+    def test_table_and_view_names(self, dialect, connection):
+        del dialect.get_table_names
+        connection.execute.return_value.all.return_value = []
+
+        dialect.get_table_names(connection, schema="other.sales")
+
+        assert "`other`.information_schema.tables" in str(
+            connection.execute.call_args.args[0]
+        )
+        assert connection.execute.call_args.args[1] == {"schema": "sales"}
+
+    def test_describe_table_extended(self, dialect, connection):
+        dialect._describe_table_extended = MagicMock(return_value=[])
+
+        dialect.get_pk_constraint(connection, "orders", schema="other.sales")
+
+        assert (
+            dialect._describe_table_extended.call_args.kwargs["catalog_name"] == "other"
+        )
+        assert (
+            dialect._describe_table_extended.call_args.kwargs["schema_name"] == "sales"
+        )
+
+    def test_catalog_and_schema_names(self, dialect, connection):
+        CatalogRow = namedtuple("CatalogRow", ["catalog"])
+        connection.execute.return_value = [CatalogRow("main"), CatalogRow("other")]
+
+        assert dialect.get_catalog_names(connection) == ["main", "other"]
+        assert str(connection.execute.call_args.args[0]) == "SHOW CATALOGS"
+
+        dialect.get_schema_names(connection, catalog="other")
+        assert str(connection.execute.call_args.args[0]) == "SHOW SCHEMAS IN `other`"
+
+    def test_qualified_schema_in_statements(self, dialect):
+        metadata = MetaData()
+        table = sqlalchemy.Table(
+            "orders", metadata, sqlalchemy.Column("id", sqlalchemy.Integer)
+        )
+        other = sqlalchemy.Table(
+            "orders",
+            metadata,
+            sqlalchemy.Column("id", sqlalchemy.Integer),
+            schema="other.sales",
+        )
+
+        assert "FROM other.sales.orders" in str(
+            sqlalchemy.select(other).compile(dialect=dialect)
+        )
+
+        translate_map = {None: "`my.catalog`.sales"}
+        compiled = sqlalchemy.select(table).compile(
+            dialect=dialect, schema_translate_map=translate_map
+        )
+        preparer = dialect.identifier_preparer._with_schema_translate(translate_map)
+        assert "FROM `my.catalog`.sales.orders" in preparer._render_schema_translates(
+            compiled.string, translate_map
+        )
+
+
+class TestReflectParallel:
+    def test_reflects_schema(self, engine):
+        metadata = MetaData()
+        reflect_parallel(engine, metadata, max_workers=3)
+
+        assert set(metadata.tables) == {"users", "orders"}
+        assert metadata.tables["users"].comment == "people"
+        assert [c.name for c in metadata.tables["users"].primary_key] == ["id"]
+        (fk,) = metadata.tables["orders"].foreign_keys
+        assert fk.column is metadata.tables["users"].c.id
+
+    def test_each_query_runs_once_on_its_own_connection(self, engine):
+        reflect_parallel(engine, MetaData(), max_workers=3)
+
+        assert {name: len(conns) for name, conns in engine.calls.items()} == {
+            "tables": 1,
+            "columns": 1,
+            "pk": 1,
+            "fk": 1,
+        }
+        batch_connections = {
+            id(engine.calls[name][0]) for name in ("columns", "pk", "fk")
+        }
+        assert len(batch_connections) == 3
+
+    def test_views_leave_cached_table_names_alone(self, engine, monkeypatch):
+        engine.results["tables"].append(TablesRow("recent_orders", "VIEW", None, None))
+        engine.results["columns"]["recent_orders"] = [
+            parse_column_info_from_tgetcolumnsresponse(
+                TGetColumnsRow("recent_orders", "id", "INT", 0, None, None)
+            )
+        ]
+        table_names = []
+        get_table_names = reflection.Inspector.get_table_names
+
+        def spy(self, *args, **kw):
+            table_names.append(get_table_names(self, *args, **kw))
+            return table_names[-1]
+
+        monkeypatch.setattr(reflection.Inspector, "get_table_names", spy)
+        metadata = MetaData()
+        reflect_parallel(engine, metadata, views=True)
+
+        assert set(metadata.tables) == {"users", "orders", "recent_orders"}
+        assert all(names == ["users", "orders"] for names in table_names)
+
+    def test_table_options_are_opt_in(self, engine):
+        metadata = MetaData()
+        reflect_parallel(engine, metadata)
+
+        assert "describe" not in engine.calls
+        assert (
+            "partition_by"
+            not in metadata.tables["orders"].dialect_options["databricks"]
+        )
+
+    def test_table_options_spread_across_workers(self, engine):
+        engine.dialect.reflect_table_options = True
+        reflect_parallel(engine, MetaData(), max_workers=4)
+
+        # One DESCRIBE per table, each on a worker of its own
+        describes = engine.calls["describe"]
+        assert len(describes) == 2
+        assert len({id(connection) for connection in describes}) == 2
+
+
+class TestPrewarm:
+    def prewarmed_engine(self, prewarm_schemas=(None,), **kw):
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+            prewarm_schemas=prewarm_schemas,
+            **kw,
+        )
+        with engine.connect():
+            pass
+        engine.dialect._prewarm_thread.join()
+        return engine
+
+    @pytest.mark.parametrize("tschema", [None, "default"])
+    def test_first_connect_fills_the_reflection_cache(self, engine, tschema):
+        prewarmed = self.prewarmed_engine(prewarm_schemas=[tschema])
+        assert len(engine.calls["columns"]) == 1
+        assert len(engine.calls["pk"]) == 1
+
+        metadata = MetaData()
+        # The fake foreign key's referred_schema is always None, so don't follow it
+        metadata.reflect(prewarmed, schema=tschema, resolve_fks=False)
+
+        assert {t.name for t in metadata.tables.values()} == {"users", "orders"}
+        assert len(engine.calls["columns"]) == 1
+        assert len(engine.calls["pk"]) == 1
+        assert len(engine.calls["fk"]) == 1
+
+    def test_table_options(self, engine):
+        prewarmed = self.prewarmed_engine(reflect_table_options=True)
+        assert len(engine.calls["describe"]) == 2
+
+        MetaData().reflect(prewarmed, resolve_fks=False)
+
+        assert len(engine.calls["describe"]) == 2
+
+    def test_fills_the_existence_cache(self, engine, monkeypatch):
+        show_table_names = MagicMock(return_value={"users", "orders"})
+        monkeypatch.setattr(DatabricksDialect, "_show_table_names", show_table_names)
+        prewarmed = self.prewarmed_engine(existence_cache_ttl=60)
+
+        inspector = inspect(prewarmed)
+        assert inspector.has_table("users")
+        assert not inspector.has_table("refunds")
+        show_table_names.assert_called_once()
+
+    def test_runs_once(self, engine):
+        prewarmed = self.prewarmed_engine()
+        with prewarmed.connect(), prewarmed.connect():
+            pass
+
+        assert len(engine.calls["columns"]) == 1
+
+    def test_failure_is_logged(self, engine, caplog):
+        engine.results["columns"] = None
+        self.prewarmed_engine()
+
+        assert "Could not prewarm reflection of schema None" in caplog.text
+
+    def test_off_by_default(self, engine):
+        with engine.connect():
+            pass
+
+        assert engine.dialect._prewarm_thread is None
+        assert "columns" not in engine.calls
+
+
+class TestRefreshReflectedMetadata:
+    @pytest.fixture
+    def metadata(self, engine):
+        engine.results["tables"] = [
+            TablesRow("users", "MANAGED", "people", "v1"),
+            TablesRow("orders", "MANAGED", None, "v1"),
+        ]
+        metadata = MetaData()
+        reflect_parallel(engine, metadata)
+        return metadata
+
+    def test_versions_are_recorded(self, metadata):
+        assert {t.name: t.info[VERSION_INFO_KEY] for t in metadata.tables.values()} == {
+            "users": "v1",
+            "orders": "v1",
+        }
+
+    def test_unchanged(self, engine, metadata):
+        assert refresh_reflected_metadata(engine, metadata) == []
+        assert len(engine.calls["columns"]) == 1
+
+    def test_altered_table_is_updated_in_place(self, engine, metadata):
+        orders = metadata.tables["orders"]
+        engine.results["tables"] = [
+            TablesRow("users", "MANAGED", "people", "v1"),
+            TablesRow("orders", "MANAGED", "all orders", "v2"),
+        ]
+        engine.results["columns"]["orders"].append(
+            parse_column_info_from_tgetcolumnsresponse(
+                TGetColumnsRow("orders", "note", "STRING", 2, None, None)
+            )
+        )
+        engine.results["fk"] = {}
+
+        assert refresh_reflected_metadata(engine, metadata) == ["orders"]
+
+        assert metadata.tables["orders"] is orders
+        assert list(orders.columns.keys()) == ["id", "user_id", "note"]
+        assert not orders.foreign_keys
+        assert orders.comment == "all orders"
+        assert orders.info[VERSION_INFO_KEY] == "v2"
+
+    def test_table_that_lost_columns_is_replaced(self, engine, metadata):
+        old_orders = metadata.tables["orders"]
+        engine.results["tables"] = [
+            TablesRow("users", "MANAGED", "people", "v1"),
+            TablesRow("orders", "MANAGED", None, "v2"),
+        ]
+        engine.results["columns"]["orders"] = [
+            parse_column_info_from_tgetcolumnsresponse(COLUMNS_RESPONSE[2])
+        ]
+        engine.results["fk"] = {}
+
+        assert refresh_reflected_metadata(engine, metadata) == ["orders"]
+
+        orders = metadata.tables["orders"]
+        assert orders is not old_orders
+        assert list(orders.columns.keys()) == ["id"]
+        assert orders.info[VERSION_INFO_KEY] == "v2"
+
+    def test_dropped_table_is_removed(self, engine, metadata):
+        engine.results["tables"] = [TablesRow("users", "MANAGED", "people", "v1")]
+
+        assert refresh_reflected_metadata(engine, metadata) == ["orders"]
+        assert set(metadata.tables) == {"users"}
+
+    def test_first_refresh_records_versions(self, engine):
+        metadata = MetaData()
+        sqlalchemy.Table("users", metadata, sqlalchemy.Column("id", sqlalchemy.Integer))
+        engine.results["tables"] = [TablesRow("users", "MANAGED", None, "v1")]
+
+        assert refresh_reflected_metadata(engine, metadata) == []
+        assert metadata.tables["users"].info[VERSION_INFO_KEY] == "v1"
+
+    def test_mixed_case_table_is_kept(self, engine):
+        metadata = MetaData()
+        sqlalchemy.Table("Users", metadata, sqlalchemy.Column("id", sqlalchemy.Integer))
+        engine.results["tables"] = [TablesRow("users", "MANAGED", None, "v1")]
+
+        assert refresh_reflected_metadata(engine, metadata) == []
+        assert metadata.tables["Users"].info[VERSION_INFO_KEY] == "v1"
+
+    def test_needs_information_schema(self, engine, metadata):
+        engine.results["tables"] = None
+
+        with pytest.raises(NotImplementedError):
+            refresh_reflected_metadata(engine, metadata)
+        assert set(metadata.tables) == {"users", "orders"}
+
+
+class TestLazyReflection:
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        """A lazy_reflection engine that knows about one table, `orders`"""
+
+        def columns(self, connection, **kw):
+            return {
+                "orders": [
+                    parse_column_info_from_tgetcolumnsresponse(COLUMNS_RESPONSE[2]),
+                    parse_column_info_from_tgetcolumnsresponse(
+                        TGetColumnsRow("orders", "user_id", "BIGINT", 1, None, None)
+                    ),
+                ]
+            }
+
+        columns.__name__ = "columns"
+        monkeypatch.setattr(
+            DatabricksDialect, "_get_columns_by_table", reflection.cache(columns)
+        )
+        for name in (
+            "_get_pk_constraints_by_table",
+            "_get_foreign_keys_by_table",
+            "_get_information_schema_tables",
+        ):
+            monkeypatch.setattr(
+                DatabricksDialect, name, MagicMock(side_effect=AssertionError(name))
+            )
+        describe = MagicMock(
+            return_value=[
+                {"col_name": row.col_name, "data_type": row.data_type}
+                for row in DTE_RESPONSE
+            ]
+        )
+        monkeypatch.setattr(DatabricksDialect, "_describe_table_extended", describe)
+
+        engine = create_engine(
+            "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+            creator=MagicMock,
+            lazy_reflection=True,
+        )
+        engine.describe = describe
+        return engine
+
+    def test_autoload_reflects_only_columns(self, engine):
+        orders = sqlalchemy.Table("orders", MetaData(), autoload_with=engine)
+
+        assert [c.name for c in orders.columns] == ["id", "user_id"]
+        assert not orders.primary_key.columns
+        assert not orders.foreign_keys
+        assert orders.comment is None
+        assert "partition_by" not in orders.dialect_options["databricks"]
+        engine.describe.assert_not_called()
+
+    def test_load_deferred_reflection(self, engine):
+        metadata = MetaData()
+        users = sqlalchemy.Table(
+            "users", metadata, sqlalchemy.Column("id", sqlalchemy.BigInteger)
+        )
+        orders = sqlalchemy.Table("orders", metadata, autoload_with=engine)
+
+        assert load_deferred_reflection(orders, engine) is orders
+        load_deferred_reflection(orders, engine)
+
+        assert [c.name for c in orders.primary_key] == ["id"]
+        (fk,) = orders.foreign_keys
+        assert fk.column is users.c.id
+        assert orders.comment == "some comment"
+        assert orders.dialect_options["databricks"]["partition_by"] == ["user_id"]
+        # One DESCRIBE per call, shared by the primary key, foreign keys and comment
+        assert engine.describe.call_count == 2
+
+    def test_inspector_is_not_deferred(self, engine):
+        inspector = sqlalchemy.inspect(engine)
+        (pk,) = inspector.get_multi_pk_constraint(
+            filter_names=["orders"], kind=ObjectKind.ANY, scope=ObjectScope.ANY
+        ).values()
+
+        assert pk["constrained_columns"] == ["id"]
+        assert inspector.get_table_comment("orders")["text"] == "some comment"
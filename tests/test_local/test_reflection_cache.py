@@ -0,0 +1,181 @@
+"""Tests for the persistent reflection cache. These use a SQLite file in a temporary directory."""
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy
+
+from databricks.sqlalchemy import DatabricksArray, DatabricksDialect, TIMESTAMP, TINYINT
+from databricks.sqlalchemy._parse import parse_type_string
+from databricks.sqlalchemy._reflection_cache import (
+    ReflectionCache,
+    dumps_reflected,
+    loads_reflected,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReflectionCache(str(tmp_path / "cache.sqlite"), dialect=DatabricksDialect())
+
+
+class TestReflectionCache:
+    def test_round_trip(self, cache):
+        cache.set_many({"k": {"constrained_columns": ["id"]}}, {"k": "v1"})
+        assert cache.get_many({"k": "v1"}) == {"k": {"constrained_columns": ["id"]}}
+
+    def test_version_mismatch_is_a_miss(self, cache):
+        cache.set_many({"k": []}, {"k": "v1"})
+        assert cache.get_many({"k": "v2"}) == {}
+
+    def test_expired_entries_are_misses(self, cache, monkeypatch):
+        cache.set_many({"k": []}, {"k": "v1"})
+        monkeypatch.setattr(cache, "ttl", -1)
+        assert cache.get_many({"k": "v1"}) == {}
+
+    def test_eviction(self, tmp_path):
+        cache = ReflectionCache(
+            str(tmp_path / "cache.sqlite"), dialect=DatabricksDialect(), max_entries=2
+        )
+        for i in range(5):
+            cache.set_many({f"k{i}": i}, {f"k{i}": "v"})
+
+        versions = {f"k{i}": "v" for i in range(5)}
+        assert len(cache.get_many(versions)) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        ReflectionCache(path, dialect=DatabricksDialect()).set_many(
+            {"k": 1}, {"k": "v"}
+        )
+        assert ReflectionCache(path, dialect=DatabricksDialect()).get_many(
+            {"k": "v"}
+        ) == {"k": 1}
+
+
+@pytest.mark.parametrize(
+    "type_, expected",
+    [
+        (sqlalchemy.types.String, sqlalchemy.types.String),
+        (sqlalchemy.types.BigInteger, sqlalchemy.types.BigInteger),
+        (TINYINT, TINYINT),
+        (TIMESTAMP, TIMESTAMP),
+    ],
+)
+def test_types_round_trip(type_, expected):
+    dialect = DatabricksDialect()
+    column = {"name": "c", "type": type_, "nullable": True}
+
+    assert loads_reflected(dumps_reflected(column, dialect))["type"] is expected
+
+
+@pytest.mark.parametrize(
+    "type_name",
+    ["VARCHAR(10)", "CHAR(3)", "ARRAY<VARCHAR(5)>", "STRUCT<a:CHAR(2),b:STRING>"],
+)
+def test_string_length_round_trip(type_name):
+    dialect = DatabricksDialect()
+    column = {"name": "c", "type": parse_type_string(type_name)}
+
+    decoded = loads_reflected(dumps_reflected(column, dialect))["type"]
+    assert repr(decoded) == repr(column["type"])
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [
+        sqlalchemy.types.NullType,
+        sqlalchemy.types.NullType(),
+        DatabricksArray(sqlalchemy.types.NullType()),
+    ],
+)
+def test_null_type_round_trip(type_):
+    dialect = DatabricksDialect()
+    column = {"name": "c", "type": type_}
+
+    decoded = loads_reflected(dumps_reflected(column, dialect))["type"]
+    if isinstance(decoded, DatabricksArray):
+        assert isinstance(decoded.item_type, sqlalchemy.types.NullType)
+    else:
+        assert decoded is sqlalchemy.types.NullType
+
+
+def test_decimal_round_trip():
+    dialect = DatabricksDialect()
+    column = {"name": "c", "type": sqlalchemy.types.Numeric(18, 5)}
+
+    decoded = loads_reflected(dumps_reflected(column, dialect))["type"]
+    assert (decoded.precision, decoded.scale) == (18, 5)
+
+
+TablesRow = namedtuple(
+    "TablesRow", ["table_name", "table_type", "comment", "last_altered"]
+)
+DteRow = namedtuple("DteRow", ["col_name", "data_type"])
+
+
+class TestDialectReflectionCache:
+    @pytest.fixture
+    def dialect(self, tmp_path):
+        dialect = DatabricksDialect(reflection_cache_path=str(tmp_path / "c.sqlite"))
+        dialect.catalog = "main"
+        dialect.schema = "default"
+        return dialect
+
+    @pytest.fixture
+    def connection(self):
+        """A connection whose information_schema says `orders` was last altered at self.version"""
+        connection = MagicMock()
+        connection.version = "2024-01-01 00:00:00"
+
+        def execute(stmt, params=None):
+            result = MagicMock()
+            if "information_schema.tables" in str(stmt):
+                result.all.return_value = [
+                    TablesRow("orders", "MANAGED", None, connection.version)
+                ]
+            else:
+                result.all.return_value = [DteRow("orders_pk", "PRIMARY KEY (`id`)")]
+            return result
+
+        connection.execute.side_effect = execute
+        return connection
+
+    def count_describes(self, connection):
+        return sum(
+            "DESCRIBE" in str(c.args[0]) for c in connection.execute.call_args_list
+        )
+
+    def test_served_across_inspections(self, dialect, connection):
+        first = dialect.get_pk_constraint(connection, "orders", info_cache={})
+        second = dialect.get_pk_constraint(connection, "orders", info_cache={})
+
+        assert first == second == {"constrained_columns": ["id"], "name": "orders_pk"}
+        assert self.count_describes(connection) == 1
+
+    def test_refetched_when_table_changes(self, dialect, connection):
+        dialect.get_pk_constraint(connection, "orders", info_cache={})
+        connection.version = "2024-01-02 00:00:00"
+        dialect.get_pk_constraint(connection, "orders", info_cache={})
+
+        assert self.count_describes(connection) == 2
+
+    def test_multi_and_single_share_entries(self, dialect, connection):
+        dialect.get_table_names = MagicMock(return_value=["orders"])
+        dialect._get_pk_constraints_by_table = MagicMock(
+            return_value={"orders": {"constrained_columns": ["id"], "name": "pk"}}
+        )
+
+        dict(dialect.get_multi_pk_constraint(connection, info_cache={}))
+        result = dialect.get_pk_constraint(connection, "orders", info_cache={})
+
+        assert result == {"constrained_columns": ["id"], "name": "pk"}
+        assert self.count_describes(connection) == 0
+
+    def test_disabled_by_default(self, connection):
+        dialect = DatabricksDialect()
+        dialect.catalog, dialect.schema = "main", "default"
+        dialect.get_pk_constraint(connection, "orders", info_cache={})
+        dialect.get_pk_constraint(connection, "orders", info_cache={})
+
+        assert self.count_describes(connection) == 2
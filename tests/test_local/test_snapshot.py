@@ -0,0 +1,167 @@
+"""Tests for reflection snapshots. These fake the dialect's batched reflection queries."""
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy
+from sqlalchemy import create_engine
+from sqlalchemy.engine import reflection
+
+from databricks.sqlalchemy import (
+    DatabricksDialect,
+    check_reflection_snapshot,
+    dump_reflection_snapshot,
+    load_reflection_snapshot,
+)
+
+TablesRow = namedtuple(
+    "TablesRow", ["table_name", "table_type", "comment", "last_altered"]
+)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """An engine whose schema holds users, orders (with a foreign key to users) and a view"""
+
+    tables = [
+        TablesRow("orders", "MANAGED", None, "2024-01-01 00:00:00"),
+        TablesRow("users", "MANAGED", "people", "2024-01-01 00:00:00"),
+        TablesRow("users_v", "VIEW", None, "2024-01-01 00:00:00"),
+    ]
+    results = {
+        "tables": tables,
+        "columns": {
+            "users": [
+                {"name": "id", "type": sqlalchemy.BigInteger(), "nullable": False},
+                {
+                    "name": "balance",
+                    "type": sqlalchemy.Numeric(18, 5),
+                    "nullable": True,
+                    "default": None,
+                    "comment": "in cents",
+                },
+            ],
+            "orders": [
+                {"name": "id", "type": sqlalchemy.Integer(), "nullable": False},
+                {"name": "user_id", "type": sqlalchemy.BigInteger(), "nullable": True},
+            ],
+        },
+        "pk": {"users": {"constrained_columns": ["id"], "name": "users_pk"}},
+        "fk": {
+            "orders": [
+                {
+                    "name": "orders_fk",
+                    "constrained_columns": ["user_id"],
+                    "referred_table": "users",
+                    "referred_columns": ["id"],
+                    "referred_schema": None,
+                }
+            ]
+        },
+    }
+
+    def fake(name):
+        def lookup(self, connection, **kw):
+            return results[name]
+
+        lookup.__name__ = name
+        return reflection.cache(lookup)
+
+    for attr, name in [
+        ("_get_information_schema_tables", "tables"),
+        ("_get_columns_by_table", "columns"),
+        ("_get_pk_constraints_by_table", "pk"),
+        ("_get_foreign_keys_by_table", "fk"),
+    ]:
+        monkeypatch.setattr(DatabricksDialect, attr, fake(name))
+
+    engine = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=main&schema=default",
+        creator=MagicMock,
+    )
+    engine.tables = tables
+    return engine
+
+
+@pytest.mark.parametrize("filename", ["snapshot.json", "snapshot.json.gz"])
+def test_round_trip(engine, tmp_path, filename):
+    path = str(tmp_path / filename)
+    dump_reflection_snapshot(engine, path)
+
+    metadata = load_reflection_snapshot(path)
+
+    assert set(metadata.tables) == {"users", "orders"}
+    users, orders = metadata.tables["users"], metadata.tables["orders"]
+    assert users.comment == "people"
+    assert users.info["databricks_last_altered"] == "2024-01-01 00:00:00"
+    assert [c.name for c in users.primary_key] == ["id"]
+    assert isinstance(users.c.balance.type, sqlalchemy.Numeric)
+    assert (users.c.balance.type.precision, users.c.balance.type.scale) == (18, 5)
+    assert users.c.balance.comment == "in cents"
+    assert not users.c.id.nullable
+    (fk,) = orders.foreign_keys
+    assert fk.column is users.c.id
+
+
+def test_load_does_not_connect(engine, tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshot.json")
+    dump_reflection_snapshot(engine, path)
+    monkeypatch.setattr(DatabricksDialect, "connect", MagicMock(side_effect=Exception))
+
+    assert set(load_reflection_snapshot(path).tables) == {"users", "orders"}
+
+
+def test_views(engine, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    dump_reflection_snapshot(engine, path, views=True)
+
+    assert "users_v" in load_reflection_snapshot(path).tables
+
+
+def test_format_version_is_checked(engine, tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"format": 0}')
+
+    with pytest.raises(ValueError, match="version 0 reflection snapshot"):
+        load_reflection_snapshot(str(path))
+
+
+def test_check(engine, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    dump_reflection_snapshot(engine, path)
+
+    assert check_reflection_snapshot(engine, path) == []
+
+    engine.tables[0] = TablesRow("orders", "MANAGED", None, "2024-02-01 00:00:00")
+    engine.tables.append(TablesRow("refunds", "MANAGED", None, "2024-02-01 00:00:00"))
+    del engine.tables[1]
+
+    assert check_reflection_snapshot(engine, path) == ["orders", "refunds", "users"]
+
+
+def test_check_compares_catalog(engine, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    dump_reflection_snapshot(engine, path)
+    other = create_engine(
+        "databricks://token:****@****?http_path=****&catalog=staging&schema=default",
+        creator=MagicMock,
+    )
+
+    with pytest.raises(ValueError, match="snapshot of catalog main"):
+        check_reflection_snapshot(other, path)
+
+
+def test_table_options(engine, tmp_path, monkeypatch):
+    def get_table_options(self, connection, table_name, schema=None, **kw):
+        return {"databricks_partition_by": ["id"]} if table_name == "users" else {}
+
+    monkeypatch.setattr(DatabricksDialect, "get_table_options", get_table_options)
+    engine.dialect.reflect_table_options = True
+    path = str(tmp_path / "snapshot.json")
+    dump_reflection_snapshot(engine, path)
+
+    metadata = load_reflection_snapshot(path)
+    assert metadata.tables["users"].dialect_options["databricks"]["partition_by"] == [
+        "id"
+    ]
+    assert "partition_by" not in metadata.tables["orders"].dialect_options["databricks"]
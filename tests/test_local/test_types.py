@@ -4,7 +4,15 @@ import pytest
 import sqlalchemy
 
 from databricks.sqlalchemy.base import DatabricksDialect
-from databricks.sqlalchemy._types import TINYINT, TIMESTAMP, TIMESTAMP_NTZ, DatabricksVariant
+from databricks.sqlalchemy._types import (
+    TINYINT,
+    TIMESTAMP,
+    TIMESTAMP_NTZ,
+    DatabricksArray,
+    DatabricksMap,
+    DatabricksStruct,
+    DatabricksVariant,
+)
 
 
 class DatabricksDataType(enum.Enum):
@@ -161,3 +169,27 @@ class TestUppercaseTypesCompilation(CompilationTestBase):
         self._assert_compiled_value_explicit(
             sqlalchemy.types.ARRAY(sqlalchemy.types.String), "ARRAY<STRING>"
         )
+
+
+class TestComplexTypeBinds:
+    """ARRAY, MAP and STRUCT columns, as reflected, bind Python lists and dictionaries"""
+
+    dialect = DatabricksDialect()
+
+    @pytest.mark.parametrize(
+        "type_, value",
+        [
+            (DatabricksArray(sqlalchemy.Integer), [1, None]),
+            (DatabricksMap(sqlalchemy.String, sqlalchemy.Integer), {"a": 1}),
+            (DatabricksStruct([("a", sqlalchemy.Integer)]), {"a": 1}),
+            (
+                DatabricksArray(DatabricksMap(sqlalchemy.String, sqlalchemy.Integer)),
+                [None],
+            ),
+        ],
+    )
+    def test_null_and_value(self, type_, value):
+        process = type_.bind_processor(self.dialect)
+
+        assert process(None) is None
+        assert process(value) == value